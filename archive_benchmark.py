@@ -0,0 +1,62 @@
+import random
+import time
+
+from jmetal.component.archive import NonDominatedSolutionListArchive, NonDominatedSolutionTreeArchive
+from jmetal.core.solution import FloatSolution
+
+number_of_objectives = 3
+number_of_insertions = 200
+archive_sizes = [100, 1000, 10000]
+
+
+def create_solution(objectives):
+    solution = FloatSolution(1, len(objectives), 0, [0.0], [1.0])
+    solution.objectives = objectives
+    return solution
+
+
+def create_front(size):
+    """ Points of the simplex x_1 + ... + x_m = 1 are mutually non-dominated. """
+    front = []
+    for _ in range(size):
+        values = [random.random() for _ in range(number_of_objectives)]
+        total = sum(values)
+        front.append(create_solution([value / total for value in values]))
+    return front
+
+
+def create_insertions():
+    """ Points scattered around the simplex: some dominate part of the front, others are dominated. """
+    insertions = []
+    for _ in range(number_of_insertions):
+        values = [random.random() for _ in range(number_of_objectives)]
+        total = sum(values) / random.uniform(0.97, 1.03)
+        insertions.append(create_solution([value / total for value in values]))
+    return insertions
+
+
+for size in archive_sizes:
+    random.seed(1)
+    front = create_front(size)
+    insertions = create_insertions()
+
+    list_archive = NonDominatedSolutionListArchive()
+    list_archive.solution_list.extend(front)
+
+    start = time.time()
+    tree_archive = NonDominatedSolutionTreeArchive()
+    for solution in front:
+        tree_archive.add(solution)
+    build_time = time.time() - start
+
+    start = time.time()
+    list_results = [list_archive.add(solution) for solution in insertions]
+    list_time = time.time() - start
+
+    start = time.time()
+    tree_results = [tree_archive.add(solution) for solution in insertions]
+    tree_time = time.time() - start
+
+    assert list_results == tree_results
+    print("{} entries: list archive {:.4f}s, ND-Tree archive {:.4f}s ({:.1f}x), ND-Tree built in {:.4f}s".format(
+        size, list_time, tree_time, list_time / tree_time, build_time))
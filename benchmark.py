@@ -40,8 +40,8 @@ for i,problem in enumerate(problems):
     moqpso.run()
     print("MOQPSO hv {}".format(hv_comp.compute(moqpso.get_result())))
     print("MOQPSO ITERATIONS {}".format(moqpso.evaluations))
-    sm_hv.append(smpso.current_hv)
-    q_hv.append(moqpso.current_hv)
+    sm_hv.append(smpso.hypervolume_tracker.value)
+    q_hv.append(moqpso.hypervolume_tracker.value)
     nsga = NSGAII(
             problem=problem,
             population_size=100,
@@ -5,6 +5,7 @@ import random
 
 import numpy as np
 
+from jmetal.algorithm.multiobjective.smpso import select_global_best_positions
 from jmetal.component.archive import BoundedArchive
 from jmetal.component.evaluator import Evaluator, SequentialEvaluator
 from jmetal.core.algorithm import ParticleSwarmOptimization
@@ -12,7 +13,7 @@ from jmetal.core.operator import Mutation
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
 from jmetal.component.comparator import DominanceComparator
-from jmetal.component.quality_indicator import HyperVolume
+from jmetal.component.quality_indicator import HyperVolumeTracker
 
 R = TypeVar('R')
 
@@ -27,7 +28,9 @@ class MOQPSO(ParticleSwarmOptimization):
                  mutation: Mutation[FloatSolution],
                  leaders: BoundedArchive[FloatSolution],
                  evaluator: Evaluator[FloatSolution] = SequentialEvaluator[FloatSolution](),
-                 reference_point = None):
+                 reference_point = None,
+                 vectorized: bool = False,
+                 hypervolume_tracker: HyperVolumeTracker = None):
         """ This class implements the Multi-Objective variant of Quantum Behaved PSO algorithm  as described in
         :param problem: The problem to solve.
         :param swarm_size: Swarm size.
@@ -35,6 +38,10 @@ class MOQPSO(ParticleSwarmOptimization):
         :param mutation: Mutation operator.
         :param leaders: Archive for leaders.
         :param evaluator: An evaluator object to evaluate the solutions in the population.
+        :param vectorized: If True, the quantum-behaved position update is computed over the whole swarm as
+            (swarm_size, number_of_variables) matrices instead of particle by particle.
+        :param hypervolume_tracker: Tracker of the hypervolume of the leaders used by the stopping condition. Default
+            to a tracker measuring the leaders every iteration against `reference_point`.
         """
         super(MOQPSO, self).__init__()
         self.problem = problem
@@ -43,8 +50,9 @@ class MOQPSO(ParticleSwarmOptimization):
         self.mutation = mutation
         self.leaders = leaders
         self.evaluator = evaluator
+        self.vectorized = vectorized
 
-        self.hypervolume_calculator = HyperVolume(reference_point)
+        self.hypervolume_tracker = hypervolume_tracker if hypervolume_tracker else HyperVolumeTracker(reference_point)
 
         self.evaluations = 0
 
@@ -53,18 +61,18 @@ class MOQPSO(ParticleSwarmOptimization):
         self.dominance_comparator = DominanceComparator()
         self.constrictors = [(problem.upper_bound[i] - problem.lower_bound[i]) / 5000.0 for i in range(problem.number_of_variables)]
 
-        self.prev_hypervolume = 0
-        self.current_hv = 0
-
-        self.hv_changes = []
+        self.lower_bound = np.asarray(problem.lower_bound, dtype=float)
+        self.upper_bound = np.asarray(problem.upper_bound, dtype=float)
 
     def init_progress(self) -> None:
         self.evaluations = 0
         self.leaders.compute_density_estimator()
+        self.hypervolume_tracker.update(self.leaders.solution_list)
 
     def update_progress(self) -> None:
         self.evaluations += 1
         self.leaders.compute_density_estimator()
+        self.hypervolume_tracker.update(self.leaders.solution_list)
 
         observable_data = {'evaluations': self.evaluations,
                            'computing time': self.get_current_computing_time(),
@@ -76,8 +84,8 @@ class MOQPSO(ParticleSwarmOptimization):
     def is_stopping_condition_reached(self) -> bool:
         completion = self.evaluations / float(self.max_evaluations)
         condition1 = self.evaluations >= self.max_evaluations
-        condition2 = completion > 0.01 and (self.current_hv - self.prev_hypervolume) < 10e-10
-        self.prev_hypervolume = self.current_hv
+        condition2 = completion > 0.01 and self.hypervolume_tracker.measured and \
+            self.hypervolume_tracker.get_improvement() < 10e-10 + self.hypervolume_tracker.get_improvement_margin()
         return condition1 or condition2
 
 
@@ -92,8 +100,7 @@ class MOQPSO(ParticleSwarmOptimization):
         return self.evaluator.evaluate(swarm, self.problem)
 
     def initialize_global_best(self, swarm: List[FloatSolution]) -> None:
-        for particle in swarm:
-            self.leaders.add(particle)
+        self.leaders.add_all([copy(particle) for particle in swarm])
 
     def initialize_particle_best(self, swarm: List[FloatSolution]) -> None:
         for particle in swarm:
@@ -106,10 +113,10 @@ class MOQPSO(ParticleSwarmOptimization):
         pass
 
     def update_position(self, swarm: List[FloatSolution]) -> None:
-        best_global = self.select_global_best()
-        self.current_hv = self.hypervolume_calculator.compute(self.leaders.solution_list)
-        self.hv_changes.append(self.current_hv)
-        # print("Iteration : {} HV: {}".format(self.evaluations, self.current_hv))
+        if self.vectorized:
+            self.__update_position_matrix(swarm)
+            return
+
         for i in range(self.swarm_size):
             particle = swarm[i]
             best_particle = copy(swarm[i].attributes['local_best'])
@@ -128,6 +135,31 @@ class MOQPSO(ParticleSwarmOptimization):
                 particle.variables[j] = max(self.problem.lower_bound[j],particle.variables[j])
                 particle.variables[j] = min(self.problem.upper_bound[j], particle.variables[j])
 
+    def __update_position_matrix(self, swarm: List[FloatSolution]) -> None:
+        """ Array-backed version of the quantum-behaved update. Positions, personal bests and the selected global
+        bests are gathered as (swarm_size, number_of_variables) matrices and the attractor, the jump length, the
+        bound clamping and the scaling by the constrictors are applied to the whole swarm at once.
+        """
+        shape = (self.swarm_size, self.problem.number_of_variables)
+
+        positions = np.asarray([particle.variables for particle in swarm], dtype=float)
+        local_bests = np.asarray([particle.attributes['local_best'].variables for particle in swarm], dtype=float)
+        global_bests = self.select_global_best_positions(self.swarm_size)
+
+        psi_1 = np.maximum(10e-8, np.random.uniform(0, 1, shape))
+        psi_2 = np.maximum(10e-8, np.random.uniform(0, 1, shape))
+        u = np.maximum(10e-8, np.random.uniform(0, 1, shape))
+        sign = np.where(np.maximum(10e-8, np.random.uniform(0, 1, shape)) > 0.5, -1.0, 1.0)
+
+        attractors = (psi_1 * local_bests + psi_2 * global_bests) / (psi_1 + psi_2)
+        lengths = 1 / self.g * np.abs(positions - attractors)
+
+        positions = attractors + sign * np.asarray(self.constrictors) * lengths * np.log(1 / u)
+        positions = np.clip(positions, self.lower_bound, self.upper_bound)
+
+        for particle, position in zip(swarm, positions):
+            particle.variables = position.tolist()
+
     def perturbation(self, swarm: List[FloatSolution]) -> None:
         for i in range(self.swarm_size):
             if (i % 6) == 0:
@@ -135,8 +167,7 @@ class MOQPSO(ParticleSwarmOptimization):
         
 
     def update_global_best(self, swarm: List[FloatSolution]) -> None:
-        for particle in swarm:
-            self.leaders.add(copy(particle))
+        self.leaders.add_all([copy(particle) for particle in swarm])
 
     def update_particle_best(self, swarm: List[FloatSolution]) -> None:
         for i in range(self.swarm_size):
@@ -163,6 +194,9 @@ class MOQPSO(ParticleSwarmOptimization):
             best_global = copy(self.leaders.solution_list[0])
 
         return best_global
-    
+
+    def select_global_best_positions(self, size: int) -> np.ndarray:
+        return select_global_best_positions([self.leaders], size)
+
     def get_hypvervolume_history(self):
-        return self.hv_changes
\ No newline at end of file
+        return self.hypervolume_tracker.get_history()
\ No newline at end of file
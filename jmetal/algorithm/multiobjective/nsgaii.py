@@ -2,6 +2,7 @@ from typing import TypeVar, List
 
 from jmetal.algorithm.singleobjective.evolutionaryalgorithm import GenerationalGeneticAlgorithm
 from jmetal.component.evaluator import SequentialEvaluator, Evaluator
+from jmetal.component.ranking import Ranking, FastNonDominatedRanking
 from jmetal.core.operator import Mutation, Crossover, Selection
 from jmetal.core.problem import Problem
 from jmetal.operator.selection import RankingAndCrowdingDistanceSelection
@@ -27,7 +28,8 @@ class NSGAII(GenerationalGeneticAlgorithm[S, R]):
                  mutation: Mutation[S],
                  crossover: Crossover[S, S],
                  selection: Selection[List[S], S],
-                 evaluator: Evaluator[S] = SequentialEvaluator[S]()):
+                 evaluator: Evaluator[S] = SequentialEvaluator[S](),
+                 ranking: Ranking = None):
         """  NSGA-II implementation as described in
 
         * K. Deb, A. Pratap, S. Agarwal and T. Meyarivan, "A fast and elitist
@@ -45,6 +47,10 @@ class NSGAII(GenerationalGeneticAlgorithm[S, R]):
         :param crossover: Crossover operator (see :py:mod:`jmetal.operator.crossover`).
         :param selection: Selection operator (see :py:mod:`jmetal.operator.selection`).
         :param evaluator: An evaluator object to evaluate the individuals of the population.
+        :param ranking: Non-dominated ranking of the replacement (see :py:mod:`jmetal.component.ranking`). Default to
+          :class:`FastNonDominatedRanking`; faster rankings, such as :class:`DimensionSweepRanking` for two or three
+          objectives, can be given instead, but the order of the solutions within their fronts, and thus the ties of
+          the crowding distance selection, may differ.
         """
         super(NSGAII, self).__init__(
             problem,
@@ -54,6 +60,7 @@ class NSGAII(GenerationalGeneticAlgorithm[S, R]):
             crossover,
             selection,
             evaluator)
+        self.ranking = ranking if ranking is not None else FastNonDominatedRanking()
 
     def replacement(self, population: List[S], offspring_population: List[S]) -> List[List[S]]:
         """ This method joins the current and offspring populations to produce the population of the next generation
@@ -64,7 +71,7 @@ class NSGAII(GenerationalGeneticAlgorithm[S, R]):
         :return: New population after ranking and crowding distance selection is applied.
         """
         join_population = population + offspring_population
-        return RankingAndCrowdingDistanceSelection(self.population_size).execute(join_population)
+        return RankingAndCrowdingDistanceSelection(self.population_size, self.ranking).execute(join_population)
 
     def get_result(self) -> R:
         return self.population
@@ -12,7 +12,7 @@ from jmetal.core.operator import Mutation
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
 from jmetal.component.comparator import DominanceComparator
-from jmetal.component.quality_indicator import HyperVolume
+from jmetal.component.quality_indicator import HyperVolumeTracker
 
 
 R = TypeVar('R')
@@ -26,6 +26,34 @@ R = TypeVar('R')
 """
 
 
+def select_global_best_positions(leaders: List[BoundedArchive[FloatSolution]], size: int) -> numpy.ndarray:
+    """ Runs `size` binary tournaments among the leaders, as :func:`SMPSO.select_global_best` does, and returns the
+    variables of the winners as a (size, number_of_variables) matrix without copying any solution. When several
+    archives are given, each tournament is held in one of the non-empty archives chosen at random, as
+    :func:`SMPSORP.select_global_best` does.
+    """
+    archives = [archive for archive in leaders if len(archive.solution_list) != 0]
+    chosen = numpy.random.randint(0, len(archives), size) if len(archives) > 1 else numpy.zeros(size, dtype=int)
+
+    positions = numpy.empty((size, archives[0].solution_list[0].number_of_variables), dtype=float)
+    for index, archive in enumerate(archives):
+        rows = numpy.flatnonzero(chosen == index)
+        solutions = archive.solution_list
+        variables = numpy.asarray([solution.variables for solution in solutions], dtype=float)
+
+        if len(solutions) > 2:
+            first = numpy.random.randint(0, len(solutions), len(rows))
+            second = (first + numpy.random.randint(1, len(solutions), len(rows))) % len(solutions)
+            winners = [i if archive.comparator.compare(solutions[i], solutions[j]) < 1 else j
+                       for i, j in zip(first, second)]
+        else:
+            winners = [0] * len(rows)
+
+        positions[rows] = variables[winners]
+
+    return positions
+
+
 class SMPSO(ParticleSwarmOptimization):
 
     def __init__(self,
@@ -35,7 +63,9 @@ class SMPSO(ParticleSwarmOptimization):
                  mutation: Mutation[FloatSolution],
                  leaders: BoundedArchive[FloatSolution],
                  evaluator: Evaluator[FloatSolution] = SequentialEvaluator[FloatSolution](),
-                 reference_point = None):
+                 reference_point = None,
+                 vectorized: bool = False,
+                 hypervolume_tracker: HyperVolumeTracker = None):
         """ This class implements the SMPSO algorithm as described in
 
         * SMPSO: A new PSO-based metaheuristic for multi-objective optimization
@@ -50,6 +80,10 @@ class SMPSO(ParticleSwarmOptimization):
         :param mutation: Mutation operator.
         :param leaders: Archive for leaders.
         :param evaluator: An evaluator object to evaluate the solutions in the population.
+        :param vectorized: If True, velocities and positions are updated over the whole swarm as
+            (swarm_size, number_of_variables) matrices instead of particle by particle.
+        :param hypervolume_tracker: Tracker of the hypervolume of the leaders used by the stopping condition. Default
+            to a tracker measuring the leaders every iteration against `reference_point`.
         """
         super(SMPSO, self).__init__()
         self.problem = problem
@@ -58,8 +92,9 @@ class SMPSO(ParticleSwarmOptimization):
         self.mutation = mutation
         self.leaders = leaders
         self.evaluator = evaluator
+        self.vectorized = vectorized
 
-        self.hypervolume_calculator = HyperVolume(reference_point)
+        self.hypervolume_tracker = hypervolume_tracker if hypervolume_tracker else HyperVolumeTracker(reference_point)
         self.evaluations = 0
 
         self.c1_min = 0.1
@@ -86,19 +121,18 @@ class SMPSO(ParticleSwarmOptimization):
 
         self.delta_min = -1.0 * self.delta_max
 
-        self.hv_history = []
-
-        self.current_hv = 0
-
-        self.prev_hypervolume = 0
+        self.lower_bound = numpy.asarray(problem.lower_bound, dtype=float)
+        self.upper_bound = numpy.asarray(problem.upper_bound, dtype=float)
 
     def init_progress(self) -> None:
         self.evaluations = 0
         self.leaders.compute_density_estimator()
+        self.hypervolume_tracker.update(self.leaders.solution_list)
 
     def update_progress(self) -> None:
         self.evaluations += 1
         self.leaders.compute_density_estimator()
+        self.hypervolume_tracker.update(self.leaders.solution_list)
 
         observable_data = {'evaluations': self.evaluations,
                            'computing time': self.get_current_computing_time(),
@@ -110,8 +144,8 @@ class SMPSO(ParticleSwarmOptimization):
     def is_stopping_condition_reached(self) -> bool:
         completion = self.evaluations / float(self.max_evaluations)
         condition1 = self.evaluations >= self.max_evaluations
-        condition2 = completion > 0.05 and (self.current_hv - self.prev_hypervolume) < 10e-10
-        self.prev_hypervolume = self.current_hv
+        condition2 = completion > 0.05 and self.hypervolume_tracker.measured and \
+            self.hypervolume_tracker.get_improvement() < 10e-10 + self.hypervolume_tracker.get_improvement_margin()
         return condition1 or condition2
 
     def create_initial_swarm(self) -> List[FloatSolution]:
@@ -124,8 +158,7 @@ class SMPSO(ParticleSwarmOptimization):
         return self.evaluator.evaluate(swarm, self.problem)
 
     def initialize_global_best(self, swarm: List[FloatSolution]) -> None:
-        for particle in swarm:
-            self.leaders.add(particle)
+        self.leaders.add_all([copy(particle) for particle in swarm])
 
     def initialize_particle_best(self, swarm: List[FloatSolution]) -> None:
         for particle in swarm:
@@ -135,6 +168,10 @@ class SMPSO(ParticleSwarmOptimization):
         pass  # Velocity initialized in the constructor
 
     def update_velocity(self, swarm: List[FloatSolution]) -> None:
+        if self.vectorized:
+            self.__update_velocity_matrix(swarm)
+            return
+
         for i in range(self.swarm_size):
             best_particle = copy(swarm[i].attributes['local_best'])
             best_global = self.select_global_best()
@@ -157,9 +194,10 @@ class SMPSO(ParticleSwarmOptimization):
                         self.delta_max, self.delta_min, var)
 
     def update_position(self, swarm: List[FloatSolution]) -> None:
-        self.current_hv = self.hypervolume_calculator.compute(self.leaders.solution_list)
-        self.hv_history.append(self.current_hv)
-        print("Iteration : {} HV: {}".format(self.evaluations, self.current_hv))
+        if self.vectorized:
+            self.__update_position_matrix(swarm)
+            return
+
         for i in range(self.swarm_size):
             particle = swarm[i]
 
@@ -174,14 +212,50 @@ class SMPSO(ParticleSwarmOptimization):
                     particle.variables[j] = self.problem.upper_bound[j]
                     self.speed[i][j] *= self.change_velocity2
 
+    def __update_velocity_matrix(self, swarm: List[FloatSolution]) -> None:
+        """ Array-backed version of :func:`update_velocity`: r1, r2, c1 and c2 are drawn once per particle and the
+        constriction coefficient and the velocity clamping are applied to the whole speed matrix.
+        """
+        positions = numpy.asarray([particle.variables for particle in swarm], dtype=float)
+        local_bests = numpy.asarray([particle.attributes['local_best'].variables for particle in swarm], dtype=float)
+        global_bests = self.select_global_best_positions(self.swarm_size)
+
+        r1 = numpy.round(numpy.random.uniform(self.r1_min, self.r1_max, (self.swarm_size, 1)), 1)
+        r2 = numpy.round(numpy.random.uniform(self.r2_min, self.r2_max, (self.swarm_size, 1)), 1)
+        c1 = numpy.round(numpy.random.uniform(self.c1_min, self.c1_max, (self.swarm_size, 1)), 1)
+        c2 = numpy.round(numpy.random.uniform(self.c2_min, self.c2_max, (self.swarm_size, 1)), 1)
+        weight = self.__inertia_weight(self.evaluations, self.max_evaluations, self.max_weight, self.min_weight)
+
+        self.speed = self.__constriction_coefficient_matrix(c1, c2) * \
+            ((weight * self.speed)
+             + (c1 * r1 * (local_bests - positions))
+             + (c2 * r2 * (global_bests - positions)))
+        self.speed = numpy.clip(self.speed, self.delta_min, self.delta_max)
+
+    def __update_position_matrix(self, swarm: List[FloatSolution]) -> None:
+        """ Array-backed version of :func:`update_position`: particles leaving the bounds are placed on them and
+        their speed is reflected by `change_velocity1` / `change_velocity2`.
+        """
+        positions = numpy.asarray([particle.variables for particle in swarm], dtype=float) + self.speed
+
+        below = positions < self.lower_bound
+        positions = numpy.where(below, self.lower_bound, positions)
+        self.speed[below] *= self.change_velocity1
+
+        above = positions > self.upper_bound
+        positions = numpy.where(above, self.upper_bound, positions)
+        self.speed[above] *= self.change_velocity2
+
+        for particle, position in zip(swarm, positions):
+            particle.variables = position.tolist()
+
     def perturbation(self, swarm: List[FloatSolution]) -> None:
         for i in range(self.swarm_size):
             if (i % 6) == 0:
                 self.mutation.execute(swarm[i])
 
     def update_global_best(self, swarm: List[FloatSolution]) -> None:
-        for particle in swarm:
-            self.leaders.add(copy(particle))
+        self.leaders.add_all([copy(particle) for particle in swarm])
 
     def update_particle_best(self, swarm: List[FloatSolution]) -> None:
         for i in range(self.swarm_size):
@@ -209,6 +283,9 @@ class SMPSO(ParticleSwarmOptimization):
 
         return best_global
 
+    def select_global_best_positions(self, size: int) -> numpy.ndarray:
+        return select_global_best_positions([self.leaders], size)
+
     def __velocity_constriction(self, value: float, delta_max: [], delta_min: [], variable_index: int) -> float:
         result = value
         if value > delta_max[variable_index]:
@@ -230,9 +307,18 @@ class SMPSO(ParticleSwarmOptimization):
             result = 2.0 / (2.0 - rho - sqrt(pow(rho, 2.0) - 4.0 * rho))
 
         return result
+
+    def __constriction_coefficient_matrix(self, c1: numpy.ndarray, c2: numpy.ndarray) -> numpy.ndarray:
+        rho = c1 + c2
+        result = numpy.ones_like(rho)
+
+        mask = rho > 4
+        result[mask] = 2.0 / (2.0 - rho[mask] - numpy.sqrt(numpy.power(rho[mask], 2.0) - 4.0 * rho[mask]))
+
+        return result
     
     def get_hypervolume_history(self):
-        return self.hv_history
+        return self.hypervolume_tracker.get_history()
 
 class SMPSORP(SMPSO):
 
@@ -243,7 +329,8 @@ class SMPSORP(SMPSO):
                  mutation: Mutation[FloatSolution],
                  reference_points: List[List[float]],
                  leaders: List[BoundedArchive[FloatSolution]],
-                 evaluator: Evaluator[FloatSolution] = SequentialEvaluator[FloatSolution]()):
+                 evaluator: Evaluator[FloatSolution] = SequentialEvaluator[FloatSolution](),
+                 vectorized: bool = False):
         """ This class implements the SMPSORP algorithm.
 
         :param problem: The problem to solve.
@@ -252,6 +339,7 @@ class SMPSORP(SMPSO):
         :param mutation:
         :param leaders: List of bounded archives.
         :param evaluator: An evaluator object to evaluate the solutions in the population.
+        :param vectorized: If True, velocities and positions are updated over the whole swarm at once.
         """
         super(SMPSORP, self).__init__(
             problem=problem,
@@ -259,7 +347,8 @@ class SMPSORP(SMPSO):
             max_evaluations=max_evaluations,
             mutation=mutation,
             leaders=None,
-            evaluator=evaluator)
+            evaluator=evaluator,
+            vectorized=vectorized)
         self.reference_points = reference_points
         self.leaders = leaders
 
@@ -288,15 +377,17 @@ class SMPSORP(SMPSO):
 
         self.observable.notify_all(**observable_data)
 
+    def is_stopping_condition_reached(self) -> bool:
+        # there is no single front whose hypervolume could be tracked
+        return self.evaluations >= self.max_evaluations
+
     def initialize_global_best(self, swarm: List[FloatSolution]) -> None:
-        for particle in swarm:
-            for leader in self.leaders:
-                leader.add(copy(particle))
+        for leader in self.leaders:
+            leader.add_all([copy(particle) for particle in swarm])
 
     def update_global_best(self, swarm: List[FloatSolution]) -> None:
-        for particle in swarm:
-            for leader in self.leaders:
-                leader.add(copy(particle))
+        for leader in self.leaders:
+            leader.add_all([copy(particle) for particle in swarm])
 
     def get_result(self) -> List[FloatSolution]:
         result = []
@@ -329,3 +420,6 @@ class SMPSORP(SMPSO):
             best_global = copy(self.leaders[selected_swarm_index].solution_list[0])
 
         return best_global
+
+    def select_global_best_positions(self, size: int) -> numpy.ndarray:
+        return select_global_best_positions(self.leaders, size)
@@ -0,0 +1,59 @@
+import random
+import unittest
+from copy import copy
+from unittest import mock
+
+import numpy
+
+from jmetal.algorithm.multiobjective.moqpso import MOQPSO
+from jmetal.component.archive import CrowdingDistanceArchive
+from jmetal.operator.mutation import Polynomial
+from jmetal.problem.multiobjective.zdt import ZDT1
+
+
+class MOQPSOTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = ZDT1()
+
+    def __create_algorithm(self, vectorized: bool) -> MOQPSO:
+        random.seed(1)
+        numpy.random.seed(1)
+
+        algorithm = MOQPSO(problem=self.problem, swarm_size=20, max_evaluations=10,
+                           mutation=Polynomial(1.0 / self.problem.number_of_variables),
+                           leaders=CrowdingDistanceArchive(100), reference_point=[11, 11], vectorized=vectorized)
+        algorithm.constrictors = [1.0] * self.problem.number_of_variables
+
+        algorithm.swarm = algorithm.evaluate_swarm(algorithm.create_initial_swarm())
+        algorithm.initialize_particle_best(algorithm.swarm)
+        algorithm.leaders.add(copy(algorithm.swarm[0]))
+        for particle in algorithm.swarm:
+            particle.variables = numpy.random.uniform(0, 1, self.problem.number_of_variables).tolist()
+
+        return algorithm
+
+    def __scalar_draws(self, algorithm: MOQPSO, seed: int) -> list:
+        generator = numpy.random.RandomState(seed)
+        shape = (algorithm.swarm_size, self.problem.number_of_variables)
+        draws = [numpy.maximum(10e-8, generator.uniform(0, 1, shape)) for _ in range(4)]
+
+        return [value for row in numpy.stack(draws, axis=-1) for column in row for value in column]
+
+    def test_should_vectorized_update_match_the_scalar_update(self):
+        scalar = self.__create_algorithm(vectorized=False)
+        vectorized = self.__create_algorithm(vectorized=True)
+
+        with mock.patch('jmetal.algorithm.multiobjective.moqpso.random_uniform',
+                        side_effect=self.__scalar_draws(scalar, 3)):
+            scalar.update_position(scalar.swarm)
+        numpy.random.seed(3)
+        vectorized.update_position(vectorized.swarm)
+
+        positions = numpy.asarray([particle.variables for particle in vectorized.swarm])
+        self.assertTrue(numpy.allclose([particle.variables for particle in scalar.swarm], positions))
+        self.assertTrue(numpy.any(positions == 0.0) and numpy.any(positions == 1.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import random
+import unittest
+from copy import copy
+from unittest import mock
+
+import numpy
+
+from jmetal.algorithm.multiobjective.smpso import SMPSO, select_global_best_positions
+from jmetal.component.archive import CrowdingDistanceArchive
+from jmetal.operator.mutation import Polynomial
+from jmetal.problem.multiobjective.zdt import ZDT1
+
+
+class SMPSOTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = ZDT1()
+
+    def __create_algorithm(self, vectorized: bool) -> SMPSO:
+        random.seed(1)
+        numpy.random.seed(1)
+
+        algorithm = SMPSO(problem=self.problem, swarm_size=20, max_evaluations=10,
+                          mutation=Polynomial(1.0 / self.problem.number_of_variables),
+                          leaders=CrowdingDistanceArchive(100), reference_point=[11, 11], vectorized=vectorized)
+        algorithm.c1_max = algorithm.c2_max = 2.5
+        algorithm.delta_max = algorithm.upper_bound - algorithm.lower_bound
+        algorithm.delta_min = -algorithm.delta_max
+        algorithm.speed = numpy.random.uniform(-0.5, 0.5, algorithm.speed.shape)
+
+        algorithm.swarm = algorithm.evaluate_swarm(algorithm.create_initial_swarm())
+        algorithm.initialize_particle_best(algorithm.swarm)
+        algorithm.leaders.add(copy(algorithm.swarm[0]))
+
+        return algorithm
+
+    def __scalar_draws(self, algorithm: SMPSO, seed: int) -> list:
+        generator = numpy.random.RandomState(seed)
+        shape = (algorithm.swarm_size, 1)
+        r1 = generator.uniform(algorithm.r1_min, algorithm.r1_max, shape)
+        r2 = generator.uniform(algorithm.r2_min, algorithm.r2_max, shape)
+        c1 = generator.uniform(algorithm.c1_min, algorithm.c1_max, shape)
+        c2 = generator.uniform(algorithm.c2_min, algorithm.c2_max, shape)
+
+        return [value for row in numpy.hstack([r1, r2, c1, c2]) for value in row]
+
+    def test_should_vectorized_update_match_the_scalar_update(self):
+        scalar = self.__create_algorithm(vectorized=False)
+        vectorized = self.__create_algorithm(vectorized=True)
+
+        with mock.patch('random.uniform', side_effect=self.__scalar_draws(scalar, 3)):
+            scalar.update_velocity(scalar.swarm)
+        numpy.random.seed(3)
+        vectorized.update_velocity(vectorized.swarm)
+
+        self.assertTrue(numpy.allclose(scalar.speed, vectorized.speed))
+
+        scalar.update_position(scalar.swarm)
+        vectorized.update_position(vectorized.swarm)
+
+        self.assertTrue(numpy.allclose(scalar.speed, vectorized.speed))
+        self.assertTrue(numpy.allclose([particle.variables for particle in scalar.swarm],
+                                       [particle.variables for particle in vectorized.swarm]))
+
+    def test_should_select_global_best_positions_return_the_variables_of_the_leaders(self):
+        first, second = CrowdingDistanceArchive(100), CrowdingDistanceArchive(100)
+        empty = CrowdingDistanceArchive(100)
+        for objectives, archive in [([0, 2], first), ([2, 0], first), ([1, 1], second)]:
+            solution = self.problem.create_solution()
+            solution.objectives = objectives
+            archive.add(solution)
+
+        positions = select_global_best_positions([first, empty, second], 50)
+
+        leaders = [solution.variables for solution in first.solution_list + second.solution_list]
+        self.assertEqual((50, self.problem.number_of_variables), positions.shape)
+        self.assertTrue(all(position in leaders for position in positions.tolist()))
+
+
+if __name__ == '__main__':
+    unittest.main()
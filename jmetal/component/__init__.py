@@ -1,21 +1,27 @@
 from .archive import BoundedArchive, NonDominatedSolutionListArchive, CrowdingDistanceArchive,  \
-    CrowdingDistanceArchiveWithReferencePoint
+    CrowdingDistanceArchiveWithReferencePoint, BiObjectiveNonDominatedSolutionListArchive, \
+    NonDominatedSolutionTreeArchive, HypervolumeContributionArchive
 from .comparator import EqualSolutionsComparator, SolutionAttributeComparator, RankingAndCrowdingDistanceComparator, \
     DominanceComparator
-from .density_estimator import CrowdingDistance
-from .evaluator import SequentialEvaluator, MapEvaluator
+from .density_estimator import CrowdingDistance, HypervolumeContribution
+from .evaluator import SequentialEvaluator, MapEvaluator, ProcessPoolEvaluator, SharedMemoryEvaluator
 from .observer import ProgressBarObserver, BasicAlgorithmObserver, WriteFrontToFileObserver, VisualizerObserver
-from .quality_indicator import HyperVolume
-from .ranking import FastNonDominatedRanking
+from .quality_indicator import HyperVolume, MonteCarloHyperVolume, GenerationalDistance, GenerationalDistancePlus, \
+    InvertedGenerationalDistance, InvertedGenerationalDistancePlus, AdditiveEpsilon, MultiplicativeEpsilon
+from .ranking import FastNonDominatedRanking, EfficientNonDominatedRanking, DominanceMatrixRanking, \
+    DimensionSweepRanking
 
 __all__ = [
     'BoundedArchive', 'NonDominatedSolutionListArchive', 'CrowdingDistanceArchive',
-    'CrowdingDistanceArchiveWithReferencePoint',
+    'CrowdingDistanceArchiveWithReferencePoint', 'BiObjectiveNonDominatedSolutionListArchive',
+    'NonDominatedSolutionTreeArchive', 'HypervolumeContributionArchive',
     'EqualSolutionsComparator', 'SolutionAttributeComparator', 'RankingAndCrowdingDistanceComparator',
     'DominanceComparator',
-    'CrowdingDistance',
-    'SequentialEvaluator', 'MapEvaluator',
+    'CrowdingDistance', 'HypervolumeContribution',
+    'SequentialEvaluator', 'MapEvaluator', 'ProcessPoolEvaluator', 'SharedMemoryEvaluator',
     'ProgressBarObserver', 'BasicAlgorithmObserver', 'WriteFrontToFileObserver', 'VisualizerObserver',
-    'HyperVolume',
-    'FastNonDominatedRanking'
+    'HyperVolume', 'MonteCarloHyperVolume', 'GenerationalDistance', 'GenerationalDistancePlus',
+    'InvertedGenerationalDistance', 'InvertedGenerationalDistancePlus', 'AdditiveEpsilon', 'MultiplicativeEpsilon',
+    'FastNonDominatedRanking', 'EfficientNonDominatedRanking', 'DominanceMatrixRanking',
+    'DimensionSweepRanking'
 ]
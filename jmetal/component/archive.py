@@ -1,11 +1,16 @@
 import random
 import copy
+import heapq
+from bisect import bisect_left, bisect_right
 from abc import ABCMeta, abstractmethod
 from typing import TypeVar, Generic, List
 
-from jmetal.component.density_estimator import CrowdingDistance, DensityEstimator
-from jmetal.component.comparator import Comparator, DominanceComparator, EqualSolutionsComparator, \
-    SolutionAttributeComparator
+import numpy as np
+
+from jmetal.component.density_estimator import CrowdingDistance, DensityEstimator, IncrementalCrowdingDistance, \
+    HypervolumeContribution
+from jmetal.component.comparator import Comparator, DominanceComparator, SolutionAttributeComparator, \
+    dominance_matrix, dominance_test, get_objectives_and_violations
 
 S = TypeVar('S')
 
@@ -29,6 +34,20 @@ class Archive(Generic[S]):
     def add(self, solution: S) -> bool:
         pass
 
+    def add_all(self, solutions: List[S]) -> List[bool]:
+        """ Adds the solutions one by one.
+
+        :return: For each solution, whether it is in the archive once the whole batch has been added. """
+        for solution in solutions:
+            self.add(solution)
+
+        return self.contains_all(solutions)
+
+    def contains_all(self, solutions: List[S]) -> List[bool]:
+        """ :return: For each solution, whether it is (the very object) in the archive. """
+        ids = set(id(solution) for solution in self.solution_list)
+        return [id(solution) in ids for solution in solutions]
+
     def get(self, index: int) -> S:
         return self.solution_list[index]
 
@@ -44,27 +63,138 @@ class BoundedArchive(Archive[S]):
     def __init__(self,
                  maximum_size: int,
                  comparator: Comparator[S]=None,
-                 density_estimator: DensityEstimator=None):
+                 density_estimator: DensityEstimator=None,
+                 non_dominated_solution_archive: 'NonDominatedSolutionListArchive[S]'=None):
         super(BoundedArchive, self).__init__()
         self.maximum_size = maximum_size
         self.comparator = comparator
         self.density_estimator = density_estimator
-        self.non_dominated_solution_archive = NonDominatedSolutionListArchive()
+        self.__select_automatically = non_dominated_solution_archive is None
+        self.non_dominated_solution_archive = non_dominated_solution_archive \
+            if non_dominated_solution_archive is not None else NonDominatedSolutionListArchive()
         self.solution_list = self.non_dominated_solution_archive.solution_list
 
+        # order of entry of the solutions, which breaks ties between equally bad solutions in the truncation even if
+        # the non-dominated archive keeps its solutions sorted (e.g., the bi-objective one)
+        self.__entries = {}
+        self.__number_of_entries = 0
+
     def compute_density_estimator(self):
         self.density_estimator.compute_density_estimator(self.solution_list)
 
     def add(self, solution: S) -> bool:
+        if self.size() == 0 and self.__select_automatically:
+            self.__select_non_dominated_solution_archive(solution)
+
         success = self.non_dominated_solution_archive.add(solution)
         if success:
-            if self.size() > self.maximum_size:
-                self.compute_density_estimator()
-                worst_solution = self.__find_worst_solution(self.solution_list)
-                self.solution_list.remove(worst_solution)
+            self.__enter([solution])
+            self.truncate()
 
         return success
 
+    def add_all(self, solutions: List[S]) -> List[bool]:
+        """ Adds a batch of solutions with a single update of the non-dominated archive, truncating the archive to
+        `maximum_size` once at the end instead of after every insertion.
+
+        :param solutions: List of solutions.
+        :return: For each solution, whether it is in the archive once the whole batch has been added (after the
+            truncation). """
+        if self.size() == 0 and len(solutions) > 0 and self.__select_automatically:
+            self.__select_non_dominated_solution_archive(solutions[0])
+
+        accepted = self.non_dominated_solution_archive.add_all(solutions)
+        self.__enter([solution for solution, is_accepted in zip(solutions, accepted) if is_accepted])
+        self.truncate()
+
+        return self.contains_all(solutions)
+
+    def truncate(self) -> None:
+        """ Removes the worst solutions until the archive holds `maximum_size` of them. The solutions removed are the
+        ones that removing the worst solution one at a time would remove, recomputing the density estimator in
+        between, but they leave the non-dominated archive in a single pass. With an
+        :class:`IncrementalCrowdingDistance`, only the neighbors of each removed solution are recomputed and the
+        worst solution is taken from a heap when the comparator is a :class:`SolutionAttributeComparator`. """
+        excess = self.size() - self.maximum_size
+        if excess <= 0:
+            return
+
+        if isinstance(self.density_estimator, IncrementalCrowdingDistance) and \
+                isinstance(self.comparator, SolutionAttributeComparator):
+            worst_solutions = self.__select_worst_solutions_incrementally(excess)
+        else:
+            worst_solutions = self.__select_worst_solutions(excess)
+
+        self.non_dominated_solution_archive.remove_all(worst_solutions)
+
+    def __enter(self, solutions: List[S]) -> None:
+        for solution in solutions:
+            self.__entries[id(solution)] = self.__number_of_entries
+            self.__number_of_entries += 1
+
+        if len(self.__entries) > 2 * max(self.size(), self.maximum_size):
+            self.__entries = {id(solution): self.__entries.get(id(solution), -1) for solution in self.solution_list}
+
+    def __in_order_of_entry(self) -> List[S]:
+        return sorted(self.solution_list, key=lambda solution: self.__entries.get(id(solution), -1))
+
+    def __select_worst_solutions(self, number_of_solutions: int) -> List[S]:
+        remaining = self.__in_order_of_entry()
+        worst_solutions = []
+
+        for _ in range(number_of_solutions):
+            self.density_estimator.compute_density_estimator(remaining)
+            worst_solution = self.__find_worst_solution(remaining)
+            remaining.remove(worst_solution)
+            worst_solutions.append(worst_solution)
+
+        return worst_solutions
+
+    def __select_worst_solutions_incrementally(self, number_of_solutions: int) -> List[S]:
+        self.compute_density_estimator()
+
+        if any(solution.attributes.get(self.comparator.key) is None for solution in self.solution_list):
+            return self.__select_worst_solutions(number_of_solutions)
+
+        # the worst solution is the first one to enter the archive with the worst value of the attribute
+        sign = -1 if self.comparator.lowest_is_best else 1
+
+        def key(solution: S) -> float:
+            return sign * solution.attributes[self.comparator.key]
+
+        positions = {id(solution): position for position, solution in enumerate(self.__in_order_of_entry())}
+        versions = dict.fromkeys(positions, 0)
+        heap = [(key(solution), positions[id(solution)], 0, solution) for solution in self.solution_list]
+        heapq.heapify(heap)
+
+        worst_solutions = []
+        while len(worst_solutions) < number_of_solutions:
+            _, _, version, solution = heapq.heappop(heap)
+            if versions.get(id(solution)) != version:
+                continue
+
+            del versions[id(solution)]
+            worst_solutions.append(solution)
+
+            for changed_solution in self.density_estimator.remove(solution):
+                versions[id(changed_solution)] += 1
+                heapq.heappush(heap, (key(changed_solution), positions[id(changed_solution)],
+                                      versions[id(changed_solution)], changed_solution))
+
+        return worst_solutions
+
+    def __select_non_dominated_solution_archive(self, solution: S) -> None:
+        """ Bi-objective solutions are kept in a :class:`BiObjectiveNonDominatedSolutionListArchive`. The
+        solution list object is kept, so references to it remain valid. """
+        if solution.number_of_objectives == 2:
+            archive = BiObjectiveNonDominatedSolutionListArchive()
+        else:
+            archive = NonDominatedSolutionListArchive()
+
+        if type(archive) is not type(self.non_dominated_solution_archive):
+            archive.solution_list = self.solution_list
+            self.non_dominated_solution_archive = archive
+
     def __find_worst_solution(self, solution_list: List[S]) -> S:
         if solution_list is None:
             raise Exception("The solution list is None")
@@ -105,7 +235,7 @@ class NonDominatedSolutionListArchive(Archive[S]):
                     is_dominated = True
                     break
                 elif is_dominated_flag == 0:
-                    if EqualSolutionsComparator().compare(solution, current_solution) == 0:
+                    if solution.objectives == current_solution.objectives:
                         is_contained = True
                         break
 
@@ -115,15 +245,343 @@ class NonDominatedSolutionListArchive(Archive[S]):
 
         return False
 
+    def add_all(self, solutions: List[S]) -> List[bool]:
+        """ Adds a batch of solutions. The dominance relations between the batch and the archive, and within the
+        batch, are computed as boolean matrices; the final archive is the same as adding the solutions one by one.
+
+        :return: For each solution, whether it is in the archive once the whole batch has been added. """
+        if len(solutions) == 0:
+            return []
+
+        number_of_objectives = len(solutions[0].objectives)
+        candidates, candidate_violations = get_objectives_and_violations(solutions, number_of_objectives)
+        archive, archive_violations = get_objectives_and_violations(self.solution_list, number_of_objectives)
+
+        # candidates against the archive
+        dominance = dominance_matrix(candidates, candidate_violations, archive, archive_violations)
+        equal = np.all(candidates[:, None, :] == archive[None, :, :], axis=2)
+        rejected = np.any((dominance == 1) | ((dominance == 0) & equal), axis=1)
+
+        # candidates against each other; of several equal candidates, the first one is kept
+        batch_dominance = dominance_matrix(candidates, candidate_violations, candidates, candidate_violations)
+        batch_equal = np.all(candidates[:, None, :] == candidates[None, :, :], axis=2)
+        earlier = np.tri(len(solutions), k=-1, dtype=bool)
+        rejected |= np.any((batch_dominance == 1) | ((batch_dominance == 0) & batch_equal & earlier), axis=1)
+
+        accepted = ~rejected
+        dominated = np.any(dominance[accepted] == -1, axis=0)
+
+        if np.any(dominated):
+            self.solution_list[:] = [solution for solution, is_dominated in zip(self.solution_list, dominated)
+                                     if not is_dominated]
+        self.solution_list.extend(solution for solution, is_accepted in zip(solutions, accepted) if is_accepted)
+
+        return accepted.tolist()
+
+    def remove(self, solution: S) -> None:
+        self.solution_list.remove(solution)
+
+    def remove_all(self, solutions: List[S]) -> None:
+        removed_ids = set(id(solution) for solution in solutions)
+        self.solution_list[:] = [solution for solution in self.solution_list if id(solution) not in removed_ids]
+
+
+class BiObjectiveNonDominatedSolutionListArchive(NonDominatedSolutionListArchive[S]):
+    """ Non-dominated archive for bi-objective problems. The non-dominated solutions of two objectives form a
+    staircase: sorted by the first objective, the second one strictly decreases. The solution list is kept in that
+    order, so the dominance check of a new solution and the location of the solutions it dominates are binary
+    searches instead of a scan of the whole archive.
+
+    .. note::
+       Once a solution with a non-zero `overall_constraint_violation` is added, the staircase no longer holds and
+       the archive falls back to the scan of :class:`NonDominatedSolutionListArchive`.
+    """
+
+    def __init__(self):
+        super(BiObjectiveNonDominatedSolutionListArchive, self).__init__()
+        self.constrained = False
+        self.__first_objectives = []
+        self.__negated_second_objectives = []
+
+    def add(self, solution: S) -> bool:
+        if self.constrained or solution.attributes.get('overall_constraint_violation', 0.0):
+            self.constrained = True
+            return super(BiObjectiveNonDominatedSolutionListArchive, self).add(solution)
+
+        if len(self.__first_objectives) != len(self.solution_list):
+            self.__update_keys()
+
+        first, second = solution.objectives[0], solution.objectives[1]
+
+        # the solution with the lowest second objective among those not worse in the first one
+        index = bisect_right(self.__first_objectives, first)
+        if index > 0 and -self.__negated_second_objectives[index - 1] <= second:
+            return False
+
+        # the solutions in [start, end) are dominated by the new one
+        start = bisect_left(self.__first_objectives, first)
+        end = bisect_right(self.__negated_second_objectives, -second, lo=start)
+
+        self.solution_list[start:end] = [solution]
+        self.__first_objectives[start:end] = [first]
+        self.__negated_second_objectives[start:end] = [-second]
+
+        return True
+
+    def add_all(self, solutions: List[S]) -> List[bool]:
+        # one by one: each insertion is already a pair of binary searches
+        return Archive.add_all(self, solutions)
+
+    def remove(self, solution: S) -> None:
+        if self.constrained or len(self.__first_objectives) != len(self.solution_list):
+            self.solution_list.remove(solution)
+            return
+
+        index = bisect_left(self.__first_objectives, solution.objectives[0])
+        if index == len(self.solution_list) or self.solution_list[index] is not solution:
+            index = self.solution_list.index(solution)
+
+        del self.solution_list[index]
+        del self.__first_objectives[index]
+        del self.__negated_second_objectives[index]
+
+    def remove_all(self, solutions: List[S]) -> None:
+        super(BiObjectiveNonDominatedSolutionListArchive, self).remove_all(solutions)
+        self.__update_keys()
+
+    def __update_keys(self) -> None:
+        self.__first_objectives = [solution.objectives[0] for solution in self.solution_list]
+        self.__negated_second_objectives = [-solution.objectives[1] for solution in self.solution_list]
+
+
+class NonDominatedSolutionTreeArchive(NonDominatedSolutionListArchive[S]):
+    """ Non-dominated archive indexed by an ND-Tree, as described in
+
+    * A. Jaszkiewicz and T. Lust, "ND-Tree-based update: a fast algorithm for the dynamic nondominance problem,"
+      in IEEE Transactions on Evolutionary Computation, vol. 22, no. 5, pp. 778-791, Oct. 2018.
+
+    Every node of the tree keeps the ideal and nadir points of the solutions below it, so a new solution is
+    rejected, or a whole subtree is discarded, without visiting the solutions it contains when the bounding points
+    already decide the dominance relation. It pays off for three or more objectives and large archives.
+
+    .. note::
+       Once a solution with a non-zero `overall_constraint_violation` is added, the archive falls back to the scan
+       of :class:`NonDominatedSolutionListArchive`.
+    """
+
+    class Node:
+
+        def __init__(self, parent=None):
+            self.parent = parent
+            self.children = []
+            self.solutions = []
+            self.ideal = None
+            self.nadir = None
+
+        def is_leaf(self) -> bool:
+            return len(self.children) == 0
+
+        def update_bounds(self, objectives: List[float]) -> None:
+            if self.ideal is None:
+                self.ideal = list(objectives)
+                self.nadir = list(objectives)
+            else:
+                self.ideal = [min(a, b) for a, b in zip(self.ideal, objectives)]
+                self.nadir = [max(a, b) for a, b in zip(self.nadir, objectives)]
+
+    def __init__(self, maximum_leaf_size: int = 20, number_of_children: int = None):
+        """ :param maximum_leaf_size: Number of solutions a leaf holds before being split.
+        :param number_of_children: Number of children of a split leaf. Default to the number of objectives plus one.
+        """
+        super(NonDominatedSolutionTreeArchive, self).__init__()
+        self.maximum_leaf_size = maximum_leaf_size
+        self.number_of_children = number_of_children
+        self.constrained = False
+        self.root = self.Node()
+        self.__leaves = {}
+
+    def add(self, solution: S) -> bool:
+        if self.constrained or solution.attributes.get('overall_constraint_violation', 0.0):
+            self.constrained = True
+            return super(NonDominatedSolutionTreeArchive, self).add(solution)
+
+        if len(self.__leaves) != len(self.solution_list):
+            self.__rebuild()
+
+        removed = []
+        if self.root.ideal is not None and not self.__update(self.root, solution.objectives, removed):
+            return False
+
+        if removed:
+            removed_ids = set(id(removed_solution) for removed_solution in removed)
+            self.solution_list[:] = [current for current in self.solution_list if id(current) not in removed_ids]
+
+        if self.root.ideal is None:
+            self.root = self.Node()
+        self.__insert(self.root, solution)
+        self.solution_list.append(solution)
+
+        return True
+
+    def add_all(self, solutions: List[S]) -> List[bool]:
+        # one by one: each insertion only visits the nodes of the tree that may hold dominated solutions
+        return Archive.add_all(self, solutions)
+
+    def remove(self, solution: S) -> None:
+        self.solution_list.remove(solution)
+
+        if not self.constrained and id(solution) in self.__leaves:
+            self.__detach(solution)
+
+    def remove_all(self, solutions: List[S]) -> None:
+        super(NonDominatedSolutionTreeArchive, self).remove_all(solutions)
+
+        if not self.constrained:
+            for solution in solutions:
+                if id(solution) in self.__leaves:
+                    self.__detach(solution)
+
+    def __update(self, node: 'Node', objectives: List[float], removed: List[S]) -> bool:
+        """ Discards the solutions of the node dominated by `objectives`.
+
+        :return: False if `objectives` is weakly dominated by a solution of the node. """
+        if self.__weakly_dominates(node.nadir, objectives):
+            return False
+        elif self.__weakly_dominates(objectives, node.ideal) and objectives != node.ideal:
+            self.__collect(node, removed)
+            self.__prune(node)
+            return True
+        elif not self.__weakly_dominates(objectives, node.nadir) and \
+                not self.__weakly_dominates(node.ideal, objectives):
+            return True
+
+        if node.is_leaf():
+            survivors = []
+            for solution in node.solutions:
+                if self.__weakly_dominates(solution.objectives, objectives):
+                    return False
+                elif self.__weakly_dominates(objectives, solution.objectives):
+                    removed.append(solution)
+                    del self.__leaves[id(solution)]
+                else:
+                    survivors.append(solution)
+            node.solutions = survivors
+            if len(survivors) == 0:
+                self.__prune(node)
+        else:
+            for child in list(node.children):
+                if not self.__update(child, objectives, removed):
+                    return False
+
+        return True
+
+    def __insert(self, node: 'Node', solution: S) -> None:
+        node.update_bounds(solution.objectives)
+
+        while not node.is_leaf():
+            node = min(node.children, key=lambda child: self.__distance_to_middle_point(child, solution.objectives))
+            node.update_bounds(solution.objectives)
+
+        node.solutions.append(solution)
+        self.__leaves[id(solution)] = node
+
+        if len(node.solutions) > self.maximum_leaf_size:
+            self.__split(node)
+
+    def __split(self, leaf: 'Node') -> None:
+        """ Turns a full leaf into an internal node whose children are seeded with mutually distant solutions. """
+        number_of_children = self.number_of_children if self.number_of_children \
+            else len(leaf.solutions[0].objectives) + 1
+        solutions = leaf.solutions
+        leaf.solutions = []
+
+        seeds = [max(solutions, key=lambda s: sum(self.__distance(s.objectives, o.objectives) for o in solutions))]
+        while len(seeds) < min(number_of_children, len(solutions)):
+            seeds.append(max(solutions, key=lambda s: min(self.__distance(s.objectives, seed.objectives)
+                                                          for seed in seeds)))
+
+        for seed in seeds:
+            child = self.Node(leaf)
+            child.update_bounds(seed.objectives)
+            child.solutions.append(seed)
+            self.__leaves[id(seed)] = child
+            leaf.children.append(child)
+
+        seed_ids = set(id(seed) for seed in seeds)
+        for solution in solutions:
+            if id(solution) not in seed_ids:
+                child = min(leaf.children, key=lambda c: self.__distance_to_middle_point(c, solution.objectives))
+                child.update_bounds(solution.objectives)
+                child.solutions.append(solution)
+                self.__leaves[id(solution)] = child
+
+    def __collect(self, node: 'Node', removed: List[S]) -> None:
+        for solution in node.solutions:
+            removed.append(solution)
+            del self.__leaves[id(solution)]
+        for child in node.children:
+            self.__collect(child, removed)
+
+    def __prune(self, node: 'Node') -> None:
+        """ Detaches an emptied node, and any ancestor left without children, from the tree. """
+        node.solutions = []
+        node.children = []
+        while node.parent is not None and node.is_leaf() and len(node.solutions) == 0:
+            node.parent.children.remove(node)
+            node = node.parent
+        if node.parent is None and node.is_leaf() and len(node.solutions) == 0:
+            node.ideal = node.nadir = None
+
+    def __detach(self, solution: S) -> None:
+        leaf = self.__leaves.pop(id(solution))
+        leaf.solutions = [current for current in leaf.solutions if current is not solution]
+        if len(leaf.solutions) == 0:
+            self.__prune(leaf)
+
+    def __rebuild(self) -> None:
+        self.root = self.Node()
+        self.__leaves = {}
+        for solution in self.solution_list:
+            self.__insert(self.root, solution)
+
+    def __distance_to_middle_point(self, node: 'Node', objectives: List[float]) -> float:
+        return sum(((low + high) / 2.0 - value) ** 2 for low, high, value in zip(node.ideal, node.nadir, objectives))
+
+    @staticmethod
+    def __distance(objectives1: List[float], objectives2: List[float]) -> float:
+        return sum((value1 - value2) ** 2 for value1, value2 in zip(objectives1, objectives2))
+
+    @staticmethod
+    def __weakly_dominates(objectives1: List[float], objectives2: List[float]) -> bool:
+        return all(value1 <= value2 for value1, value2 in zip(objectives1, objectives2))
+
 
 class CrowdingDistanceArchive(BoundedArchive[S]):
 
     def __init__(self,
-                 maximum_size: int):
+                 maximum_size: int,
+                 non_dominated_solution_archive: NonDominatedSolutionListArchive[S]=None):
         super(CrowdingDistanceArchive, self).__init__(
             maximum_size=maximum_size,
             comparator=SolutionAttributeComparator("crowding_distance", lowest_is_best=False),
-            density_estimator=CrowdingDistance())
+            density_estimator=IncrementalCrowdingDistance(),
+            non_dominated_solution_archive=non_dominated_solution_archive)
+
+
+class HypervolumeContributionArchive(BoundedArchive[S]):
+    """ Bounded archive that, when full, discards the solution contributing the least hypervolume with respect to
+    `reference_point` (contributions are recomputed after every removal).
+    """
+
+    def __init__(self,
+                 maximum_size: int,
+                 reference_point: List[float],
+                 non_dominated_solution_archive: NonDominatedSolutionListArchive[S]=None):
+        super(HypervolumeContributionArchive, self).__init__(
+            maximum_size=maximum_size,
+            comparator=SolutionAttributeComparator("hypervolume_contribution", lowest_is_best=False),
+            density_estimator=HypervolumeContribution(reference_point),
+            non_dominated_solution_archive=non_dominated_solution_archive)
 
 
 class ArchiveWithReferencePoint(BoundedArchive[S]):
@@ -132,8 +590,10 @@ class ArchiveWithReferencePoint(BoundedArchive[S]):
                  maximum_size: int,
                  reference_point: List[float],
                  comparator: Comparator[S],
-                 density_estimator: DensityEstimator):
-        super(ArchiveWithReferencePoint, self).__init__(maximum_size, comparator, density_estimator)
+                 density_estimator: DensityEstimator,
+                 non_dominated_solution_archive: NonDominatedSolutionListArchive[S]=None):
+        super(ArchiveWithReferencePoint, self).__init__(maximum_size, comparator, density_estimator,
+                                                        non_dominated_solution_archive)
         self.__reference_point = reference_point
         self.__comparator = comparator
         self.__density_estimator = density_estimator
@@ -163,44 +623,57 @@ class ArchiveWithReferencePoint(BoundedArchive[S]):
             result = super(ArchiveWithReferencePoint, self).add(solution)
 
         if result and dominated_solution is not None and len(self.solution_list) > 1:
-            self.solution_list.remove(dominated_solution)
-
-        if result and len(self.solution_list) > self.maximum_size:
-            self.compute_density_estimator()
+            self.non_dominated_solution_archive.remove(dominated_solution)
 
         return result
 
+    def add_all(self, solutions: List[S]) -> List[bool]:
+        """ Applies the reference point filter of :func:`add` to each solution and inserts the survivors with a
+        single :func:`BoundedArchive.add_all`.
+
+        :return: For each solution, whether it is in the archive once the whole batch has been added. """
+        candidates = []
+        dominated_solutions = []
+
+        for solution in solutions:
+            if self.__reference_point_solution is None:
+                self.__reference_point_solution = copy.deepcopy(solution)
+
+            self.__reference_point_solution.objectives = [value for value in self.__reference_point]
+
+            if self.__dominance_test(solution, self.__reference_point_solution) == 0:
+                if len(self.solution_list) == 0 and len(candidates) == 0:
+                    candidates.append(solution)
+                elif random.uniform(0.0, 1.0) < 0.05:
+                    candidates.append(solution)
+                    dominated_solutions.append(solution)
+            else:
+                candidates.append(solution)
+
+        super(ArchiveWithReferencePoint, self).add_all(candidates)
+
+        for dominated_solution in dominated_solutions:
+            if len(self.solution_list) > 1 and any(solution is dominated_solution for solution in self.solution_list):
+                self.non_dominated_solution_archive.remove(dominated_solution)
+
+        return self.contains_all(solutions)
+
     def get_reference_point(self)->List[float]:
         return self.__reference_point
 
     def __dominance_test(self, solution1: S, solution2: S) -> int:
-        best_is_one = 0
-        best_is_two = 0
-
-        for value1, value2 in zip(solution1.objectives, solution2.objectives):
-            if value1 != value2:
-                if value1 < value2:
-                    best_is_one = 1
-                if value2 < value1:
-                    best_is_two = 1
-
-        if best_is_one > best_is_two:
-            result = -1
-        elif best_is_two > best_is_one:
-            result = 1
-        else:
-            result = 0
-
-        return result
+        return dominance_test(solution1.objectives, solution2.objectives)
 
 
 class CrowdingDistanceArchiveWithReferencePoint(ArchiveWithReferencePoint[S]):
 
     def __init__(self,
                  maximum_size: int,
-                 reference_point: List[float]):
+                 reference_point: List[float],
+                 non_dominated_solution_archive: NonDominatedSolutionListArchive[S]=None):
         super(CrowdingDistanceArchiveWithReferencePoint, self).__init__(
             maximum_size=maximum_size,
             reference_point=reference_point,
             comparator=SolutionAttributeComparator("crowding_distance", lowest_is_best=False),
-            density_estimator=CrowdingDistance())
+            density_estimator=IncrementalCrowdingDistance(),
+            non_dominated_solution_archive=non_dominated_solution_archive)
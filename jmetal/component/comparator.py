@@ -1,5 +1,8 @@
+import time
 from abc import ABCMeta, abstractmethod
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, List
+
+import numpy as np
 
 from jmetal.core.solution import Solution
 
@@ -109,30 +112,120 @@ class DominanceComparator(Comparator):
         # elif len(solution1.objectives) != len(solution2.objectives):
         #    raise Exception("The solutions have different number of objectives")
 
+        if self.__is_constraint_violation_comparator(self.constraint_comparator):
+            return dominance_test(solution1.objectives, solution2.objectives,
+                                  solution1.attributes.get('overall_constraint_violation'),
+                                  solution2.attributes.get('overall_constraint_violation'))
+
         result = self.constraint_comparator.compare(solution1, solution2)
         if result == 0:
-            result = self.__dominance_test(solution1, solution2)
+            result = dominance_test(solution1.objectives, solution2.objectives)
 
         return result
 
-    def __dominance_test(self, solution1: Solution, solution2: Solution) -> float:
-        best_is_one = 0
-        best_is_two = 0
+    @staticmethod
+    def __is_constraint_violation_comparator(comparator: Comparator) -> bool:
+        return type(comparator) is SolutionAttributeComparator and \
+               comparator.key == 'overall_constraint_violation' and not comparator.lowest_is_best
 
-        for i in range(solution1.number_of_objectives):
-            value1 = solution1.objectives[i]
-            value2 = solution2.objectives[i]
-            if value1 != value2:
-                if value1 < value2:
-                    best_is_one = 1
-                if value1 > value2:
-                    best_is_two = 1
 
-        if best_is_one > best_is_two:
-            result = -1
-        elif best_is_two > best_is_one:
-            result = 1
-        else:
-            result = 0
+# Dominance kernels used by the comparators, archives, rankings and selection operators. They follow
+# DominanceComparator: when both solutions have an overall_constraint_violation and the values differ, the greater one
+# (the closest to zero) wins; otherwise the objectives are compared. A missing violation is passed as None to
+# dominance_test and as NaN in the arrays of the other kernels.
 
-        return result
+
+class DominanceCounter:
+    """ Counts the pairs of solutions compared by the dominance kernels while it is installed with
+    :func:`set_dominance_counter`. """
+
+    def __init__(self):
+        self.number_of_comparisons = 0
+        self.start_time = time.time()
+
+    def increment(self, number_of_comparisons: int) -> None:
+        self.number_of_comparisons += number_of_comparisons
+
+    def get_comparisons_per_second(self) -> float:
+        elapsed_time = time.time() - self.start_time
+        return self.number_of_comparisons / elapsed_time if elapsed_time > 0 else 0.0
+
+
+_dominance_counter = None
+
+
+def set_dominance_counter(counter: DominanceCounter = None) -> None:
+    """ Installs a counter notified by every dominance kernel, or removes it when `counter` is None. """
+    global _dominance_counter
+    _dominance_counter = counter
+
+
+def dominance_test(objectives1: List[float], objectives2: List[float],
+                   violation1: float = None, violation2: float = None) -> int:
+    """ Compares two solutions.
+
+    :return: -1 if the first one dominates the second one, 1 if it is dominated by it, 0 otherwise. """
+    if _dominance_counter is not None:
+        _dominance_counter.increment(1)
+
+    if violation1 is not None and violation2 is not None and violation1 != violation2:
+        return -1 if violation1 > violation2 else 1
+
+    best_is_one = False
+    best_is_two = False
+    for value1, value2 in zip(objectives1, objectives2):
+        if value1 < value2:
+            if best_is_two:
+                return 0
+            best_is_one = True
+        elif value1 > value2:
+            if best_is_one:
+                return 0
+            best_is_two = True
+
+    if best_is_one:
+        return -1
+    elif best_is_two:
+        return 1
+
+    return 0
+
+
+def get_objectives_and_violations(solutions: List[Solution], number_of_objectives: int = None):
+    """ :return: The (n, m) objective matrix of the solutions and the n constraint violations, NaN when missing. """
+    if number_of_objectives is None:
+        number_of_objectives = len(solutions[0].objectives) if len(solutions) > 0 else 0
+
+    objectives = np.array([solution.objectives for solution in solutions], dtype=float)
+    violations = np.array([solution.attributes.get('overall_constraint_violation', np.nan) for solution in solutions],
+                          dtype=float)
+
+    return objectives.reshape(len(solutions), number_of_objectives), violations
+
+
+def dominance_matrix(objectives1: np.ndarray, violations1: np.ndarray,
+                     objectives2: np.ndarray, violations2: np.ndarray) -> np.ndarray:
+    """ Compares every row of the first objective matrix with every row of the second one.
+
+    :return: The (n1, n2) matrix of the results of :func:`dominance_test`. """
+    if _dominance_counter is not None:
+        _dominance_counter.increment(len(objectives1) * len(objectives2))
+
+    better = np.any(objectives1[:, None, :] < objectives2[None, :, :], axis=2)
+    worse = np.any(objectives1[:, None, :] > objectives2[None, :, :], axis=2)
+    result = (worse & ~better).astype(int) - (better & ~worse).astype(int)
+
+    constraints = (violations1[:, None] < violations2[None, :]).astype(int) - \
+        (violations1[:, None] > violations2[None, :]).astype(int)
+
+    return np.where(constraints != 0, constraints, result)
+
+
+def dominance_test_one_to_many(objectives: np.ndarray, violation: float,
+                               objectives_matrix: np.ndarray, violations: np.ndarray) -> np.ndarray:
+    """ Compares one solution with every row of an objective matrix.
+
+    :return: The n results of :func:`dominance_test`, -1 where the solution dominates the row. """
+    return dominance_matrix(np.asarray(objectives, dtype=float)[None, :],
+                            np.array([np.nan if violation is None else violation], dtype=float),
+                            objectives_matrix, violations)[0]
@@ -1,7 +1,12 @@
 import logging
 from abc import ABCMeta, abstractmethod
+from bisect import bisect_left
 from typing import TypeVar, List
 
+import numpy as np
+
+from jmetal.component.quality_indicator import HyperVolume
+
 logger = logging.getLogger(__name__)
 
 S = TypeVar('S')
@@ -31,6 +36,13 @@ class CrowdingDistance(DensityEstimator[List[S]]):
     In consequence, the main method of this class is :func:`compute_density_estimator`.
     """
 
+    def __init__(self, matrix_threshold: int = 50):
+        """
+        :param matrix_threshold: Fronts with more solutions than this are computed by :func:`crowding_distances`
+          over their objective matrix.
+        """
+        self.matrix_threshold = matrix_threshold
+
     def compute_density_estimator(self, front: List[S]):
         """This function performs the computation of the crowding density estimation over the solution list.
 
@@ -41,6 +53,12 @@ class CrowdingDistance(DensityEstimator[List[S]]):
         """
         size = len(front)
 
+        if size > max(self.matrix_threshold, 2):
+            distances = crowding_distances(np.array([solution.objectives for solution in front], dtype=float))
+            for solution, distance in zip(front, distances.tolist()):
+                solution.attributes['crowding_distance'] = distance
+            return
+
         if size is 0:
             return
         elif size is 1:
@@ -77,3 +95,228 @@ class CrowdingDistance(DensityEstimator[List[S]]):
 
                 distance += front[j].attributes['crowding_distance']
                 front[j].attributes['crowding_distance'] = distance
+
+
+def crowding_distances(objectives: np.ndarray) -> np.ndarray:
+    """Computes the crowding distance of every row of an objective matrix.
+
+    :param objectives: The (n, m) matrix of objective values of a front.
+    :return: The n crowding distances, in the order of the rows.
+    """
+    size, number_of_objectives = objectives.shape
+    distances = np.zeros(size)
+
+    if size <= 2:
+        distances[:] = float('inf')
+        return distances
+
+    # as the list in :func:`CrowdingDistance.compute_density_estimator`, each objective re-sorts the order of the
+    # previous one, so that tied values keep the same neighbors
+    order = np.arange(size)
+    for i in range(number_of_objectives):
+        order = order[np.argsort(objectives[order, i], kind='mergesort')]
+        values = objectives[order, i]
+        gaps = values[2:] - values[:-2]
+
+        objective_range = values[-1] - values[0]
+        if objective_range == 0:
+            logger.warning('Minimum and maximum are the same!')
+        else:
+            gaps = gaps / objective_range
+
+        distances[order[1:-1]] += gaps
+        distances[order[[0, -1]]] = float('inf')
+
+    return distances
+
+
+class IncrementalCrowdingDistance(CrowdingDistance[List[S]]):
+    """This class implements the crowding distance of a front which changes a few solutions at a time, as the one
+    of a bounded archive. The solutions are kept sorted by every objective between calls, so a call only places the
+    solutions added or removed since the previous one and recomputes the distance of their neighbors. The whole front
+    is refreshed only when the range of an objective changes.
+
+    .. note::
+       The objectives of a solution must not change while it belongs to the front. As in :class:`CrowdingDistance`,
+       whose sorts are chained, solutions with equal values of an objective are ordered by the previous objectives
+       and then by their position in the front. Positions are tracked as the order in which the solutions entered
+       the front, so the front is rebuilt when solutions with the same first objective change their relative order
+       or a new one is placed before an old one.
+    """
+
+    def __init__(self):
+        super(IncrementalCrowdingDistance, self).__init__()
+        self.__clear()
+
+    def __clear(self) -> None:
+        self.__solutions = {}
+        self.__keys = {}
+        self.__gaps = {}
+        self.__sorted_keys = []
+        self.__sorted_ids = []
+        self.__ranges = []
+        self.__sequence = 0
+
+    def compute_density_estimator(self, front: List[S]):
+        """This function updates the crowding distance of the solutions of the front.
+
+        :param front: The list of solutions.
+        """
+        size = len(front)
+
+        if size == 0:
+            self.__clear()
+            return
+
+        current_ids = set(id(solution) for solution in front)
+        removed_ids = [key for key in self.__solutions if key not in current_ids]
+        added_solutions = [solution for solution in front if id(solution) not in self.__solutions]
+
+        if len(self.__sorted_keys) != front[0].number_of_objectives or \
+                len(removed_ids) + len(added_solutions) > size // 2 or not self.__is_ordered(front):
+            self.__rebuild(front)
+            return
+
+        affected = [set() for _ in self.__sorted_keys]
+        for key in removed_ids:
+            self.__remove(key, affected)
+        for solution in added_solutions:
+            self.__insert(solution, affected)
+
+        self.__refresh(affected)
+
+    def remove(self, solution: S) -> List[S]:
+        """This function removes a solution from the front and updates the crowding distance of its neighbors.
+
+        :param solution: A solution of the front of the last call to :func:`compute_density_estimator`.
+        :return: The solutions whose crowding distance changed.
+        """
+        if len(self.__solutions) == 1:
+            self.__clear()
+            return []
+
+        affected = [set() for _ in self.__sorted_keys]
+        self.__remove(id(solution), affected)
+
+        return [self.__solutions[key] for key in self.__refresh(affected)]
+
+    def __refresh(self, affected: List[set]):
+        updated = set()
+        for i, affected_ids in enumerate(affected):
+            for key in affected_ids:
+                if key in self.__solutions:
+                    self.__gaps[key][i] = self.__gap(i, self.__index(i, key))
+                    updated.add(key)
+
+        ranges = [keys[-1][0] - keys[0][0] for keys in self.__sorted_keys]
+        if ranges != self.__ranges:
+            self.__ranges = ranges
+            updated = self.__solutions.keys()
+
+        for key in updated:
+            self.__assign(key)
+
+        return updated
+
+    def __is_ordered(self, front: List[S]) -> bool:
+        """ Whether the order of entry of solutions tied in the first objective, the only ones whose position in the
+        front may matter, is their order in the front (new solutions being entered in the order of the front). """
+        last_sequences = {}
+        new_values = set()
+
+        for solution in front:
+            value = solution.objectives[0]
+            key = self.__keys.get(id(solution))
+            if key is None:
+                new_values.add(value)
+            elif value in new_values or key[0] < last_sequences.get(value, -1):
+                return False
+            else:
+                last_sequences[value] = key[0]
+
+        return True
+
+    def __rebuild(self, front: List[S]) -> None:
+        self.__clear()
+
+        for solution in front:
+            self.__solutions[id(solution)] = solution
+            self.__keys[id(solution)] = (self.__sequence, list(solution.objectives))
+            self.__sequence += 1
+
+        for i in range(front[0].number_of_objectives):
+            keys = sorted((self.__sorted_key(i, key), key) for key in self.__keys)
+            self.__sorted_keys.append([sorted_key for sorted_key, _ in keys])
+            self.__sorted_ids.append([key for _, key in keys])
+
+        for key in self.__solutions:
+            self.__gaps[key] = [self.__gap(i, self.__index(i, key)) for i in range(len(self.__sorted_keys))]
+
+        self.__ranges = [keys[-1][0] - keys[0][0] for keys in self.__sorted_keys]
+
+        for key in self.__solutions:
+            self.__assign(key)
+
+    def __remove(self, key: int, affected: List[set]) -> None:
+        for i in range(len(self.__sorted_keys)):
+            index = self.__index(i, key)
+            del self.__sorted_keys[i][index]
+            del self.__sorted_ids[i][index]
+            affected[i].update(self.__sorted_ids[i][max(index - 1, 0):index + 1])
+
+        del self.__solutions[key]
+        del self.__keys[key]
+        del self.__gaps[key]
+
+    def __insert(self, solution: S, affected: List[set]) -> None:
+        key = id(solution)
+        self.__solutions[key] = solution
+        self.__keys[key] = (self.__sequence, list(solution.objectives))
+        self.__gaps[key] = [0.0] * len(self.__sorted_keys)
+        self.__sequence += 1
+
+        for i in range(len(self.__sorted_keys)):
+            sorted_key = self.__sorted_key(i, key)
+            index = bisect_left(self.__sorted_keys[i], sorted_key)
+            self.__sorted_keys[i].insert(index, sorted_key)
+            self.__sorted_ids[i].insert(index, key)
+            affected[i].update(self.__sorted_ids[i][max(index - 1, 0):index + 2])
+
+    def __sorted_key(self, i: int, key: int) -> tuple:
+        sequence, objectives = self.__keys[key]
+        return tuple(objectives[i::-1]) + (sequence,)
+
+    def __index(self, i: int, key: int) -> int:
+        return bisect_left(self.__sorted_keys[i], self.__sorted_key(i, key))
+
+    def __gap(self, i: int, index: int) -> float:
+        keys = self.__sorted_keys[i]
+        if index == 0 or index == len(keys) - 1:
+            return float('inf')
+
+        return keys[index + 1][0] - keys[index - 1][0]
+
+    def __assign(self, key: int) -> None:
+        distance = 0.0
+        for gap, objective_range in zip(self.__gaps[key], self.__ranges):
+            if objective_range != 0:
+                gap = gap / objective_range
+            distance = gap + distance
+
+        self.__solutions[key].attributes['crowding_distance'] = distance
+
+
+class HypervolumeContribution(DensityEstimator[List[S]]):
+    """ Density estimator assigning to every solution its exclusive hypervolume contribution, i.e., the hypervolume
+    lost if it is removed (see :func:`HyperVolume.contributions`). The contributions are stored in the
+    'hypervolume_contribution' attribute; the higher, the less crowded is the solution.
+    """
+
+    def __init__(self, reference_point: List[float]):
+        self.hypervolume = HyperVolume(reference_point)
+
+    def compute_density_estimator(self, front: List[S]):
+        contributions = self.hypervolume.contributions(front)
+
+        for solution, contribution in zip(front, contributions):
+            solution.attributes['hypervolume_contribution'] = contribution
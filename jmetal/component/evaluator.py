@@ -1,6 +1,12 @@
+import pickle
+import weakref
 from abc import ABCMeta, abstractmethod
+from math import ceil
+from multiprocessing import cpu_count, Pool
 from multiprocessing.pool import ThreadPool
-from typing import TypeVar, List, Generic
+from typing import TypeVar, List, Generic, Tuple
+
+import numpy as np
 
 from jmetal.core.problem import Problem
 
@@ -21,6 +27,34 @@ class Evaluator(Generic[S]):
         if problem.number_of_constraints > 0:
             problem.evaluate_constraints(solution)
 
+    @staticmethod
+    def evaluate_solution_list_in_batch(solution_list: List[S], problem: Problem) -> None:
+        """ Evaluates the solutions with a single call to :func:`Problem.evaluate_batch` and writes the variables,
+        objectives and overall constraint violation back into each solution. """
+        if len(solution_list) == 0:
+            return
+
+        X = np.asarray([solution.variables for solution in solution_list])
+        F, G = problem.evaluate_batch(X)
+
+        for i, solution in enumerate(solution_list):
+            solution.variables = X[i].tolist()
+            solution.objectives = F[i].tolist()
+            if problem.number_of_constraints > 0:
+                solution.attributes['overall_constraint_violation'] = float(G[i])
+
+    def close(self) -> None:
+        """ Releases the resources of the evaluator (e.g., worker processes). Evaluators are not closed by the
+        algorithms using them: whoever creates an evaluator owns it and closes it, or uses it as a context manager,
+        once no more runs need it. """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def get_name(self) -> str:
         return self.__class__.__name__
 
@@ -28,8 +62,11 @@ class Evaluator(Generic[S]):
 class SequentialEvaluator(Evaluator[S]):
 
     def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
-        for solution in solution_list:
-            Evaluator.evaluate_solution(solution, problem)
+        if problem.supports_batch_evaluation():
+            Evaluator.evaluate_solution_list_in_batch(solution_list, problem)
+        else:
+            for solution in solution_list:
+                Evaluator.evaluate_solution(solution, problem)
 
         return solution_list
 
@@ -37,9 +74,260 @@ class SequentialEvaluator(Evaluator[S]):
 class MapEvaluator(Evaluator[S]):
 
     def __init__(self, processes=None):
-        self.pool = ThreadPool(processes)
+        self.processes = processes if processes else cpu_count()
+        self.pool = ThreadPool(self.processes)
+
+    def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
+        if problem.supports_batch_evaluation():
+            chunk_size = max(1, ceil(len(solution_list) / self.processes))
+            chunks = [solution_list[i:i + chunk_size] for i in range(0, len(solution_list), chunk_size)]
+            self.pool.map(lambda chunk: Evaluator[S].evaluate_solution_list_in_batch(chunk, problem), chunks)
+        else:
+            self.pool.map(lambda solution: Evaluator[S].evaluate_solution(solution, problem), solution_list)
+
+        return solution_list
+
+
+# Problem held by each worker process of a ProcessPoolEvaluator (set once by the pool initializer)
+_worker_problem = None
+
+
+def _initialize_worker(problem: Problem) -> None:
+    global _worker_problem
+    _worker_problem = problem
+
+
+def _start_worker_pool(processes: int, problem: Problem) -> Pool:
+    try:
+        pickle.dumps(problem)
+    except (pickle.PicklingError, AttributeError, TypeError) as error:
+        raise Exception('The problem {} cannot be pickled, so it cannot be sent to worker processes '
+                        '(define it at module level or use MapEvaluator instead): {}'
+                        .format(problem.get_name(), error))
+
+    return Pool(processes, initializer=_initialize_worker, initargs=(problem,))
+
+
+def _evaluate_chunk(chunk: List[list]) -> List[Tuple[list, list, dict]]:
+    """ Evaluates a chunk of variable vectors in a worker process.
+
+    :return: For each vector, its (possibly repaired) variables, its objectives and its attributes. """
+    problem = _worker_problem
+
+    if problem.supports_batch_evaluation():
+        X = np.asarray(chunk)
+        F, G = problem.evaluate_batch(X)
+        attributes = [{'overall_constraint_violation': float(g)} if problem.number_of_constraints > 0 else {}
+                      for g in G]
+
+        return list(zip(X.tolist(), F.tolist(), attributes))
+
+    result = []
+    for variables in chunk:
+        solution = problem.create_solution()
+        solution.variables = variables
+        Evaluator.evaluate_solution(solution, problem)
+        result.append((solution.variables, solution.objectives, solution.attributes))
+
+    return result
+
+
+class ProcessPoolEvaluator(Evaluator[S]):
+
+    def __init__(self, processes: int = None, chunk_size: int = None):
+        """ Evaluator backed by a pool of persistent worker processes, so CPU-bound problems are not serialized
+        by the GIL. The problem is shipped once to every worker; afterwards only the variable vectors travel to the
+        workers and only the variables, objectives and attributes of each solution travel back.
+
+        .. note::
+           The problem must be picklable (e.g. defined at module level). The pool is rebuilt whenever a different
+           problem object is evaluated, but changes made to the same problem object after the first evaluation are
+           not seen by the workers.
+
+        :param processes: Number of worker processes. Default to the number of CPUs.
+        :param chunk_size: Number of solutions sent to a worker at once. Default to an even split among workers.
+        """
+        self.processes = processes if processes else cpu_count()
+        self.chunk_size = chunk_size
+        self.pool = None
+        self.problem = None
+
+    def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
+        if self.pool is None or problem is not self.problem:
+            self.__start_pool(problem)
+
+        chunk_size = self.chunk_size if self.chunk_size else max(1, ceil(len(solution_list) / self.processes))
+        chunks = [[solution.variables for solution in solution_list[i:i + chunk_size]]
+                  for i in range(0, len(solution_list), chunk_size)]
+
+        index = 0
+        for chunk_result in self.pool.map(_evaluate_chunk, chunks):
+            for variables, objectives, attributes in chunk_result:
+                solution = solution_list[index]
+                solution.variables = variables
+                solution.objectives = objectives
+                solution.attributes.update(attributes)
+                index += 1
+
+        return solution_list
+
+    def close(self) -> None:
+        """ Terminates the worker processes. """
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+            self.problem = None
+
+    def __start_pool(self, problem: Problem) -> None:
+        self.close()
+        self.pool = _start_worker_pool(self.processes, problem)
+        self.problem = problem
+
+
+# Shared memory blocks attached by each worker process of a SharedMemoryEvaluator, keyed by block name
+_worker_blocks = {}
+
+
+def _attach_shared_blocks(names: Tuple[str, str, str]) -> list:
+    from multiprocessing.shared_memory import SharedMemory
+
+    if tuple(_worker_blocks.keys()) != names:
+        for block in _worker_blocks.values():
+            block.close()
+        _worker_blocks.clear()
+
+        for name in names:
+            _worker_blocks[name] = SharedMemory(name=name)
+
+    return [_worker_blocks[name] for name in names]
+
+
+def _evaluate_shared_range(task: Tuple[Tuple[str, str, str], int, int, int]) -> None:
+    """ Evaluates rows [start, stop) of the shared variable matrix in a worker process, writing the objectives,
+    the overall constraint violation and any repaired variable in place. """
+    names, capacity, start, stop = task
+    problem = _worker_problem
+
+    variables_block, objectives_block, constraints_block = _attach_shared_blocks(names)
+    X = np.ndarray((capacity, problem.number_of_variables), dtype=float, buffer=variables_block.buf)[start:stop]
+    F = np.ndarray((capacity, problem.number_of_objectives), dtype=float, buffer=objectives_block.buf)[start:stop]
+    G = np.ndarray((capacity,), dtype=float, buffer=constraints_block.buf)[start:stop]
+
+    if problem.supports_batch_evaluation():
+        F[:], G[:] = problem.evaluate_batch(X)
+        return
+
+    for i in range(len(X)):
+        solution = problem.create_solution()
+        solution.variables = X[i].tolist()
+        Evaluator.evaluate_solution(solution, problem)
+
+        X[i] = solution.variables
+        F[i] = solution.objectives
+        G[i] = solution.attributes.get('overall_constraint_violation', 0.0)
+
+
+def _release_shared_blocks(blocks: list) -> None:
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+    blocks.clear()
+
+
+class SharedMemoryEvaluator(Evaluator[S]):
+
+    def __init__(self, processes: int = None):
+        """ Evaluator keeping the variable and objective matrices of the population in shared memory blocks.
+        Persistent worker processes read the positions and write the objectives in place by index range, so only
+        the block names and the ranges are sent between processes.
+
+        .. note::
+           Solutions must have float variables. As with :class:`ProcessPoolEvaluator`, the problem must be picklable;
+           only the overall constraint violation is written back as attribute. Requires Python 3.8 or later.
+
+        The workers and the blocks are kept between runs until :func:`close` is called (see
+        :func:`Evaluator.close`); blocks left by an evaluator garbage collected without being closed are unlinked
+        then.
+
+        :param processes: Number of worker processes. Default to the number of CPUs.
+        """
+        try:
+            from multiprocessing import shared_memory
+        except ImportError:
+            raise Exception('SharedMemoryEvaluator requires Python 3.8 or later')
+
+        self.processes = processes if processes else cpu_count()
+        self.pool = None
+        self.problem = None
+        self.capacity = 0
+        self.blocks = []
+
+        weakref.finalize(self, _release_shared_blocks, self.blocks)
 
     def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
-        self.pool.map(lambda solution: Evaluator[S].evaluate_solution(solution, problem), solution_list)
+        if len(solution_list) == 0:
+            return solution_list
+
+        if self.pool is None or problem is not self.problem:
+            from multiprocessing import resource_tracker
+
+            self.close()
+            # started before the workers, so that they share it and the blocks are only unlinked by this process
+            resource_tracker.ensure_running()
+            self.pool = _start_worker_pool(self.processes, problem)
+            self.problem = problem
+
+        if self.capacity < len(solution_list):
+            self.__allocate_blocks(len(solution_list))
+
+        size = len(solution_list)
+        X, F, G = self.__get_matrices()
+        X[:size] = [solution.variables for solution in solution_list]
+
+        names = tuple(block.name for block in self.blocks)
+        chunk_size = max(1, ceil(size / self.processes))
+        tasks = [(names, self.capacity, start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+        self.pool.map(_evaluate_shared_range, tasks)
+
+        for i, solution in enumerate(solution_list):
+            solution.variables = X[i].tolist()
+            solution.objectives = F[i].tolist()
+            if problem.number_of_constraints > 0:
+                solution.attributes['overall_constraint_violation'] = float(G[i])
 
         return solution_list
+
+    def close(self) -> None:
+        """ Terminates the worker processes and releases the shared memory blocks. """
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+            self.problem = None
+
+        self.__release_blocks()
+
+    def __get_matrices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        variables_block, objectives_block, constraints_block = self.blocks
+
+        return np.ndarray((self.capacity, self.problem.number_of_variables), dtype=float, buffer=variables_block.buf), \
+            np.ndarray((self.capacity, self.problem.number_of_objectives), dtype=float, buffer=objectives_block.buf), \
+            np.ndarray((self.capacity,), dtype=float, buffer=constraints_block.buf)
+
+    def __allocate_blocks(self, capacity: int) -> None:
+        from multiprocessing.shared_memory import SharedMemory
+
+        self.__release_blocks()
+
+        # the list is extended in place, as the finalizer holds it
+        item_size = np.dtype(float).itemsize
+        self.blocks.extend([SharedMemory(create=True, size=capacity * self.problem.number_of_variables * item_size),
+                            SharedMemory(create=True, size=capacity * self.problem.number_of_objectives * item_size),
+                            SharedMemory(create=True, size=capacity * item_size)])
+        self.capacity = capacity
+
+    def __release_blocks(self) -> None:
+        _release_shared_blocks(self.blocks)
+        self.capacity = 0
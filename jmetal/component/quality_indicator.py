@@ -1,6 +1,10 @@
+import random
 from abc import ABCMeta, abstractmethod
+from collections import deque
 from typing import List, TypeVar
 
+import numpy as np
+
 from jmetal.core.solution import Solution
 
 """
@@ -34,6 +38,11 @@ class HyperVolume(Metric):
       Computation, pages 1157-1163, Vancouver, Canada, July 2006.
 
     Minimization is implicitly assumed here!
+
+    Fronts with two objectives are computed with an exact O(n log n) sweep (:func:`_hv_2d`), fronts with three
+    objectives with an exact sweep that is O(n^2) in the worst case (:func:`_hv_3d`) and fronts with four to ten
+    objectives with the WFG algorithm (:func:`_hv_wfg`); the dimension-sweep algorithm above is used for any other
+    number of objectives.
     """
 
     def __init__(self, reference_point: list):
@@ -75,11 +84,215 @@ class HyperVolume(Metric):
             # in the HV computation
             for j in range(len(relevant_points)):
                 relevant_points[j] = [relevant_points[j][i] - reference_point[i] for i in range(dimensions)]
+
+        if len(relevant_points) == 0:
+            return 0.0
+        elif dimensions == 2:
+            return self._hv_2d(np.asarray(relevant_points, dtype=float))
+        elif dimensions == 3:
+            return self._hv_3d(np.asarray(relevant_points, dtype=float))
+        elif dimensions <= 10:
+            return self._hv_wfg(np.asarray(relevant_points, dtype=float))
+
+        return self._hv_dimension_sweep(relevant_points)
+
+    def contributions(self, front: List[Solution]) -> List[float]:
+        """ Exclusive hypervolume contribution of every solution of the front: the hypervolume lost if the solution
+        is removed. Solutions not dominating the reference point, dominated solutions and repeated solutions
+        contribute 0.
+
+        The non-dominated solutions of bi-objective fronts are swept once, in O(n log n); a solution that is the only
+        one dominating some other solution is corrected as below. With more objectives, the contribution of a
+        non-dominated solution is the volume of its box minus the hypervolume of the other solutions limited to that
+        box, which takes one :func:`_hv_3d` sweep per solution for three objectives.
+
+        :return: The contributions, in the order of the front.
+        """
+        if len(front) == 0:
+            return []
+
+        points = np.array([solution.objectives for solution in front], dtype=float) - \
+            np.asarray(self.referencePoint, dtype=float)
+        relevant = np.all(points <= 0.0, axis=1)
+        contributions = np.zeros(len(front))
+
+        if np.any(relevant):
+            contributions[relevant] = self.__exclusive_contributions(points[relevant])
+
+        return contributions.tolist()
+
+    def __exclusive_contributions(self, points: np.ndarray) -> np.ndarray:
+        """ Contributions of points translated so that the reference point is [0, ..., 0]. """
+        dimensions = points.shape[1]
+
+        # number of other points weakly dominating each point and, among them, of copies, by blocks of rows
+        dominators = np.zeros(len(points), dtype=int)
+        copies = np.zeros(len(points), dtype=int)
+        for start in range(0, len(points), 256):
+            block = points[start:start + 256, None, :]
+            diagonal = (np.arange(len(block)), np.arange(start, start + len(block)))
+            dominates = np.all(block <= points[None, :, :], axis=2)
+            dominates[diagonal] = False
+            equals = np.all(block == points[None, :, :], axis=2)
+            equals[diagonal] = False
+            dominators += np.sum(dominates, axis=0)
+            copies += np.sum(equals, axis=0)
+        non_dominated = np.flatnonzero(dominators == copies)
+
+        contributions = np.zeros(len(points))
+        if dimensions == 2:
+            # repeated points cover the same volume, so a single copy of each one is swept
+            _, first = np.unique(points[non_dominated], axis=0, return_index=True)
+            swept = non_dominated[first]
+            contributions[swept] = self._hv_contributions_2d(points[swept])
+
+        contributions[copies > 0] = 0.0
+        non_dominated = non_dominated[copies[non_dominated] == 0]
+
+        for i in non_dominated.tolist():
+            if dimensions == 2:
+                dominates_alone = np.all(points[i] <= points, axis=1) & (dominators - copies == 1)
+                dominates_alone[i] = False
+                if not np.any(dominates_alone):
+                    continue
+
+            # the volume of the box of the point not covered by the other points, limited to the box
+            others = np.maximum(np.delete(points, i, axis=0), points[i])
+            contributions[i] = float(np.prod(-points[i])) - self.__volume(others)
+
+        return contributions
+
+    def __volume(self, points: np.ndarray) -> float:
+        if len(points) == 0:
+            return 0.0
+        elif points.shape[1] == 2:
+            return self._hv_2d(points)
+        elif points.shape[1] == 3:
+            return self._hv_3d(points)
+        elif points.shape[1] <= 10:
+            return self._hv_wfg(points)
+
+        return self._hv_dimension_sweep(points.tolist())
+
+    def _hv_dimension_sweep(self, relevant_points: list) -> float:
+        """ General Fonseca-Paquete dimension sweep over points already translated so that the reference point is
+        [0, ..., 0]. """
+        dimensions = len(self.referencePoint)
+
+        # the recursive sweep can miscount a dominated point tied with its dominator in some objective
+        relevant_points = self.__non_dominated(np.asarray(relevant_points, dtype=float)).tolist()
+
         self._pre_process(relevant_points)
         bounds = [-1.0e308] * dimensions
 
         return self._hv_recursive(dimensions - 1, len(relevant_points), bounds)
 
+    @staticmethod
+    def _hv_wfg(points: np.ndarray) -> float:
+        """ Exact hypervolume of points translated so that the reference point is [0, ..., 0], by the WFG algorithm:
+
+        * L. While, L. Bradstreet, and L. Barone. A fast way of calculating exact hypervolumes. IEEE Transactions on
+          Evolutionary Computation, 16(1):86-95, 2012.
+
+        The hypervolume is the sum of the exclusive hypervolumes of the points with respect to the following ones,
+        each computed from the non-dominated subset of the following points limited by the point. The points are
+        sorted by decreasing last objective, so that the limited points share its value and are sliced to one
+        objective less; the :func:`_hv_3d` sweep ends the recursion. Objectives are reordered so that the ones with
+        the fewest distinct values are sliced first.
+        """
+        points = HyperVolume.__non_dominated(points)
+        distinct_values = [len(np.unique(points[:, i])) for i in range(points.shape[1])]
+        points = points[:, np.argsort(-np.asarray(distinct_values), kind='mergesort')]
+
+        return HyperVolume.__wfg(points)
+
+    @staticmethod
+    def __wfg(points: np.ndarray) -> float:
+        if len(points) == 0:
+            return 0.0
+        elif len(points) == 1:
+            return float(np.prod(-points[0]))
+        elif points.shape[1] == 2:
+            return HyperVolume._hv_2d(points)
+        elif points.shape[1] == 3:
+            return HyperVolume._hv_3d(points)
+
+        points = points[np.argsort(-points[:, -1], kind='mergesort')]
+        boxes = np.prod(-points[:, :-1], axis=1)
+
+        volume = 0.0
+        for k in range(len(points)):
+            limited = np.maximum(points[k + 1:, :-1], points[k, :-1])
+            exclusive = boxes[k] - HyperVolume.__wfg(HyperVolume.__non_dominated(limited))
+            volume += -points[k, -1] * exclusive
+
+        return volume
+
+    @staticmethod
+    def __non_dominated(points: np.ndarray) -> np.ndarray:
+        """ Points not weakly dominated by another one, keeping the first of repeated points. """
+        if len(points) < 2:
+            return points
+
+        dominates = np.all(points[:, None, :] <= points[None, :, :], axis=2)
+        earlier_or_better = np.triu(np.ones(dominates.shape, dtype=bool), 1) | ~dominates.T
+
+        return points[~np.any(dominates & earlier_or_better, axis=0)]
+
+    @staticmethod
+    def _hv_2d(points: np.ndarray) -> float:
+        """ Exact bi-objective hypervolume of points translated so that the reference point is [0, 0]. The points
+        are sorted by the first objective and each one adds the slab below the lowest second objective seen so far.
+        """
+        order = np.lexsort((points[:, 1], points[:, 0]))
+        x = points[order, 0]
+        lowest_y = np.minimum.accumulate(points[order, 1])
+        previous_lowest_y = np.concatenate(([0.0], lowest_y[:-1]))
+
+        return float(np.sum(-x * (previous_lowest_y - lowest_y)))
+
+    @staticmethod
+    def _hv_3d(points: np.ndarray) -> float:
+        """ Exact three-objective hypervolume of points translated so that the reference point is [0, 0, 0]
+        (Beume et al. sweep). The points are swept by the third objective while the non-dominated staircase of the
+        first two objectives and its area are maintained in a :class:`Staircase`, whose skip list inserts and removes
+        every point in O(log n) expected time, so that the sweep is O(n log n) expected.
+        """
+        points = points[np.lexsort((points[:, 1], points[:, 0], points[:, 2]))]
+
+        staircase = Staircase()
+        volume = 0.0
+        previous_z = points[0, 2]
+
+        for x, y, z in points.tolist():
+            volume += staircase.area * (z - previous_z)
+            previous_z = z
+            staircase.add(x, y)
+
+        return volume + staircase.area * (0.0 - previous_z)
+
+    @staticmethod
+    def _hv_contributions_2d(points: np.ndarray) -> np.ndarray:
+        """ Exclusive contributions of mutually non-dominated bi-objective points translated so that the reference
+        point is [0, 0]. Sorted by the first objective, they form a staircase and each one contributes the rectangle
+        between its neighbors.
+        """
+        contributions = np.zeros(len(points))
+        order = np.lexsort((points[:, 1], points[:, 0]))
+
+        # the staircase: indexes of the points whose second objective is lower than the one of every previous point
+        staircase = []
+        for i in order.tolist():
+            if len(staircase) == 0 or points[i, 1] < points[staircase[-1], 1]:
+                staircase.append(i)
+
+        for k, i in enumerate(staircase):
+            next_x = points[staircase[k + 1], 0] if k + 1 < len(staircase) else 0.0
+            previous_y = points[staircase[k - 1], 1] if k > 0 else 0.0
+            contributions[i] = (next_x - points[i, 0]) * (previous_y - points[i, 1])
+
+        return contributions
+
     def _hv_recursive(self, dim_index: int, length: int, bounds: list):
         """Recursive call to hypervolume calculation.
 
@@ -182,6 +395,596 @@ class HyperVolume(Metric):
         return 'Hypervolume'
 
 
+class MonteCarloHyperVolume(Metric):
+    """ Hypervolume estimation by Monte Carlo sampling, for fronts with many objectives where the exact algorithm of
+    :class:`HyperVolume` is intractable. Points are drawn uniformly in the box between the ideal point of the front
+    and the reference point, in blocks of `block_size` points whose dominance is tested in bulk, until the
+    confidence interval of the estimate is narrower than `relative_width` times the estimate or `max_samples`
+    points have been drawn.
+
+    After :func:`compute`, `estimate` holds the returned estimate, `standard_error` its standard error, `margin` the
+    half width of its confidence interval and `number_of_samples` the number of points drawn. Given a `seed`, every
+    computation draws the same numbers, so that unchanged fronts get the same estimate.
+    """
+
+    def __init__(self, reference_point: list, relative_width: float = 0.01, z: float = 1.96,
+                 block_size: int = 10000, max_samples: int = 1000000, seed: int = None):
+        """
+        :param relative_width: Width of the confidence interval, relative to the estimate, at which sampling stops.
+        :param z: Half width of the confidence interval in standard errors (1.96 for a 95% confidence level).
+        :param block_size: Number of points drawn between two checks of the interval.
+        :param max_samples: Maximum number of points drawn.
+        :param seed: Seed of the random numbers of every computation.
+        """
+        if z <= 0.0:
+            raise Exception('The half width of the confidence interval must be positive: {}'.format(z))
+        if block_size < 1 or max_samples < 1:
+            raise Exception('The block size and the maximum number of samples must be positive')
+
+        self.referencePoint = reference_point
+        self.relative_width = relative_width
+        self.z = z
+        self.block_size = block_size
+        self.max_samples = max_samples
+        self.seed = seed
+
+        self.estimate = 0.0
+        self.standard_error = 0.0
+        self.margin = 0.0
+        self.number_of_samples = 0
+
+    def compute(self, front: List[Solution]) -> float:
+        reference_point = np.asarray(self.referencePoint, dtype=float)
+        points = np.array([solution.objectives for solution in front], dtype=float).reshape(-1, len(reference_point))
+        points = points[np.all(points <= reference_point, axis=1)]
+
+        self.estimate = 0.0
+        self.standard_error = 0.0
+        self.margin = 0.0
+        self.number_of_samples = 0
+
+        if len(points) == 0:
+            return 0.0
+
+        ideal_point = np.min(points, axis=0)
+        box = reference_point - ideal_point
+        box_volume = float(np.prod(box))
+
+        random = np.random.RandomState(self.seed)
+        dominated = 0
+
+        while self.number_of_samples < self.max_samples:
+            size = min(self.block_size, self.max_samples - self.number_of_samples)
+            samples = ideal_point + random.random_sample((size, len(reference_point))) * box
+
+            dominated += self.__count_dominated(samples, points)
+            self.number_of_samples += size
+
+            ratio = dominated / self.number_of_samples
+            self.estimate = box_volume * ratio
+            self.standard_error = box_volume * float(np.sqrt(ratio * (1.0 - ratio) / self.number_of_samples))
+            self.margin = self.z * self.standard_error
+
+            if 2.0 * self.margin <= self.relative_width * self.estimate:
+                break
+
+        return self.estimate
+
+    def get_confidence_interval(self) -> tuple:
+        """ :return: Confidence interval of the last estimate. """
+        return self.estimate - self.margin, self.estimate + self.margin
+
+    @staticmethod
+    def __count_dominated(samples: np.ndarray, points: np.ndarray) -> int:
+        """ Number of samples weakly dominated by some point, testing groups of samples to bound the memory used. """
+        group_size = max(1, 2 ** 22 // points.size)
+
+        dominated = 0
+        for start in range(0, len(samples), group_size):
+            group = samples[start:start + group_size]
+            dominated += int(np.sum(np.any(np.all(points[None, :, :] <= group[:, None, :], axis=2), axis=1)))
+
+        return dominated
+
+    def get_name(self) -> str:
+        return 'Monte Carlo hypervolume'
+
+
+class HyperVolumeTracker:
+    """ Keeps track of the hypervolume of an evolving front (e.g. the leaders archive of a PSO) to drive stopping
+    decisions. The front is only measured every `frequency` updates and, if `only_on_change` is set, the
+    hypervolume is only recomputed when the objective vectors of the front differ from the last measured ones.
+    Measured values are kept in a history bounded to the last `history_size` entries.
+
+    With an exact :class:`HyperVolume` of two objectives, the tracking is incremental: the :class:`Staircase` of the
+    last measured front is kept and, when the front changes, the area gained by every point that entered it is
+    added and the rectangle dominated alone by every point that left it is subtracted, in O(log n) expected time
+    each, after a vectorized comparison of the two fronts. The solutions of the front uncovered by a point that left
+    are found with a vectorized scan and added back. Any other indicator measures a changed front from scratch with
+    `hypervolume.compute`.
+
+    The hypervolume can be estimated by another indicator, e.g., a :class:`MonteCarloHyperVolume` for many
+    objectives; the half width of the confidence interval of its estimates (its `margin`) is then kept, so that
+    stopping conditions can ignore improvements within the error of the estimates.
+    """
+
+    def __init__(self, reference_point: list, frequency: int = 1, only_on_change: bool = True,
+                 history_size: int = 1000, hypervolume: Metric = None, incremental: bool = True):
+        """ :param reference_point: Reference point of the hypervolume.
+        :param frequency: Number of updates between two measurements.
+        :param only_on_change: If True, the hypervolume is not recomputed when the front has not changed.
+        :param history_size: Maximum number of measurements kept in the history.
+        :param hypervolume: Indicator computing the hypervolume. Default to an exact :class:`HyperVolume` with
+            `reference_point`.
+        :param incremental: If True and the indicator is an exact bi-objective :class:`HyperVolume`, changed fronts
+            are measured incrementally.
+        """
+        if frequency < 1:
+            raise Exception('The frequency must be at least one: {}'.format(frequency))
+
+        self.hypervolume = hypervolume if hypervolume else HyperVolume(reference_point)
+        self.frequency = frequency
+        self.only_on_change = only_on_change
+        self.history = deque(maxlen=history_size)
+
+        self.value = 0.0
+        self.previous_value = 0.0
+        self.margin = 0.0
+        self.previous_margin = 0.0
+        self.measured = False
+        self.number_of_updates = 0
+        self.number_of_computations = 0
+
+        self.__last_objectives = None
+
+        self.incremental = incremental and type(self.hypervolume) is HyperVolume and \
+            self.hypervolume.referencePoint is not None and len(self.hypervolume.referencePoint) == 2
+        self.__staircase = Staircase()
+        self.__points = np.empty((0, 2))
+        self.__keys = np.empty(0, dtype=complex)
+
+    def update(self, front: List[Solution]) -> bool:
+        """ Measures the front if it is its turn.
+
+        :return: True if the front has been measured in this update. """
+        self.measured = self.number_of_updates % self.frequency == 0
+        self.number_of_updates += 1
+
+        if self.measured:
+            objectives = np.asarray([solution.objectives for solution in front], dtype=float)
+            changed = self.__last_objectives is None or not np.array_equal(objectives, self.__last_objectives)
+
+            self.previous_value = self.value
+            self.previous_margin = self.margin
+            if changed or not self.only_on_change:
+                if self.incremental:
+                    self.value = self.__update_staircase(objectives)
+                else:
+                    self.value = self.hypervolume.compute(front)
+                self.margin = getattr(self.hypervolume, 'margin', 0.0)
+                self.number_of_computations += 1
+                self.__last_objectives = objectives
+
+            self.history.append(self.value)
+
+        return self.measured
+
+    def __update_staircase(self, objectives: np.ndarray) -> float:
+        """ Applies the difference between the last measured front and `objectives` to the staircase.
+
+        :return: The hypervolume of `objectives`. """
+        reference_point = np.asarray(self.hypervolume.referencePoint, dtype=float)
+        points = objectives.reshape(-1, 2)
+        points = points[np.all(points <= reference_point, axis=1)] - reference_point
+        keys = points[:, 0] + 1j * points[:, 1]
+
+        # points entering first, so that the ones leaving are already dominated whenever the front improves
+        for x, y in points[~np.isin(keys, self.__keys)].tolist():
+            self.__staircase.add(x, y)
+
+        for x, y in self.__points[~np.isin(self.__keys, keys)].tolist():
+            corner = self.__staircase.remove(x, y)
+            if corner is not None:
+                right_x, left_y = corner
+                uncovered = (points[:, 0] >= x) & (points[:, 0] <= right_x) & \
+                            (points[:, 1] >= y) & (points[:, 1] <= left_y)
+                for hidden_x, hidden_y in points[uncovered].tolist():
+                    self.__staircase.add(hidden_x, hidden_y)
+
+        self.__points = points
+        self.__keys = keys
+        if len(points) == 0:
+            self.__staircase = Staircase()
+
+        return self.__staircase.area
+
+    def get_improvement(self) -> float:
+        """ :return: Difference between the last two measured values. """
+        return self.value - self.previous_value
+
+    def get_improvement_margin(self) -> float:
+        """ :return: Half width of the confidence interval of the improvement; 0 for an exact indicator. """
+        return float(np.hypot(self.margin, self.previous_margin))
+
+    def get_history(self) -> List[float]:
+        return list(self.history)
+
+
+class GenerationalDistance(Metric):
+    """ Generational distance (GD): mean Euclidean distance from every solution of a front to the nearest point of a
+    reference front. The reference front is indexed once by a :class:`KDTree`, so that each computation queries the
+    whole front in bulk, pruning most of the reference front instead of computing the full distance matrix.
+    """
+
+    def __init__(self, reference_front: List[Solution]):
+        """ :param reference_front: Solutions of the reference front (e.g., `problem.reference_front`). """
+        if len(reference_front) == 0:
+            raise Exception('The reference front is empty')
+
+        self.reference_front = reference_front
+        self.tree = KDTree(np.array([solution.objectives for solution in reference_front], dtype=float))
+
+    def compute(self, front: List[Solution]) -> float:
+        """ :return: The distance; 0 for an empty front. """
+        if len(front) == 0:
+            return 0.0
+
+        distances = self.tree.query(np.array([solution.objectives for solution in front], dtype=float),
+                                    worse=self._worse())
+
+        return float(np.mean(distances))
+
+    def _worse(self):
+        return None
+
+    def get_name(self) -> str:
+        return 'GD'
+
+
+class GenerationalDistancePlus(GenerationalDistance):
+    """ GD+: as :class:`GenerationalDistance`, but only the objectives in which a solution is worse than the
+    reference point count, so that the indicator is weakly Pareto compliant (Ishibuchi et al., EMO 2015).
+    """
+
+    def _worse(self):
+        return 'queries'
+
+    def get_name(self) -> str:
+        return 'GD+'
+
+
+class InvertedGenerationalDistance(Metric):
+    """ Inverted generational distance (IGD): mean Euclidean distance from every point of a reference front to the
+    nearest solution of a front. The reference points are kept as a matrix and queried in bulk against a
+    :class:`KDTree` of the front, built in O(n log n) by every computation.
+    """
+
+    def __init__(self, reference_front: List[Solution]):
+        """ :param reference_front: Solutions of the reference front (e.g., `problem.reference_front`). """
+        if len(reference_front) == 0:
+            raise Exception('The reference front is empty')
+
+        self.reference_front = reference_front
+        self.reference_points = np.array([solution.objectives for solution in reference_front], dtype=float)
+
+    def compute(self, front: List[Solution]) -> float:
+        """ :return: The distance; infinity for an empty front. """
+        if len(front) == 0:
+            return float('inf')
+
+        tree = KDTree(np.array([solution.objectives for solution in front], dtype=float))
+
+        return float(np.mean(tree.query(self.reference_points, worse=self._worse())))
+
+    def _worse(self):
+        return None
+
+    def get_name(self) -> str:
+        return 'IGD'
+
+
+class InvertedGenerationalDistancePlus(InvertedGenerationalDistance):
+    """ IGD+: as :class:`InvertedGenerationalDistance`, but only the objectives in which a solution is worse than the
+    reference point count, so that the indicator is weakly Pareto compliant (Ishibuchi et al., EMO 2015).
+    """
+
+    def _worse(self):
+        return 'tree'
+
+    def get_name(self) -> str:
+        return 'IGD+'
+
+
+class AdditiveEpsilon(Metric):
+    """ Additive epsilon indicator: the minimum value to add to every objective of a front so that it weakly
+    dominates a reference front, i.e., the maximum over the reference points of the minimum over the solutions of
+    the largest difference of their objectives.
+
+    The reductions are computed over the objective matrices by broadcasting, by blocks of reference points so that
+    no more than `chunk_size` (reference point, solution) pairs are materialized at once.
+    """
+
+    def __init__(self, reference_front: List[Solution], chunk_size: int = 2 ** 20):
+        """ :param reference_front: Solutions of the reference front (e.g., `problem.reference_front`).
+        :param chunk_size: Maximum number of (reference point, solution) pairs compared at once.
+        """
+        if len(reference_front) == 0:
+            raise Exception('The reference front is empty')
+
+        self.reference_front = reference_front
+        self.reference_points = np.array([solution.objectives for solution in reference_front], dtype=float)
+        self.chunk_size = chunk_size
+
+    def compute(self, front: List[Solution]) -> float:
+        """ :return: The indicator; infinity for an empty front. """
+        if len(front) == 0:
+            return float('inf')
+
+        points = np.array([solution.objectives for solution in front], dtype=float)
+        rows = max(1, self.chunk_size // len(points))
+
+        value = -float('inf')
+        for start in range(0, len(self.reference_points), rows):
+            reference_points = self.reference_points[start:start + rows]
+
+            # largest gap of every (reference point, solution) pair, accumulated objective by objective in place
+            gaps = self._gaps(points[None, :, 0], reference_points[:, 0, None])
+            for i in range(1, points.shape[1]):
+                np.maximum(gaps, self._gaps(points[None, :, i], reference_points[:, i, None]), out=gaps)
+
+            value = max(value, float(np.max(np.min(gaps, axis=1))))
+
+        return value
+
+    def _gaps(self, objectives: np.ndarray, reference_objectives: np.ndarray) -> np.ndarray:
+        return objectives - reference_objectives
+
+    def get_name(self) -> str:
+        return 'EP+'
+
+
+class MultiplicativeEpsilon(AdditiveEpsilon):
+    """ Multiplicative epsilon indicator: the minimum factor to multiply every objective of a front by so that it
+    weakly dominates a reference front. All the objectives must be positive.
+    """
+
+    def __init__(self, reference_front: List[Solution], chunk_size: int = 2 ** 20):
+        super(MultiplicativeEpsilon, self).__init__(reference_front, chunk_size)
+
+        if np.any(self.reference_points <= 0.0):
+            raise Exception('The multiplicative epsilon requires positive objectives')
+
+    def compute(self, front: List[Solution]) -> float:
+        if any(objective <= 0.0 for solution in front for objective in solution.objectives):
+            raise Exception('The multiplicative epsilon requires positive objectives')
+
+        return super(MultiplicativeEpsilon, self).compute(front)
+
+    def _gaps(self, objectives: np.ndarray, reference_objectives: np.ndarray) -> np.ndarray:
+        return objectives / reference_objectives
+
+    def get_name(self) -> str:
+        return 'EP*'
+
+
+class KDTree:
+    """ KD-tree over a fixed set of points answering nearest-neighbor queries for many points at once.
+
+    Nodes split the widest objective of their bounding box at the median, down to leaves of `leaf_size` points;
+    leaves are large because their distances are computed as matrices, which is cheaper than visiting more nodes.
+    Queries are searched together: at each node, the queries whose lower bound of the distance to the bounding box
+    is not below their best distance so far go on, each one to the nearest child first.
+    """
+
+    def __init__(self, points: np.ndarray, leaf_size: int = 256):
+        self.points = np.array(points, dtype=float)
+        self.leaf_size = leaf_size
+
+        self.lower = []
+        self.upper = []
+        self.ranges = []
+        self.children = []
+
+        if len(self.points) > 0:
+            self.__build(0, len(self.points))
+
+    def query(self, queries: np.ndarray, worse: str = None) -> np.ndarray:
+        """ Distance from every query to its nearest point.
+
+        :param queries: Matrix of queries, one per row.
+        :param worse: If 'queries' ('tree'), only the objectives in which the query (the point of the tree) is
+            greater count, as in GD+ (IGD+); otherwise, the distance is Euclidean.
+        :return: The distances, in the order of the queries.
+        """
+        if worse not in (None, 'queries', 'tree'):
+            raise Exception('Unknown distance: {}'.format(worse))
+
+        queries = np.asarray(queries, dtype=float)
+        best = np.full(len(queries), np.inf)
+
+        if len(self.points) > 0 and len(queries) > 0:
+            self.__search(0, np.arange(len(queries)), queries, best, worse)
+
+        return np.sqrt(best)
+
+    def __build(self, start: int, end: int) -> int:
+        points = self.points[start:end]
+        node = len(self.lower)
+
+        self.lower.append(np.min(points, axis=0))
+        self.upper.append(np.max(points, axis=0))
+        self.ranges.append((start, end))
+        self.children.append(None)
+
+        widths = self.upper[node] - self.lower[node]
+        if end - start > self.leaf_size and np.max(widths) > 0.0:
+            objective = int(np.argmax(widths))
+            middle = (start + end) // 2
+            self.points[start:end] = points[np.argpartition(points[:, objective], middle - start)]
+
+            self.children[node] = (self.__build(start, middle), self.__build(middle, end))
+
+        return node
+
+    def __bound(self, node: int, queries: np.ndarray, worse: str) -> np.ndarray:
+        """ Lower bound of the squared distance from the queries to the points of the node. """
+        if worse == 'queries':
+            gaps = np.maximum(queries - self.upper[node], 0.0)
+        elif worse == 'tree':
+            gaps = np.maximum(self.lower[node] - queries, 0.0)
+        else:
+            gaps = np.maximum(self.lower[node] - queries, 0.0) + np.maximum(queries - self.upper[node], 0.0)
+
+        return np.sum(gaps * gaps, axis=1)
+
+    def __search(self, node: int, indexes: np.ndarray, queries: np.ndarray, best: np.ndarray, worse: str) -> None:
+        indexes = indexes[self.__bound(node, queries[indexes], worse) < best[indexes]]
+        if len(indexes) == 0:
+            return
+
+        if self.children[node] is None:
+            start, end = self.ranges[node]
+            differences = queries[indexes, None, :] - self.points[None, start:end, :]
+            if worse == 'queries':
+                differences = np.maximum(differences, 0.0)
+            elif worse == 'tree':
+                differences = np.minimum(differences, 0.0)
+
+            distances = np.min(np.sum(differences * differences, axis=2), axis=1)
+            best[indexes] = np.minimum(best[indexes], distances)
+            return
+
+        left, right = self.children[node]
+        left_first = self.__bound(left, queries[indexes], worse) <= self.__bound(right, queries[indexes], worse)
+        groups = ((left, right, indexes[left_first]), (right, left, indexes[~left_first]))
+
+        for nearest, _, group in groups:
+            self.__search(nearest, group, queries, best, worse)
+        for _, farthest, group in groups:
+            self.__search(farthest, group, queries, best, worse)
+
+
+class Staircase:
+    """ Non-dominated staircase of bi-objective points translated so that the reference point is [0, 0], together
+    with its area, i.e., the hypervolume of the points. Sorted by the first objective, the second one strictly
+    decreases; the points are kept in that order in a skip list, so that a point is located, inserted or removed in
+    O(log n) expected time and a point dominating k points of the staircase is inserted in O(log n + k).
+    """
+
+    class Node:
+
+        __slots__ = ('x', 'y', 'next')
+
+        def __init__(self, x: float, y: float, number_of_levels: int):
+            self.x = x
+            self.y = y
+            self.next = [None] * number_of_levels
+
+    def __init__(self, seed: int = 0):
+        """ :param seed: Seed of the levels of the skip list; it does not change any result. """
+        self.area = 0.0
+        self.size = 0
+        self.head = self.Node(0.0, 0.0, 1)
+        self.random = random.Random(seed)
+
+    def __len__(self):
+        return self.size
+
+    def add(self, x: float, y: float) -> float:
+        """ Inserts the point, unless a point of the staircase weakly dominates it, and removes the points it
+        dominates.
+
+        :return: The area gained. """
+        update = self.__predecessors(x)
+        previous = update[0]
+        following = previous.next[0]
+
+        if following is not None and following.x == x and following.y <= y:
+            return 0.0
+        if previous is not self.head and previous.y <= y:
+            return 0.0
+
+        dominated = []
+        while following is not None and following.y >= y:
+            dominated.append(following)
+            following = following.next[0]
+
+        left_y = previous.y if previous is not self.head else 0.0
+        right_x = following.x if following is not None else 0.0
+
+        gained = (left_y - y) * ((dominated[0].x if dominated else right_x) - x)
+        for i, node in enumerate(dominated):
+            next_x = dominated[i + 1].x if i + 1 < len(dominated) else right_x
+            gained += (node.y - y) * (next_x - node.x)
+
+        for node in dominated:
+            self.__unlink(update, node)
+        self.__link(update, x, y)
+        self.area += gained
+
+        return gained
+
+    def remove(self, x: float, y: float) -> tuple:
+        """ Removes the point from the staircase. The points it hid are not restored: they are not kept here.
+
+        :return: The corner (right_x, left_y) opposite to the point of the rectangle that the point dominated alone,
+            or None if the point is not in the staircase. """
+        update = self.__predecessors(x)
+        previous = update[0]
+        node = previous.next[0]
+
+        if node is None or node.x != x or node.y != y:
+            return None
+
+        left_y = previous.y if previous is not self.head else 0.0
+        right_x = node.next[0].x if node.next[0] is not None else 0.0
+
+        self.__unlink(update, node)
+        self.area -= (left_y - y) * (right_x - x)
+
+        return right_x, left_y
+
+    def __iter__(self):
+        node = self.head.next[0]
+        while node is not None:
+            yield node.x, node.y
+            node = node.next[0]
+
+    def __predecessors(self, x: float) -> list:
+        """ :return: For every level, the last node whose first objective is lower than `x`. """
+        update = [self.head] * len(self.head.next)
+        node = self.head
+        for level in reversed(range(len(self.head.next))):
+            while node.next[level] is not None and node.next[level].x < x:
+                node = node.next[level]
+            update[level] = node
+
+        return update
+
+    def __link(self, update: list, x: float, y: float) -> None:
+        number_of_levels = 1
+        while number_of_levels < 32 and self.random.random() < 0.5:
+            number_of_levels += 1
+
+        while len(self.head.next) < number_of_levels:
+            self.head.next.append(None)
+            update.append(self.head)
+
+        node = self.Node(x, y, number_of_levels)
+        for level in range(number_of_levels):
+            node.next[level] = update[level].next[level]
+            update[level].next[level] = node
+
+        self.size += 1
+
+    def __unlink(self, update: list, node: 'Node') -> None:
+        for level in range(len(node.next)):
+            if update[level].next[level] is node:
+                update[level].next[level] = node.next[level]
+
+        self.size -= 1
+
+
 class MultiList:
     """A special front structure needed by FonsecaHyperVolume.
 
@@ -1,7 +1,10 @@
 from abc import ABCMeta, abstractmethod
+from bisect import bisect_left, bisect_right
 from typing import TypeVar, List
 
-from jmetal.component.comparator import DominanceComparator
+import numpy as np
+
+from jmetal.component.comparator import DominanceComparator, dominance_matrix, get_objectives_and_violations
 
 S = TypeVar('S')
 
@@ -33,6 +36,7 @@ class FastNonDominatedRanking(Ranking[List[S]]):
 
     def __init__(self):
         super(FastNonDominatedRanking, self).__init__()
+        self.comparator = DominanceComparator()
 
     def compute_ranking(self, solution_list: List[S]):
         # number of solutions dominating solution ith
@@ -46,7 +50,7 @@ class FastNonDominatedRanking(Ranking[List[S]]):
 
         for p in range(len(solution_list) - 1):
             for q in range(p + 1, len(solution_list)):
-                dominance_test_result = DominanceComparator().compare(solution_list[p], solution_list[q])
+                dominance_test_result = self.comparator.compare(solution_list[p], solution_list[q])
                 self.number_of_comparisons += 1
 
                 if dominance_test_result == -1:
@@ -83,11 +87,263 @@ class FastNonDominatedRanking(Ranking[List[S]]):
 
 
 class EfficientNonDominatedRanking(Ranking[List[S]]):
-    """ Class implementing the EDS (efficient non-dominated sorting) algorithm. """
+    """ Class implementing the ENS (efficient non-dominated sorting) algorithm, as described in
 
-    def __init__(self):
+    * X. Zhang, Y. Tian, R. Cheng and Y. Jin, "An efficient approach to nondominated sorting for evolutionary
+      multiobjective optimization," in IEEE Transactions on Evolutionary Computation, vol. 19, no. 2, pp. 201-213,
+      Apr 2015. doi: 10.1109/TEVC.2014.2308305
+
+    The solutions are sorted lexicographically by their objectives (the most feasible ones first when they have an
+    `overall_constraint_violation`), so a solution can only be dominated by the ones before it. Each solution is
+    then compared only with the solutions already assigned to the fronts, which are visited sequentially (ENS-SS) or
+    with a binary search (ENS-BS).
+
+    .. note::
+       The fronts are the ones computed by :class:`FastNonDominatedRanking`, and the solutions of each front are in
+       the order they have in the solution list, provided either all or none of the solutions have an
+       `overall_constraint_violation`.
+    """
+
+    def __init__(self, binary_search: bool = True):
+        """ :param binary_search: Whether to use the binary search strategy (ENS-BS) or the sequential one (ENS-SS).
+        """
         super(EfficientNonDominatedRanking, self).__init__()
+        self.binary_search = binary_search
+        self.comparator = DominanceComparator()
+
+    def compute_ranking(self, solution_list: List[S]):
+        order = sorted(range(len(solution_list)),
+                       key=lambda i: (-solution_list[i].attributes.get('overall_constraint_violation', 0.0),
+                                      solution_list[i].objectives))
+
+        # fronts of indexes of solution_list; each one in the order the solutions were assigned
+        fronts = []
+        for i in order:
+            if self.binary_search:
+                rank = self.__binary_search(solution_list, fronts, i)
+            else:
+                rank = self.__sequential_search(solution_list, fronts, i)
+
+            if rank == len(fronts):
+                fronts.append([])
+            fronts[rank].append(i)
+
+        self.ranked_sublists = []
+        for rank, front in enumerate(fronts):
+            subfront = [solution_list[i] for i in sorted(front)]
+            for solution in subfront:
+                solution.attributes['dominance_ranking'] = rank
+            self.ranked_sublists.append(subfront)
+
+        return self.ranked_sublists
+
+    def __sequential_search(self, solution_list: List[S], fronts: List[List[int]], index: int) -> int:
+        for rank, front in enumerate(fronts):
+            if not self.__is_dominated(solution_list, front, index):
+                return rank
+
+        return len(fronts)
+
+    def __binary_search(self, solution_list: List[S], fronts: List[List[int]], index: int) -> int:
+        low, high = 0, len(fronts)
+        while low < high:
+            middle = (low + high) // 2
+            if self.__is_dominated(solution_list, fronts[middle], index):
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def __is_dominated(self, solution_list: List[S], front: List[int], index: int) -> bool:
+        """ Checks the front from its last solution, the closest one in the lexicographic order. """
+        for j in reversed(front):
+            self.number_of_comparisons += 1
+            if self.comparator.compare(solution_list[j], solution_list[index]) == -1:
+                return True
+
+        return False
+
+
+class DominanceMatrixRanking(Ranking[List[S]]):
+    """ Class implementing the non-dominated ranking of NSGA-II with NumPy. The dominance relation is computed as
+    boolean blocks of `chunk_size` rows, so the memory stays bounded by `chunk_size * n * m` for n solutions of m
+    objectives. A first pass counts the solutions dominating each one; the fronts are then peeled by subtracting the
+    rows of each front from the counts.
+
+    The `overall_constraint_violation` attribute is taken into account as :class:`DominanceComparator` does.
+    """
+
+    def __init__(self, chunk_size: int = 256):
+        super(DominanceMatrixRanking, self).__init__()
+        self.chunk_size = chunk_size
 
     def compute_ranking(self, solution_list: List[S]):
-        # todo
+        self.ranked_sublists = []
+        if len(solution_list) == 0:
+            return self.ranked_sublists
+
+        objectives, violations = get_objectives_and_violations(solution_list)
+
+        # number of solutions dominating solution ith
+        dominating_ith = self.__count_dominated(objectives, violations, np.arange(len(solution_list)))
+
+        remaining = np.ones(len(solution_list), dtype=bool)
+        front = np.flatnonzero(dominating_ith == 0)
+        while front.size > 0:
+            remaining[front] = False
+            rank = len(self.ranked_sublists)
+            subfront = []
+            for i in front.tolist():
+                solution_list[i].attributes['dominance_ranking'] = rank
+                subfront.append(solution_list[i])
+            self.ranked_sublists.append(subfront)
+
+            dominating_ith -= self.__count_dominated(objectives, violations, front)
+            front = np.flatnonzero(remaining & (dominating_ith == 0))
+
         return self.ranked_sublists
+
+    def __count_dominated(self, objectives: np.ndarray, violations: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """ For every solution, counts how many of the solutions of `rows` dominate it. """
+        count = np.zeros(len(objectives), dtype=int)
+
+        for start in range(0, len(rows), self.chunk_size):
+            block = rows[start:start + self.chunk_size]
+            dominates = dominance_matrix(objectives[block], violations[block], objectives, violations) == -1
+            count += np.sum(dominates, axis=0)
+            self.number_of_comparisons += dominates.size
+
+        return count
+
+
+class DimensionSweepRanking(Ranking[List[S]]):
+    """ Class implementing the non-dominated ranking of two and three objectives in O(n log n) time for typical
+    fronts. The solutions are sorted lexicographically, so a solution can only be dominated by the ones before it,
+    and each front is summarized by a structure answering whether it dominates a new solution with a binary search:
+
+    * Two objectives: the last solution of each front has its lowest second objective.
+    * Three objectives: each front keeps the staircase of its non-dominated (second, third) objective pairs.
+
+    The front of a solution is found with a binary search over the fronts, as in ENS-BS. Solutions with different
+    `overall_constraint_violation` values are ranked level by level, the most feasible first. Other numbers of
+    objectives, and lists in which only some of the solutions have a constraint violation, are ranked by the
+    `fallback` ranking.
+    """
+
+    def __init__(self, fallback: Ranking = None):
+        """ :param fallback: Ranking used for other numbers of objectives. Default to
+          :class:`EfficientNonDominatedRanking`.
+        """
+        super(DimensionSweepRanking, self).__init__()
+        self.fallback = fallback if fallback is not None else EfficientNonDominatedRanking()
+
+    def compute_ranking(self, solution_list: List[S]):
+        self.ranked_sublists = []
+        if len(solution_list) == 0:
+            return self.ranked_sublists
+
+        number_of_objectives = len(solution_list[0].objectives)
+        violations = [solution.attributes.get('overall_constraint_violation') for solution in solution_list]
+        with_violation = sum(violation is not None for violation in violations)
+
+        if number_of_objectives not in (2, 3) or 0 < with_violation < len(solution_list):
+            number_of_comparisons = self.fallback.number_of_comparisons
+            self.ranked_sublists = self.fallback.compute_ranking(solution_list)
+            self.number_of_comparisons += self.fallback.number_of_comparisons - number_of_comparisons
+            return self.ranked_sublists
+
+        levels = {}
+        for i, violation in enumerate(violations):
+            levels.setdefault(violation if violation is not None else 0.0, []).append(i)
+
+        for violation in sorted(levels, reverse=True):
+            indexes = sorted(levels[violation], key=lambda i: solution_list[i].objectives)
+            if number_of_objectives == 2:
+                fronts = self.__sweep_two_objectives(solution_list, indexes)
+            else:
+                fronts = self.__sweep_three_objectives(solution_list, indexes)
+
+            for front in fronts:
+                rank = len(self.ranked_sublists)
+                subfront = [solution_list[i] for i in sorted(front)]
+                for solution in subfront:
+                    solution.attributes['dominance_ranking'] = rank
+                self.ranked_sublists.append(subfront)
+
+        return self.ranked_sublists
+
+    def __sweep_two_objectives(self, solution_list: List[S], indexes: List[int]) -> List[List[int]]:
+        # (second, first) objectives of the last solution of each front: it dominates a solution with a greater key
+        keys = []
+        fronts = []
+        for i in indexes:
+            first, second = solution_list[i].objectives
+            key = (second, first)
+
+            rank = bisect_left(keys, key)
+            self.number_of_comparisons += max(1, len(keys).bit_length())
+
+            if rank == len(fronts):
+                keys.append(key)
+                fronts.append([i])
+            else:
+                keys[rank] = key
+                fronts[rank].append(i)
+
+        return fronts
+
+    def __sweep_three_objectives(self, solution_list: List[S], indexes: List[int]) -> List[List[int]]:
+        # per front, the staircase of (second, third) objectives: the second increases and the third decreases.
+        # Each step keeps the lowest first objective with which it was reached
+        seconds = []
+        thirds = []
+        firsts = []
+        fronts = []
+        for i in indexes:
+            first, second, third = solution_list[i].objectives
+
+            low, high = 0, len(fronts)
+            while low < high:
+                middle = (low + high) // 2
+                if self.__is_dominated(seconds[middle], thirds[middle], firsts[middle], first, second, third):
+                    low = middle + 1
+                else:
+                    high = middle
+
+            if low == len(fronts):
+                seconds.append([])
+                thirds.append([])
+                firsts.append([])
+                fronts.append([])
+
+            self.__add_step(seconds[low], thirds[low], firsts[low], first, second, third)
+            fronts[low].append(i)
+
+        return fronts
+
+    def __is_dominated(self, seconds: List[float], thirds: List[float], firsts: List[float],
+                       first: float, second: float, third: float) -> bool:
+        self.number_of_comparisons += 1
+        index = bisect_right(seconds, second) - 1
+        if index < 0 or thirds[index] > third:
+            return False
+
+        return seconds[index] != second or thirds[index] != third or firsts[index] < first
+
+    @staticmethod
+    def __add_step(seconds: List[float], thirds: List[float], firsts: List[float],
+                   first: float, second: float, third: float) -> None:
+        start = bisect_left(seconds, second)
+        if start < len(seconds) and seconds[start] == second and thirds[start] == third:
+            return
+
+        # the steps in [start, end) have a second objective not lower and a third one not lower than the new one
+        end = start
+        while end < len(seconds) and thirds[end] >= third:
+            end += 1
+
+        seconds[start:end] = [second]
+        thirds[start:end] = [third]
+        firsts[start:end] = [first]
+
@@ -1,6 +1,12 @@
+import random
 import unittest
 
-from jmetal.component.archive import NonDominatedSolutionListArchive, BoundedArchive, CrowdingDistanceArchive, Archive
+from jmetal.component.archive import NonDominatedSolutionListArchive, BoundedArchive, CrowdingDistanceArchive, \
+    Archive, BiObjectiveNonDominatedSolutionListArchive, NonDominatedSolutionTreeArchive, \
+    CrowdingDistanceArchiveWithReferencePoint, HypervolumeContributionArchive
+from jmetal.component.comparator import SolutionAttributeComparator
+from jmetal.component.density_estimator import CrowdingDistance
+from jmetal.component.quality_indicator import HyperVolume
 from jmetal.core.solution import Solution
 
 
@@ -19,6 +25,25 @@ class ArchiveTestCases(unittest.TestCase):
     def test_should_constructor_create_an_empty_list(self):
         self.assertEqual(0, len(self.archive.solution_list))
 
+    def test_should_add_all_return_whether_each_solution_is_in_the_archive_after_the_batch(self):
+        archives = [NonDominatedSolutionListArchive(), BiObjectiveNonDominatedSolutionListArchive(),
+                    NonDominatedSolutionTreeArchive(), CrowdingDistanceArchive(5),
+                    HypervolumeContributionArchive(5, [10.0, 10.0]),
+                    CrowdingDistanceArchiveWithReferencePoint(5, [10.0, 10.0])]
+
+        for archive in archives:
+            solutions = []
+            # accepted first, then dominated by later solutions of the same batch, repeated, and truncated
+            for objectives in [[9.0, 9.0], [5.0, 5.0], [5.0, 5.0]] + [[float(i), 9.0 - i] for i in range(10)]:
+                solution = Solution(1, 2)
+                solution.objectives = objectives
+                solutions.append(solution)
+
+            result = archive.add_all(solutions)
+
+            self.assertEqual([solution in archive.solution_list for solution in solutions], result)
+            self.assertFalse(result[0] or result[1] or result[2])
+
 
 class BoundedArchiveTestCases(unittest.TestCase):
 
@@ -113,12 +138,312 @@ class NonDominatedSolutionListArchiveTestCases(unittest.TestCase):
         self.assertTrue(solution1 in self.archive.solution_list
                         or solution3 in self.archive.solution_list)
 
+    def test_should_add_all_return_which_solutions_entered_the_archive(self):
+        solution1 = Solution(1, 2)
+        solution1.objectives = [2.0, 2.0]
+        self.archive.add(solution1)
+
+        solution2 = Solution(1, 2)
+        solution2.objectives = [1.0, 1.0]
+        solution3 = Solution(1, 2)
+        solution3.objectives = [3.0, 3.0]
+        solution4 = Solution(1, 2)
+        solution4.objectives = [1.0, 1.0]
+        solution5 = Solution(1, 2)
+        solution5.objectives = [0.0, 4.0]
+
+        self.assertEqual([True, False, False, True], self.archive.add_all([solution2, solution3, solution4, solution5]))
+        self.assertEqual([solution2, solution5], self.archive.solution_list)
+
+    def test_should_add_all_honor_the_constraint_violation(self):
+        feasible_solution = Solution(1, 2)
+        feasible_solution.objectives = [2.0, 2.0]
+        feasible_solution.attributes['overall_constraint_violation'] = 0.0
+        infeasible_solution = Solution(1, 2)
+        infeasible_solution.objectives = [1.0, 1.0]
+        infeasible_solution.attributes['overall_constraint_violation'] = -1.0
+
+        self.assertEqual([False, True], self.archive.add_all([infeasible_solution, feasible_solution]))
+        self.assertEqual([feasible_solution], self.archive.solution_list)
+
+    def test_should_add_all_give_the_same_archive_as_adding_one_by_one(self):
+        random.seed(11)
+        archive = NonDominatedSolutionListArchive()
+
+        for _ in range(20):
+            solutions = []
+            for _ in range(30):
+                solution = Solution(1, 3)
+                solution.objectives = [round(random.random(), 1) for _ in range(3)]
+                solutions.append(solution)
+
+            for solution in solutions:
+                archive.add(solution)
+            self.archive.add_all(solutions)
+
+            self.assertEqual(archive.solution_list, self.archive.solution_list)
+
+
+class BiObjectiveNonDominatedSolutionListArchiveTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.archive = BiObjectiveNonDominatedSolutionListArchive()
+
+    def test_should_adding_solutions_keep_them_sorted_by_the_first_objective(self):
+        for objectives in [[1.0, 1.0], [0.0, 2.0], [2.0, 0.5], [0.5, 1.5]]:
+            solution = Solution(1, 2)
+            solution.objectives = objectives
+            self.archive.add(solution)
+
+        self.assertEqual([[0.0, 2.0], [0.5, 1.5], [1.0, 1.0], [2.0, 0.5]],
+                         [solution.objectives for solution in self.archive.solution_list])
+
+    def test_should_adding_a_solution_remove_the_solutions_it_dominates(self):
+        for objectives in [[0.0, 3.0], [1.0, 2.0], [2.0, 1.5], [3.0, 0.0]]:
+            solution = Solution(1, 2)
+            solution.objectives = objectives
+            self.archive.add(solution)
+
+        new_solution = Solution(1, 2)
+        new_solution.objectives = [1.0, 1.0]
+
+        self.assertTrue(self.archive.add(new_solution))
+        self.assertEqual([[0.0, 3.0], [1.0, 1.0], [3.0, 0.0]],
+                         [solution.objectives for solution in self.archive.solution_list])
+
+    def test_should_adding_a_dominated_or_equal_solution_return_false(self):
+        solution1 = Solution(1, 2)
+        solution1.objectives = [1.0, 1.0]
+        solution2 = Solution(1, 2)
+        solution2.objectives = [1.0, 1.0]
+        solution3 = Solution(1, 2)
+        solution3.objectives = [1.0, 1.5]
+
+        self.assertTrue(self.archive.add(solution1))
+        self.assertFalse(self.archive.add(solution2))
+        self.assertFalse(self.archive.add(solution3))
+        self.assertEqual([solution1], self.archive.solution_list)
+
+    def test_should_remove_delete_the_solution(self):
+        solution1 = Solution(1, 2)
+        solution1.objectives = [0.0, 1.0]
+        solution2 = Solution(1, 2)
+        solution2.objectives = [1.0, 0.0]
+        self.archive.add(solution1)
+        self.archive.add(solution2)
+
+        self.archive.remove(solution1)
+
+        self.assertEqual([solution2], self.archive.solution_list)
+
+    def test_should_the_archive_contain_the_same_solutions_as_the_list_archive(self):
+        random.seed(3)
+        list_archive = NonDominatedSolutionListArchive()
+
+        for _ in range(500):
+            solution = Solution(1, 2)
+            solution.objectives = [round(random.random(), 2), round(random.random(), 2)]
+            self.assertEqual(list_archive.add(solution), self.archive.add(solution))
+
+        self.assertEqual(sorted(solution.objectives for solution in list_archive.solution_list),
+                         [solution.objectives for solution in self.archive.solution_list])
+
+    def test_should_bounded_archive_use_it_for_bi_objective_solutions(self):
+        archive = CrowdingDistanceArchive(5)
+        solution_list = archive.solution_list
+        archive.add(Solution(1, 2))
+
+        self.assertIsInstance(archive.non_dominated_solution_archive, BiObjectiveNonDominatedSolutionListArchive)
+        self.assertIs(solution_list, archive.solution_list)
+
+        archive = CrowdingDistanceArchive(5)
+        archive.add(Solution(1, 3))
+
+        self.assertNotIsInstance(archive.non_dominated_solution_archive, BiObjectiveNonDominatedSolutionListArchive)
+
+
+class NonDominatedSolutionTreeArchiveTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.archive = NonDominatedSolutionTreeArchive(maximum_leaf_size=4)
+
+    def test_should_adding_a_solution_remove_the_solutions_it_dominates(self):
+        for objectives in [[0.0, 3.0, 1.0], [1.0, 2.0, 1.0], [2.0, 1.5, 1.0], [3.0, 0.0, 1.0]]:
+            solution = Solution(1, 3)
+            solution.objectives = objectives
+            self.archive.add(solution)
+
+        new_solution = Solution(1, 3)
+        new_solution.objectives = [1.0, 1.0, 1.0]
+
+        self.assertTrue(self.archive.add(new_solution))
+        self.assertEqual([[0.0, 3.0, 1.0], [3.0, 0.0, 1.0], [1.0, 1.0, 1.0]],
+                         [solution.objectives for solution in self.archive.solution_list])
+
+    def test_should_adding_a_dominated_or_equal_solution_return_false(self):
+        solution1 = Solution(1, 3)
+        solution1.objectives = [1.0, 1.0, 1.0]
+        solution2 = Solution(1, 3)
+        solution2.objectives = [1.0, 1.0, 1.0]
+        solution3 = Solution(1, 3)
+        solution3.objectives = [1.0, 1.5, 1.0]
+
+        self.assertTrue(self.archive.add(solution1))
+        self.assertFalse(self.archive.add(solution2))
+        self.assertFalse(self.archive.add(solution3))
+        self.assertEqual([solution1], self.archive.solution_list)
+
+    def test_should_the_archive_contain_the_same_solutions_as_the_list_archive(self):
+        random.seed(5)
+        list_archive = NonDominatedSolutionListArchive()
+
+        for _ in range(1000):
+            solution = Solution(1, 3)
+            solution.objectives = [round(random.random(), 2) for _ in range(3)]
+            self.assertEqual(list_archive.add(solution), self.archive.add(solution))
+
+            if random.random() < 0.1:
+                removed = random.choice(list_archive.solution_list)
+                list_archive.remove(removed)
+                self.archive.remove(removed)
+
+        self.assertEqual(sorted(solution.objectives for solution in list_archive.solution_list),
+                         sorted(solution.objectives for solution in self.archive.solution_list))
+
+    def test_should_bounded_archives_accept_it(self):
+        random.seed(7)
+        archive = CrowdingDistanceArchive(10, NonDominatedSolutionTreeArchive())
+        archive_with_reference_point = CrowdingDistanceArchiveWithReferencePoint(
+            10, [0.5, 0.5, 0.5], NonDominatedSolutionTreeArchive())
+
+        for _ in range(200):
+            solution = Solution(1, 3)
+            solution.objectives = [random.random() for _ in range(3)]
+            archive.add(solution)
+            archive_with_reference_point.add(solution)
+
+        self.assertIsInstance(archive.non_dominated_solution_archive, NonDominatedSolutionTreeArchive)
+        self.assertEqual(10, archive.size())
+        self.assertIs(archive.solution_list, archive.non_dominated_solution_archive.solution_list)
+        self.assertEqual(10, archive_with_reference_point.size())
+
+
+class HypervolumeContributionArchiveTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.archive = HypervolumeContributionArchive[Solution](3, [4.0, 4.0])
+
+    def test_should_add_discard_the_solution_with_the_least_hypervolume_contribution(self):
+        for objectives in [[0.0, 3.0], [1.0, 1.5], [1.5, 1.0], [3.0, 0.0]]:
+            solution = Solution(1, 2)
+            solution.objectives = objectives
+            self.archive.add(solution)
+
+        self.assertEqual(3, self.archive.size())
+        self.assertEqual([[0.0, 3.0], [1.5, 1.0], [3.0, 0.0]],
+                         sorted(solution.objectives for solution in self.archive.solution_list))
+
+    def test_should_add_all_keep_a_front_with_a_hypervolume_not_lower_than_a_crowding_distance_archive(self):
+        random.seed(3)
+        solutions = []
+        for _ in range(100):
+            solution = Solution(1, 3)
+            solution.objectives = [random.random() for _ in range(3)]
+            solutions.append(solution)
+        crowding_distance_archive = CrowdingDistanceArchive(10)
+        archive = HypervolumeContributionArchive(10, [1.0, 1.0, 1.0])
+
+        crowding_distance_archive.add_all(solutions)
+        archive.add_all(solutions)
+
+        hv = HyperVolume([1.0, 1.0, 1.0])
+        self.assertEqual(10, archive.size())
+        self.assertGreaterEqual(hv.compute(archive.solution_list), hv.compute(crowding_distance_archive.solution_list))
+
 
 class CrowdingDistanceArchiveTestCases(unittest.TestCase):
 
     def setUp(self):
         self.archive = CrowdingDistanceArchive[Solution](5)
 
+    def test_should_add_all_truncate_the_archive_to_its_maximum_size(self):
+        solutions = []
+        for i in range(10):
+            solution = Solution(1, 2)
+            solution.objectives = [float(i), 9.0 - i]
+            solutions.append(solution)
+
+        result = self.archive.add_all(solutions)
+
+        self.assertEqual(5, self.archive.size())
+        self.assertEqual([solution in self.archive.solution_list for solution in solutions], result)
+        self.assertTrue(result[0] and result[9])
+
+    def test_should_truncate_remove_the_solutions_removed_one_at_a_time(self):
+        random.seed(6)
+        solutions = []
+        for _ in range(200):
+            solution = Solution(1, 3)
+            solution.objectives = [random.random() for _ in range(3)]
+            solutions.append(solution)
+
+        expected = NonDominatedSolutionListArchive()
+        expected.add_all(solutions)
+        comparator = SolutionAttributeComparator("crowding_distance", lowest_is_best=False)
+        while expected.size() > 5:
+            CrowdingDistance().compute_density_estimator(expected.solution_list)
+            worst_solution = expected.solution_list[0]
+            for solution in expected.solution_list[1:]:
+                if comparator.compare(worst_solution, solution) < 0:
+                    worst_solution = solution
+            expected.remove(worst_solution)
+
+        archive = BoundedArchive(5, comparator, CrowdingDistance())
+        archive.add_all(solutions)
+        self.archive.add_all(solutions)
+
+        self.assertEqual(sorted(map(id, expected.solution_list)), sorted(map(id, self.archive.solution_list)))
+        self.assertEqual(sorted(map(id, expected.solution_list)), sorted(map(id, archive.solution_list)))
+
+    def test_should_add_remove_the_same_solutions_as_the_crowding_distance_if_objectives_are_tied(self):
+        random.seed(8)
+        comparator = SolutionAttributeComparator("crowding_distance", lowest_is_best=False)
+
+        for number_of_objectives in [2, 3, 4]:
+            archive = CrowdingDistanceArchive(10)
+            expected = NonDominatedSolutionListArchive()
+
+            for _ in range(200):
+                objectives = [float(random.randint(0, 5)) for _ in range(number_of_objectives - 1)]
+                solution = Solution(1, number_of_objectives)
+                solution.objectives = objectives + [5.0 * number_of_objectives - sum(objectives)]
+                archive.add(solution)
+
+                # a copy, as the crowding distance of both archives is kept as an attribute of their solutions
+                copy = Solution(1, number_of_objectives)
+                copy.objectives = list(solution.objectives)
+                if expected.add(copy) and expected.size() > 10:
+                    CrowdingDistance().compute_density_estimator(expected.solution_list)
+                    worst_solution = expected.solution_list[0]
+                    for other in expected.solution_list[1:]:
+                        if comparator.compare(worst_solution, other) < 0:
+                            worst_solution = other
+                    expected.remove(worst_solution)
+
+                self.assertEqual(sorted(solution.objectives for solution in expected.solution_list),
+                                 sorted(solution.objectives for solution in archive.solution_list))
+
+    def test_should_truncate_shrink_the_archive_to_a_new_maximum_size(self):
+        for i in range(5):
+            solution = Solution(1, 2)
+            solution.objectives = [float(i), 4.0 - i]
+            self.archive.add(solution)
+
+        self.archive.maximum_size = 2
+        self.archive.truncate()
+
+        self.assertEqual([[0.0, 4.0], [4.0, 0.0]], [solution.objectives for solution in self.archive.solution_list])
+
     def test_should_constructor_create_a_non_null_object(self):
         self.assertIsNotNone(self.archive)
 
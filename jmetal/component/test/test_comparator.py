@@ -1,8 +1,10 @@
+import random
 import unittest
 
 from jmetal.core.solution import FloatSolution, Solution
 from jmetal.component.comparator import DominanceComparator, SolutionAttributeComparator, \
-    RankingAndCrowdingDistanceComparator
+    RankingAndCrowdingDistanceComparator, DominanceCounter, set_dominance_counter, dominance_test, dominance_matrix, \
+    dominance_test_one_to_many, get_objectives_and_violations
 
 
 class DominanceComparatorTestCases(unittest.TestCase):
@@ -272,5 +274,57 @@ class RankingAndCrowdingComparatorTestCases(unittest.TestCase):
         self.assertEqual(0, self.comparator.compare(solution1, solution2))
 
 
+class DominanceKernelsTestCases(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(8)
+        self.solutions = []
+        for _ in range(40):
+            solution = Solution(1, 3)
+            solution.objectives = [random.randint(0, 3) for _ in range(3)]
+            if random.random() < 0.5:
+                solution.attributes['overall_constraint_violation'] = random.choice([0.0, -1.0])
+            self.solutions.append(solution)
+
+    def test_should_dominance_test_consider_the_constraint_violation(self):
+        self.assertEqual(-1, dominance_test([1.0, 1.0], [0.0, 0.0], 0.0, -1.0))
+        self.assertEqual(1, dominance_test([0.0, 0.0], [1.0, 1.0], -2.0, -1.0))
+        self.assertEqual(-1, dominance_test([0.0, 0.0], [1.0, 1.0], -1.0, -1.0))
+        self.assertEqual(-1, dominance_test([0.0, 0.0], [1.0, 1.0], -1.0, None))
+        self.assertEqual(0, dominance_test([0.0, 1.0], [1.0, 0.0]))
+        self.assertEqual(0, dominance_test([1.0, 1.0], [1.0, 1.0]))
+
+    def test_should_the_kernels_give_the_results_of_the_dominance_comparator(self):
+        # a subclass of the constraint comparator takes the general path of DominanceComparator
+        class ConstraintComparator(SolutionAttributeComparator):
+            pass
+
+        comparator = DominanceComparator(ConstraintComparator("overall_constraint_violation", False))
+        objectives, violations = get_objectives_and_violations(self.solutions)
+
+        matrix = dominance_matrix(objectives, violations, objectives, violations)
+
+        for i, solution1 in enumerate(self.solutions):
+            row = dominance_test_one_to_many(objectives[i], violations[i], objectives, violations)
+            for j, solution2 in enumerate(self.solutions):
+                expected = comparator.compare(solution1, solution2)
+                self.assertEqual(expected, matrix[i, j])
+                self.assertEqual(expected, row[j])
+                self.assertEqual(expected, DominanceComparator().compare(solution1, solution2))
+
+    def test_should_the_counter_count_the_pairs_compared_by_the_kernels(self):
+        counter = DominanceCounter()
+        set_dominance_counter(counter)
+        try:
+            DominanceComparator().compare(self.solutions[0], self.solutions[1])
+            objectives, violations = get_objectives_and_violations(self.solutions)
+            dominance_matrix(objectives[:3], violations[:3], objectives, violations)
+        finally:
+            set_dominance_counter(None)
+
+        self.assertEqual(1 + 3 * 40, counter.number_of_comparisons)
+        self.assertGreaterEqual(counter.get_comparisons_per_second(), 0.0)
+
+
 if __name__ == '__main__':
     unittest.main()
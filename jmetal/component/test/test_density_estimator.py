@@ -1,6 +1,9 @@
+import random
 import unittest
 
-from jmetal.component.density_estimator import CrowdingDistance
+import numpy as np
+
+from jmetal.component.density_estimator import CrowdingDistance, IncrementalCrowdingDistance, crowding_distances
 from jmetal.core.solution import Solution
 
 
@@ -86,6 +89,123 @@ class CrowdingDistanceTestCases(unittest.TestCase):
         self.assertEqual(float("inf"), value_from_solution2)
         self.assertGreater(value_from_solution3, value_from_solution4)
 
+    def test_should_the_crowding_distances_of_a_matrix_be_correctly_computed(self):
+        objectives = np.array([[0.0, 1.0], [1.0, 0.0], [0.5, 0.5], [0.25, 0.75]])
+
+        distances = crowding_distances(objectives)
+
+        self.assertEqual([float("inf"), float("inf"), 1.5, 1.0], distances.tolist())
+
+    def test_should_large_fronts_get_the_same_values_as_small_ones(self):
+        random.seed(4)
+        front = []
+        for _ in range(100):
+            solution = Solution(1, 3)
+            solution.objectives = [random.random() for _ in range(3)]
+            front.append(solution)
+
+        CrowdingDistance(matrix_threshold=len(front)).compute_density_estimator(front)
+        values = [solution.attributes["crowding_distance"] for solution in front]
+        CrowdingDistance(matrix_threshold=0).compute_density_estimator(front)
+
+        for value, solution in zip(values, front):
+            self.assertAlmostEqual(value, solution.attributes["crowding_distance"])
+
+    def test_should_large_fronts_get_the_same_values_as_small_ones_if_objectives_are_tied(self):
+        random.seed(5)
+        for _ in range(50):
+            front = []
+            for _ in range(random.randint(3, 30)):
+                solution = Solution(1, 3)
+                solution.objectives = [float(random.randint(0, 3)) for _ in range(3)]
+                front.append(solution)
+
+            CrowdingDistance(matrix_threshold=len(front)).compute_density_estimator(front)
+            values = [solution.attributes["crowding_distance"] for solution in front]
+            CrowdingDistance(matrix_threshold=0).compute_density_estimator(front)
+
+            self.assertEqual(values, [solution.attributes["crowding_distance"] for solution in front])
+
+
+class IncrementalCrowdingDistanceTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.crowding = IncrementalCrowdingDistance()
+
+    def test_should_the_crowding_distance_of_three_solutions_correctly_assigned(self):
+        solution1 = Solution(2, 2)
+        solution1.objectives = [0.0, 1.0]
+        solution2 = Solution(2, 2)
+        solution2.objectives = [1.0, 0.0]
+        solution3 = Solution(2, 2)
+        solution3.objectives = [0.5, 0.5]
+
+        self.crowding.compute_density_estimator([solution1, solution2, solution3])
+
+        self.assertEqual(float("inf"), solution1.attributes["crowding_distance"])
+        self.assertEqual(float("inf"), solution2.attributes["crowding_distance"])
+        self.assertEqual(2.0, solution3.attributes["crowding_distance"])
+
+    def test_should_removing_a_solution_update_its_neighbors(self):
+        solutions = []
+        for value in [0.0, 0.25, 0.5, 1.0]:
+            solution = Solution(2, 2)
+            solution.objectives = [value, 1.0 - value]
+            solutions.append(solution)
+
+        self.crowding.compute_density_estimator(solutions)
+        self.assertEqual(1.0, solutions[1].attributes["crowding_distance"])
+
+        del solutions[2]
+        self.crowding.compute_density_estimator(solutions)
+
+        self.assertEqual(2.0, solutions[1].attributes["crowding_distance"])
+
+    def test_should_the_values_match_the_crowding_distance_while_the_front_changes(self):
+        random.seed(2)
+        crowding_distance = CrowdingDistance()
+        front = []
+
+        for _ in range(200):
+            if random.random() < 0.6 or len(front) < 3:
+                solution = Solution(1, 3)
+                solution.objectives = [random.random() for _ in range(3)]
+                front.append(solution)
+            else:
+                del front[random.randrange(len(front))]
+
+            self.crowding.compute_density_estimator(front)
+            values = [solution.attributes["crowding_distance"] for solution in front]
+
+            copies = []
+            for solution in front:
+                copy = Solution(1, 3)
+                copy.objectives = list(solution.objectives)
+                copies.append(copy)
+            crowding_distance.compute_density_estimator(copies)
+
+            for value, copy in zip(values, copies):
+                self.assertAlmostEqual(copy.attributes["crowding_distance"], value)
+
+    def test_should_the_values_match_the_crowding_distance_if_objectives_are_tied(self):
+        random.seed(3)
+        crowding_distance = CrowdingDistance(matrix_threshold=1000)
+        front = []
+
+        for _ in range(300):
+            if random.random() < 0.6 or len(front) < 3:
+                solution = Solution(1, 3)
+                solution.objectives = [float(random.randint(0, 4)) for _ in range(3)]
+                front.append(solution)
+            else:
+                del front[random.randrange(len(front))]
+
+            self.crowding.compute_density_estimator(front)
+            values = [solution.attributes["crowding_distance"] for solution in front]
+            crowding_distance.compute_density_estimator(front)
+
+            self.assertEqual([solution.attributes["crowding_distance"] for solution in front], values)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,11 @@
+import gc
+import sys
 import unittest
 
-from jmetal.component.evaluator import SequentialEvaluator, MapEvaluator
+import numpy as np
+
+from jmetal.component.evaluator import SequentialEvaluator, MapEvaluator, ProcessPoolEvaluator, \
+    SharedMemoryEvaluator
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
 
@@ -26,6 +31,21 @@ class MockedProblem(FloatProblem):
         return solution
 
 
+class MockedBatchProblem(MockedProblem):
+
+    def __init__(self, number_of_variables: int = 3):
+        super(MockedBatchProblem, self).__init__(number_of_variables)
+        self.number_of_batch_calls = 0
+
+    def evaluate_batch(self, X: np.ndarray):
+        self.number_of_batch_calls += 1
+        F = np.empty((len(X), self.number_of_objectives))
+        F[:, 0] = X.sum(axis=1)
+        F[:, 1] = 3.4
+
+        return F, np.zeros(len(X))
+
+
 class SequentialEvaluatorTestCases(unittest.TestCase):
 
     def setUp(self):
@@ -53,6 +73,18 @@ class SequentialEvaluatorTestCases(unittest.TestCase):
             self.assertEqual(2.3, problem_list[i].objectives[1])
 
 
+    def test_should_evaluate_use_the_batch_evaluation_of_the_problem_if_available(self):
+        problem = MockedBatchProblem()
+        problem_list = [problem.create_solution() for _ in range(10)]
+
+        self.evaluator.evaluate(problem_list, problem)
+
+        self.assertEqual(1, problem.number_of_batch_calls)
+        for solution in problem_list:
+            self.assertAlmostEqual(sum(solution.variables), solution.objectives[0])
+            self.assertEqual(3.4, solution.objectives[1])
+
+
 class ParallelEvaluatorTestCases(unittest.TestCase):
 
     def setUp(self):
@@ -79,6 +111,160 @@ class ParallelEvaluatorTestCases(unittest.TestCase):
             self.assertEqual(1.2, problem_list[i].objectives[0])
             self.assertEqual(2.3, problem_list[i].objectives[1])
 
+    def test_should_evaluate_use_the_batch_evaluation_of_the_problem_if_available(self):
+        problem = MockedBatchProblem()
+        problem_list = [problem.create_solution() for _ in range(10)]
+
+        self.evaluator.evaluate(problem_list, problem)
+
+        self.assertTrue(1 <= problem.number_of_batch_calls <= self.evaluator.processes)
+        for solution in problem_list:
+            self.assertAlmostEqual(sum(solution.variables), solution.objectives[0])
+            self.assertEqual(3.4, solution.objectives[1])
+
+
+class MockedConstrainedProblem(MockedProblem):
+
+    def evaluate_constraints(self, solution: FloatSolution) -> None:
+        solution.attributes['overall_constraint_violation'] = -1.0
+        solution.attributes['number_of_violated_constraints'] = 1
+
+
+class ProcessPoolEvaluatorTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = ProcessPoolEvaluator(processes=2)
+        self.problem = MockedProblem()
+
+    def tearDown(self):
+        self.evaluator.close()
+
+    def test_should_evaluate_a_list_of_problem_work_properly(self):
+        problem_list = [self.problem.create_solution() for _ in range(10)]
+
+        self.evaluator.evaluate(problem_list, self.problem)
+
+        for i in range(10):
+            self.assertEqual(1.2, problem_list[i].objectives[0])
+            self.assertEqual(2.3, problem_list[i].objectives[1])
+
+    def test_should_evaluate_keep_the_pool_between_calls_with_the_same_problem(self):
+        self.evaluator.evaluate([self.problem.create_solution()], self.problem)
+        pool = self.evaluator.pool
+
+        self.evaluator.evaluate([self.problem.create_solution()], self.problem)
+
+        self.assertIs(pool, self.evaluator.pool)
+
+    def test_should_evaluate_write_back_the_constraint_attributes(self):
+        problem = MockedConstrainedProblem()
+        problem.number_of_constraints = 1
+        solution = problem.create_solution()
+        solution.attributes['local_best'] = 'unchanged'
+
+        self.evaluator.evaluate([solution], problem)
+
+        self.assertEqual(-1.0, solution.attributes['overall_constraint_violation'])
+        self.assertEqual(1, solution.attributes['number_of_violated_constraints'])
+        self.assertEqual('unchanged', solution.attributes['local_best'])
+
+    def test_should_evaluate_use_the_batch_evaluation_of_the_problem_if_available(self):
+        problem = MockedBatchProblem()
+        problem_list = [problem.create_solution() for _ in range(10)]
+
+        self.evaluator.chunk_size = 3
+        self.evaluator.evaluate(problem_list, problem)
+
+        for solution in problem_list:
+            self.assertAlmostEqual(sum(solution.variables), solution.objectives[0])
+            self.assertEqual(3.4, solution.objectives[1])
+
+    def test_should_evaluate_raise_an_exception_if_the_problem_cannot_be_pickled(self):
+        problem = MockedProblem()
+        problem.transform = lambda x: x
+
+        with self.assertRaises(Exception) as context:
+            self.evaluator.evaluate([problem.create_solution()], problem)
+
+        self.assertIn('cannot be pickled', str(context.exception))
+
+
+@unittest.skipUnless(sys.version_info >= (3, 8), 'shared memory requires Python 3.8 or later')
+class SharedMemoryEvaluatorTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = SharedMemoryEvaluator(processes=2)
+        self.problem = MockedProblem()
+
+    def tearDown(self):
+        self.evaluator.close()
+
+    def test_should_evaluate_a_list_of_problem_work_properly(self):
+        problem_list = [self.problem.create_solution() for _ in range(10)]
+
+        self.evaluator.evaluate(problem_list, self.problem)
+
+        for i in range(10):
+            self.assertEqual(1.2, problem_list[i].objectives[0])
+            self.assertEqual(2.3, problem_list[i].objectives[1])
+
+    def test_should_evaluate_grow_the_shared_blocks_if_the_list_is_larger(self):
+        self.evaluator.evaluate([self.problem.create_solution() for _ in range(4)], self.problem)
+        self.assertEqual(4, self.evaluator.capacity)
+
+        problem_list = [self.problem.create_solution() for _ in range(9)]
+        self.evaluator.evaluate(problem_list, self.problem)
+
+        self.assertEqual(9, self.evaluator.capacity)
+        self.assertEqual(2.3, problem_list[8].objectives[1])
+
+    def test_should_evaluate_write_back_the_overall_constraint_violation(self):
+        problem = MockedConstrainedProblem()
+        problem.number_of_constraints = 1
+        solution = problem.create_solution()
+
+        self.evaluator.evaluate([solution], problem)
+
+        self.assertEqual(-1.0, solution.attributes['overall_constraint_violation'])
+
+    def test_should_evaluate_use_the_batch_evaluation_of_the_problem_if_available(self):
+        problem = MockedBatchProblem()
+        problem_list = [problem.create_solution() for _ in range(10)]
+
+        self.evaluator.evaluate(problem_list, problem)
+
+        for solution in problem_list:
+            self.assertAlmostEqual(sum(solution.variables), solution.objectives[0])
+            self.assertEqual(3.4, solution.objectives[1])
+
+    def test_should_the_evaluator_release_the_shared_blocks_when_used_as_a_context_manager(self):
+        from multiprocessing.shared_memory import SharedMemory
+
+        with SharedMemoryEvaluator(processes=1) as evaluator:
+            evaluator.evaluate([self.problem.create_solution()], self.problem)
+            names = [block.name for block in evaluator.blocks]
+
+        self.assertIsNone(evaluator.pool)
+        for name in names:
+            with self.assertRaises(FileNotFoundError):
+                SharedMemory(name=name)
+
+    def test_should_the_shared_blocks_be_unlinked_if_the_evaluator_is_garbage_collected(self):
+        from multiprocessing.shared_memory import SharedMemory
+
+        evaluator = SharedMemoryEvaluator(processes=1)
+        evaluator.evaluate([self.problem.create_solution()], self.problem)
+        names = [block.name for block in evaluator.blocks]
+        evaluator.pool.close()
+        evaluator.pool.join()
+
+        del evaluator
+        gc.collect()
+
+        for name in names:
+            with self.assertRaises(FileNotFoundError):
+                SharedMemory(name=name)
+
 
 if __name__ == "__main__":
     unittest.main()
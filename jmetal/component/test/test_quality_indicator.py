@@ -1,9 +1,13 @@
 from os.path import dirname, join
 import unittest
 
+import numpy as np
+
 from jmetal.core.solution import Solution
 from jmetal.problem import ZDT1
-from jmetal.component.quality_indicator import HyperVolume
+from jmetal.component.quality_indicator import HyperVolume, HyperVolumeTracker, MonteCarloHyperVolume, \
+    GenerationalDistance, GenerationalDistancePlus, InvertedGenerationalDistance, InvertedGenerationalDistancePlus, \
+    KDTree, AdditiveEpsilon, MultiplicativeEpsilon, Staircase
 
 
 class HyperVolumeTestCases(unittest.TestCase):
@@ -36,6 +40,332 @@ class HyperVolumeTestCases(unittest.TestCase):
 
         self.assertAlmostEqual(0.666, value, delta=0.001)
 
+    def test_should_hypervolume_return_0_if_no_point_dominates_the_reference_point(self):
+        solution = Solution(1, 2)
+        solution.objectives = [3, 1]
+
+        self.assertEqual(0.0, HyperVolume([2, 2]).compute([solution]))
+
+    def test_should_the_2d_and_3d_sweeps_match_the_dimension_sweep_on_random_fronts(self):
+        random = np.random.RandomState(1)
+
+        for dimensions in [2, 3]:
+            for _ in range(50):
+                points = np.round(random.uniform(-1.0, 0.0, (random.randint(1, 60), dimensions)), 2)
+                hv = HyperVolume([0.0] * dimensions)
+
+                fast = hv._hv_2d(points) if dimensions == 2 else hv._hv_3d(points)
+                general = hv._hv_dimension_sweep(points.tolist())
+
+                self.assertAlmostEqual(general, fast, delta=1e-10)
+
+    def test_should_the_wfg_algorithm_match_the_dimension_sweep_on_random_fronts(self):
+        random = np.random.RandomState(4)
+
+        for dimensions in [4, 5, 6, 8, 10]:
+            for _ in range(5):
+                points = np.round(random.uniform(-1.0, 0.0, (random.randint(1, 15), dimensions)), 1)
+                hv = HyperVolume([0.0] * dimensions)
+
+                self.assertAlmostEqual(hv._hv_dimension_sweep(points.tolist()), hv._hv_wfg(points), delta=1e-10)
+
+    def test_should_the_wfg_algorithm_match_the_dimension_sweep_on_a_spherical_front(self):
+        random = np.random.RandomState(5)
+        points = random.uniform(0.0, 1.0, (40, 5))
+        points = points / np.linalg.norm(points, axis=1)[:, None] - 1.1
+        hv = HyperVolume([0.0] * 5)
+
+        self.assertAlmostEqual(hv._hv_dimension_sweep(points.tolist()), hv._hv_wfg(points), delta=1e-10)
+
+    def test_should_contributions_return_the_hypervolume_lost_when_removing_each_solution(self):
+        random = np.random.RandomState(2)
+
+        for dimensions in [2, 3, 4]:
+            for _ in range(10):
+                front = []
+                for objectives in np.round(random.uniform(0.0, 1.2, (random.randint(1, 25), dimensions)), 1):
+                    solution = Solution(1, dimensions)
+                    solution.objectives = objectives.tolist()
+                    front.append(solution)
+                hv = HyperVolume([1.0] * dimensions)
+
+                contributions = hv.contributions(front)
+
+                total = hv.compute(front)
+                for i, contribution in enumerate(contributions):
+                    self.assertAlmostEqual(total - hv.compute(front[:i] + front[i + 1:]), contribution, delta=1e-10)
+
+    def test_should_contributions_be_0_for_dominated_and_repeated_solutions(self):
+        objectives = [[1.0, 3.0], [2.0, 2.0], [2.0, 2.0], [3.0, 3.0], [3.0, 1.0], [5.0, 0.0]]
+        front = []
+        for point in objectives:
+            solution = Solution(1, 2)
+            solution.objectives = point
+            front.append(solution)
+
+        self.assertEqual([1.0, 0.0, 0.0, 0.0, 1.0, 0.0], HyperVolume([4.0, 4.0]).contributions(front))
+
+
+class StaircaseTestCases(unittest.TestCase):
+
+    def test_should_add_keep_the_non_dominated_points_and_their_hypervolume(self):
+        random = np.random.RandomState(2)
+        points = np.round(random.uniform(-1.0, 0.0, (300, 2)), 2)
+        staircase = Staircase()
+
+        for x, y in points.tolist():
+            staircase.add(x, y)
+
+        dominated = np.array([np.any(np.all(points <= point, axis=1) & np.any(points < point, axis=1))
+                              for point in points])
+        expected = sorted(set(map(tuple, points[~dominated].tolist())))
+        self.assertEqual(expected, list(staircase))
+        self.assertEqual(len(expected), len(staircase))
+        self.assertAlmostEqual(HyperVolume._hv_2d(points), staircase.area, delta=1e-10)
+
+    def test_should_remove_subtract_the_rectangle_the_point_dominated_alone(self):
+        staircase = Staircase()
+        for x, y in [(-3.0, -1.0), (-2.0, -2.0), (-1.0, -3.0)]:
+            staircase.add(x, y)
+
+        self.assertIsNone(staircase.remove(-2.0, -1.0))
+        self.assertEqual((-1.0, -1.0), staircase.remove(-2.0, -2.0))
+        self.assertEqual(5.0, staircase.area)
+        self.assertEqual([(-3.0, -1.0), (-1.0, -3.0)], list(staircase))
+
+
+class MonteCarloHyperVolumeTestCases(unittest.TestCase):
+
+    def setUp(self):
+        random = np.random.RandomState(3)
+        points = random.uniform(0.0, 1.0, (40, 5))
+        points = points / np.sum(points, axis=1)[:, None]
+
+        self.front = []
+        for point in points:
+            solution = Solution(1, 5)
+            solution.objectives = point.tolist()
+            self.front.append(solution)
+
+    def test_should_compute_estimate_the_exact_hypervolume_up_to_the_requested_interval_width(self):
+        indicator = MonteCarloHyperVolume([1.0] * 5, relative_width=0.01, seed=1)
+
+        estimate = indicator.compute(self.front)
+
+        low, high = indicator.get_confidence_interval()
+        self.assertAlmostEqual(HyperVolume([1.0] * 5).compute(self.front), estimate,
+                               delta=4.0 * indicator.standard_error)
+        self.assertLessEqual(high - low, 0.01 * estimate)
+        self.assertAlmostEqual(indicator.margin, 1.96 * indicator.standard_error)
+
+    def test_should_compute_stop_at_the_maximum_number_of_samples(self):
+        indicator = MonteCarloHyperVolume([1.0] * 5, relative_width=0.0, block_size=300, max_samples=1000, seed=1)
+
+        indicator.compute(self.front)
+
+        self.assertEqual(1000, indicator.number_of_samples)
+        self.assertGreater(indicator.standard_error, 0.0)
+
+    def test_should_compute_return_the_same_estimate_for_the_same_seed(self):
+        indicator = MonteCarloHyperVolume([1.0] * 5, seed=1)
+
+        self.assertEqual(indicator.compute(self.front), indicator.compute(self.front))
+
+    def test_should_compute_be_exact_for_a_single_point_and_0_if_no_point_dominates_the_reference_point(self):
+        indicator = MonteCarloHyperVolume([2.0, 2.0, 2.0])
+        solution = Solution(1, 3)
+
+        solution.objectives = [1.0, 0.0, 1.0]
+        self.assertEqual(2.0, indicator.compute([solution]))
+        self.assertEqual(0.0, indicator.standard_error)
+
+        solution.objectives = [3.0, 0.0, 1.0]
+        self.assertEqual(0.0, indicator.compute([solution]))
+
+
+class GenerationalDistanceTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.reference_front = []
+        for objectives in [[0.0, 1.0], [1.0, 0.0]]:
+            solution = Solution(1, 2)
+            solution.objectives = objectives
+            self.reference_front.append(solution)
+
+        solution = Solution(1, 2)
+        solution.objectives = [0.5, 0.5]
+        self.front = [solution]
+
+    def test_should_the_distances_of_a_front_to_a_reference_front_be_correct(self):
+        self.assertAlmostEqual(np.sqrt(0.5), GenerationalDistance(self.reference_front).compute(self.front))
+        self.assertAlmostEqual(0.5, GenerationalDistancePlus(self.reference_front).compute(self.front))
+        self.assertAlmostEqual(np.sqrt(0.5), InvertedGenerationalDistance(self.reference_front).compute(self.front))
+        self.assertAlmostEqual(0.5, InvertedGenerationalDistancePlus(self.reference_front).compute(self.front))
+
+    def test_should_the_plus_distances_be_0_if_the_front_dominates_the_reference_front(self):
+        self.front[0].objectives = [0.0, 0.0]
+
+        self.assertEqual(0.0, GenerationalDistancePlus(self.reference_front).compute(self.front))
+        self.assertEqual(0.0, InvertedGenerationalDistancePlus(self.reference_front).compute(self.front))
+
+    def test_should_the_distances_of_the_ZDT1_reference_front_to_itself_be_0(self):
+        reference_front = ZDT1(rf_path='resources/reference_front/ZDT1.pf').reference_front
+
+        for indicator in [GenerationalDistance, GenerationalDistancePlus, InvertedGenerationalDistance,
+                          InvertedGenerationalDistancePlus]:
+            self.assertEqual(0.0, indicator(reference_front).compute(reference_front))
+
+    def test_should_the_kd_tree_return_the_distances_to_the_nearest_points(self):
+        random = np.random.RandomState(6)
+
+        for _ in range(20):
+            dimensions = random.randint(2, 6)
+            points = np.round(random.uniform(0.0, 1.0, (random.randint(1, 400), dimensions)), 2)
+            queries = random.uniform(0.0, 1.0, (random.randint(1, 50), dimensions))
+            tree = KDTree(points, leaf_size=random.randint(1, 40))
+
+            differences = queries[:, None, :] - points[None, :, :]
+            for worse, distances in [(None, differences), ('queries', np.maximum(differences, 0.0)),
+                                     ('tree', np.minimum(differences, 0.0))]:
+                expected = np.sqrt(np.min(np.sum(distances * distances, axis=2), axis=1))
+                self.assertTrue(np.allclose(expected, tree.query(queries, worse=worse)))
+
+
+class EpsilonTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.reference_front = []
+        for objectives in [[1.0, 2.0], [2.0, 1.0]]:
+            solution = Solution(1, 2)
+            solution.objectives = objectives
+            self.reference_front.append(solution)
+
+    def test_should_the_epsilons_of_a_front_be_correct(self):
+        solution = Solution(1, 2)
+        solution.objectives = [1.5, 1.5]
+
+        self.assertEqual(0.5, AdditiveEpsilon(self.reference_front).compute([solution]))
+        self.assertEqual(1.5, MultiplicativeEpsilon(self.reference_front).compute([solution]))
+
+    def test_should_the_epsilons_of_the_reference_front_be_0_and_1(self):
+        self.assertEqual(0.0, AdditiveEpsilon(self.reference_front).compute(self.reference_front))
+        self.assertEqual(1.0, MultiplicativeEpsilon(self.reference_front).compute(self.reference_front))
+
+    def test_should_the_epsilons_not_depend_on_the_chunk_size(self):
+        random = np.random.RandomState(7)
+        fronts = []
+        for size in [60, 45]:
+            front = []
+            for objectives in random.uniform(0.1, 1.0, (size, 3)):
+                solution = Solution(1, 3)
+                solution.objectives = objectives.tolist()
+                front.append(solution)
+            fronts.append(front)
+        front, reference_front = fronts
+
+        points = np.array([solution.objectives for solution in front])
+        reference_points = np.array([solution.objectives for solution in reference_front])
+        additive = np.max(np.min(np.max(points[None] - reference_points[:, None], axis=2), axis=1))
+        multiplicative = np.max(np.min(np.max(points[None] / reference_points[:, None], axis=2), axis=1))
+
+        for chunk_size in [1, 100, 2 ** 22]:
+            self.assertEqual(additive, AdditiveEpsilon(reference_front, chunk_size).compute(front))
+            self.assertEqual(multiplicative, MultiplicativeEpsilon(reference_front, chunk_size).compute(front))
+
+    def test_should_the_multiplicative_epsilon_raise_an_exception_if_an_objective_is_not_positive(self):
+        solution = Solution(1, 2)
+        solution.objectives = [0.0, 1.0]
+
+        with self.assertRaises(Exception):
+            MultiplicativeEpsilon(self.reference_front).compute([solution])
+        with self.assertRaises(Exception):
+            MultiplicativeEpsilon([solution])
+
+
+class HyperVolumeTrackerTestCases(unittest.TestCase):
+
+    def setUp(self):
+        solution1 = Solution(1, 2)
+        solution1.objectives = [1, 0]
+        solution2 = Solution(1, 2)
+        solution2.objectives = [0, 1]
+
+        self.front = [solution1, solution2]
+
+    def test_should_update_compute_the_hypervolume_of_the_front(self):
+        tracker = HyperVolumeTracker([2, 2])
+
+        self.assertTrue(tracker.update(self.front))
+        self.assertEqual(3.0, tracker.value)
+        self.assertEqual(3.0, tracker.get_improvement())
+
+    def test_should_update_not_recompute_the_hypervolume_if_the_front_has_not_changed(self):
+        tracker = HyperVolumeTracker([2, 2])
+
+        tracker.update(self.front)
+        tracker.update(self.front)
+
+        self.assertEqual(1, tracker.number_of_computations)
+        self.assertEqual(0.0, tracker.get_improvement())
+        self.assertEqual([3.0, 3.0], tracker.get_history())
+
+    def test_should_update_recompute_the_hypervolume_if_the_front_has_changed(self):
+        tracker = HyperVolumeTracker([2, 2])
+        tracker.update(self.front)
+
+        solution = Solution(1, 2)
+        solution.objectives = [0.5, 0.5]
+        tracker.update(self.front + [solution])
+
+        self.assertEqual(2, tracker.number_of_computations)
+        self.assertEqual(3.25, tracker.value)
+        self.assertEqual(0.25, tracker.get_improvement())
+
+    def test_should_update_only_measure_the_front_every_frequency_updates(self):
+        tracker = HyperVolumeTracker([2, 2], frequency=3, only_on_change=False)
+
+        measurements = [tracker.update(self.front) for _ in range(7)]
+
+        self.assertEqual([True, False, False, True, False, False, True], measurements)
+        self.assertEqual(3, tracker.number_of_computations)
+
+    def test_should_history_be_bounded(self):
+        tracker = HyperVolumeTracker([2, 2], history_size=5)
+
+        for _ in range(10):
+            tracker.update(self.front)
+
+        self.assertEqual(5, len(tracker.get_history()))
+
+    def test_should_incremental_updates_match_the_hypervolume_of_every_front(self):
+        random = np.random.RandomState(3)
+        hv = HyperVolume([1.0, 1.0])
+        tracker = HyperVolumeTracker([1.0, 1.0])
+        front = []
+
+        self.assertTrue(tracker.incremental)
+        for _ in range(200):
+            # solutions enter and leave at random, including dominated, repeated and irrelevant ones
+            front = [solution for solution in front if random.uniform() < 0.8]
+            for objectives in np.round(random.uniform(0.0, 1.2, (random.randint(0, 6), 2)), 1).tolist():
+                solution = Solution(1, 2)
+                solution.objectives = objectives
+                front.append(solution)
+
+            tracker.update(front)
+
+            self.assertAlmostEqual(hv.compute(front), tracker.value, delta=1e-10)
+
+    def test_should_update_keep_the_margin_of_an_estimated_hypervolume(self):
+        indicator = MonteCarloHyperVolume([2, 2], relative_width=0.0, max_samples=1000, seed=1)
+        tracker = HyperVolumeTracker([2, 2], hypervolume=indicator)
+
+        tracker.update(self.front)
+
+        self.assertEqual(indicator.margin, tracker.margin)
+        self.assertGreater(tracker.get_improvement_margin(), 0.0)
+        self.assertEqual(0.0, HyperVolumeTracker([2, 2]).get_improvement_margin())
+
 
 if __name__ == '__main__':
     unittest.main()
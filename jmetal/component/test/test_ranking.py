@@ -1,7 +1,9 @@
+import random
 import unittest
 
 from jmetal.core.solution import Solution
-from jmetal.component.ranking import FastNonDominatedRanking
+from jmetal.component.ranking import FastNonDominatedRanking, EfficientNonDominatedRanking, DominanceMatrixRanking, \
+    DimensionSweepRanking
 
 
 class FastNonDominatedRankingTestCases(unittest.TestCase):
@@ -109,5 +111,92 @@ class FastNonDominatedRankingTestCases(unittest.TestCase):
         self.assertEqual(solution5, ranking[1][1])
 
 
+
+class EfficientNonDominatedRankingTestCases(FastNonDominatedRankingTestCases):
+
+    def setUp(self):
+        self.ranking = EfficientNonDominatedRanking()
+
+    def test_should_both_search_strategies_compute_the_fronts_of_the_fast_non_dominated_ranking(self):
+        random.seed(1)
+        solution_list = []
+        for _ in range(200):
+            solution = Solution(2, 3)
+            solution.objectives = [random.randint(0, 10) for _ in range(3)]
+            solution_list.append(solution)
+
+        fast_ranking = FastNonDominatedRanking()
+        expected = [sorted(map(id, front)) for front in fast_ranking.compute_ranking(solution_list)]
+
+        for binary_search in [False, True]:
+            ranking = EfficientNonDominatedRanking(binary_search)
+
+            self.assertEqual(expected, [sorted(map(id, front)) for front in ranking.compute_ranking(solution_list)])
+            self.assertLess(ranking.number_of_comparisons, fast_ranking.number_of_comparisons)
+
+    def test_should_ranking_consider_the_constraint_violation(self):
+        solution1 = Solution(2, 2)
+        solution1.objectives = [0.0, 0.0]
+        solution1.attributes['overall_constraint_violation'] = -1.0
+        solution2 = Solution(2, 2)
+        solution2.objectives = [1.0, 1.0]
+        solution2.attributes['overall_constraint_violation'] = 0.0
+
+        ranking = self.ranking.compute_ranking([solution1, solution2])
+
+        self.assertEqual([[solution2], [solution1]], ranking)
+
+
+
+class DominanceMatrixRankingTestCases(FastNonDominatedRankingTestCases):
+
+    def setUp(self):
+        self.ranking = DominanceMatrixRanking(chunk_size=2)
+
+    def test_should_the_fronts_be_the_ones_of_the_fast_non_dominated_ranking(self):
+        random.seed(2)
+        solution_list = []
+        for _ in range(300):
+            solution = Solution(2, 3)
+            solution.objectives = [random.randint(0, 10) for _ in range(3)]
+            solution.attributes['overall_constraint_violation'] = random.choice([0.0, 0.0, -1.0, -2.0])
+            solution_list.append(solution)
+
+        expected = [sorted(map(id, front)) for front in FastNonDominatedRanking().compute_ranking(solution_list)]
+
+        for chunk_size in [1, 7, 1000]:
+            ranking = DominanceMatrixRanking(chunk_size)
+
+            self.assertEqual(expected, [sorted(map(id, front)) for front in ranking.compute_ranking(solution_list)])
+            self.assertEqual(expected, [sorted(id(solution) for solution in solution_list
+                                               if solution.attributes['dominance_ranking'] == rank)
+                                        for rank in range(len(expected))])
+
+
+
+class DimensionSweepRankingTestCases(FastNonDominatedRankingTestCases):
+
+    def setUp(self):
+        self.ranking = DimensionSweepRanking()
+
+    def test_should_the_fronts_be_the_ones_of_the_fast_non_dominated_ranking(self):
+        random.seed(3)
+
+        for number_of_objectives in [2, 3, 4]:
+            for constrained in [False, True]:
+                solution_list = []
+                for _ in range(300):
+                    solution = Solution(2, number_of_objectives)
+                    solution.objectives = [random.randint(0, 8) for _ in range(number_of_objectives)]
+                    if constrained:
+                        solution.attributes['overall_constraint_violation'] = random.choice([0.0, 0.0, -1.0])
+                    solution_list.append(solution)
+
+                expected = [sorted(map(id, front)) for front in FastNonDominatedRanking().compute_ranking(solution_list)]
+                ranking = DimensionSweepRanking().compute_ranking(solution_list)
+
+                self.assertEqual(expected, [sorted(map(id, front)) for front in ranking])
+
+
 if __name__ == "__main__":
     unittest.main()
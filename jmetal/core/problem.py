@@ -1,8 +1,10 @@
 from abc import ABCMeta, abstractmethod
-from typing import Generic, TypeVar, List
+from typing import Generic, TypeVar, List, Tuple
 from pathlib import Path
 import random
 
+import numpy as np
+
 from jmetal.core.solution import BinarySolution, FloatSolution, IntegerSolution
 
 S = TypeVar('S')
@@ -80,6 +82,39 @@ class Problem(Generic[S]):
     def evaluate_constraints(self, solution: S):
         pass
 
+    def evaluate_batch(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """ Evaluate a whole population given as a (n, number_of_variables) matrix. Problems able to compute their
+        objectives over a matrix should replace this method; the default one creates a solution per row and
+        evaluates it with :func:`evaluate` and :func:`evaluate_constraints`.
+
+        .. note::
+           Problems that repair their variables while evaluating (e.g. setting a derived variable) must write the
+           repaired values back into the rows of `X`.
+
+        :param X: Matrix of decision variables, one row per solution.
+        :return: Matrix of objectives of shape (n, number_of_objectives) and vector of shape (n,) with the overall
+            constraint violation of each row (0.0 for feasible rows). """
+        F = np.empty((len(X), self.number_of_objectives))
+        G = np.zeros(len(X))
+
+        for i in range(len(X)):
+            solution = self.create_solution()
+            solution.variables = X[i].tolist()
+
+            self.evaluate(solution)
+            if self.number_of_constraints > 0:
+                self.evaluate_constraints(solution)
+                G[i] = solution.attributes.get('overall_constraint_violation', 0.0)
+
+            X[i] = solution.variables
+            F[i] = solution.objectives
+
+        return F, G
+
+    def supports_batch_evaluation(self) -> bool:
+        """ :return: True if the problem provides its own :func:`evaluate_batch` implementation. """
+        return type(self).evaluate_batch is not Problem.evaluate_batch
+
     def get_name(self) -> str:
         return self.__class__.__name__
 
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from jmetal.core.problem import FloatProblem, IntegerProblem
 from jmetal.core.solution import FloatSolution, IntegerSolution
 
@@ -36,6 +38,26 @@ class FloatProblemTestCases(unittest.TestCase):
         self.assertTrue(-1.0 <= solution.variables[0] <= 1.0)
         self.assertTrue(-2.0 <= solution.variables[1] <= 2.0)
 
+    def test_should_evaluate_batch_fall_back_to_evaluate_by_default(self) -> None:
+        class SumProblem(FloatProblem):
+            def evaluate(self, solution: FloatSolution) -> FloatSolution:
+                solution.objectives[0] = sum(solution.variables)
+                solution.objectives[1] = -sum(solution.variables)
+                return solution
+
+        problem = SumProblem()
+        problem.number_of_variables = 2
+        problem.number_of_objectives = 2
+        problem.number_of_constraints = 0
+        problem.lower_bound = [-1.0, -2.0]
+        problem.upper_bound = [1.0, 2.0]
+
+        F, G = problem.evaluate_batch(np.array([[0.5, 1.0], [-1.0, 2.0]]))
+
+        self.assertFalse(problem.supports_batch_evaluation())
+        self.assertEqual([[1.5, -1.5], [1.0, -1.0]], F.tolist())
+        self.assertEqual([0.0, 0.0], G.tolist())
+
 
 class IntegerProblemTestCases(unittest.TestCase):
 
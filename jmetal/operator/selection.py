@@ -4,7 +4,7 @@ from typing import List, TypeVar
 from jmetal.component.density_estimator import CrowdingDistance
 from jmetal.core.operator import Selection
 from jmetal.component.comparator import Comparator, DominanceComparator
-from jmetal.component.ranking import FastNonDominatedRanking
+from jmetal.component.ranking import FastNonDominatedRanking, Ranking
 
 S = TypeVar('S')
 
@@ -63,9 +63,10 @@ class BestSolutionSelection(Selection[List[S], S]):
         elif len(front) == 0:
             raise Exception('The front is empty')
 
+        comparator = DominanceComparator()
         result = front[0]
         for solution in front[1:]:
-            if DominanceComparator().compare(solution, result) < 0:
+            if comparator.compare(solution, result) < 0:
                 result = solution
 
         return result
@@ -117,12 +118,13 @@ class RandomSolutionSelection(Selection[List[S], S]):
 
 class RankingAndCrowdingDistanceSelection(Selection[List[S], List[S]]):
 
-    def __init__(self, max_population_size: int):
+    def __init__(self, max_population_size: int, ranking: Ranking = None):
         super(RankingAndCrowdingDistanceSelection, self).__init__()
         self.max_population_size = max_population_size
+        self.ranking = ranking
 
     def execute(self, front: List[S]) -> List[S]:
-        ranking = FastNonDominatedRanking()
+        ranking = self.ranking if self.ranking is not None else FastNonDominatedRanking()
         crowding_distance = CrowdingDistance()
         ranking.compute_ranking(front)
 
@@ -6,6 +6,7 @@ from jmetal.core.solution import Solution
 from jmetal.operator.selection import BinaryTournamentSelection, BestSolutionSelection, RandomSolutionSelection, \
     NaryRandomSolutionSelection, RankingAndCrowdingDistanceSelection, BinaryTournament2Selection
 from jmetal.component.comparator import SolutionAttributeComparator, EqualSolutionsComparator
+from jmetal.component.ranking import DominanceMatrixRanking
 
 
 class BinaryTournamentTestCases(unittest.TestCase):
@@ -278,6 +279,18 @@ class DominanceRankingTestCases(unittest.TestCase):
         self.assertEqual(solution4, list_of_crowding_and_rankings[3])
         self.assertEqual(solution2, list_of_crowding_and_rankings[4])
 
+    def test_should_execute_select_the_same_solutions_with_the_dominance_matrix_ranking(self):
+        solution_list = []
+        for objectives in [[1.0, 0.0], [0.6, 0.6], [0.5, 0.5], [1.1, 0.0], [0.0, 1.0], [1.05, 0.1]]:
+            solution = Solution(2, 2)
+            solution.objectives = objectives
+            solution_list.append(solution)
+
+        expected = self.ranking_and_crowding_selection.execute(solution_list)
+        selection = RankingAndCrowdingDistanceSelection(5, DominanceMatrixRanking())
+
+        self.assertEqual(sorted(map(id, expected)), sorted(map(id, selection.execute(solution_list))))
+
 
 class BinaryTournament2TestCases(unittest.TestCase):
 
@@ -1,4 +1,7 @@
 from math import pi, cos, sin
+from typing import Tuple
+
+import numpy as np
 
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
@@ -52,6 +55,22 @@ class DTLZ1(FloatProblem):
 
         return solution
 
+    def evaluate_batch(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        k = self.number_of_variables - self.number_of_objectives + 1
+        m = self.number_of_objectives
+
+        x_m = X[:, self.number_of_variables - k:] - 0.5
+        g = 100 * (k + (x_m * x_m - np.cos(20.0 * pi * x_m)).sum(axis=1))
+
+        # products[:, j] is x_0 * ... * x_{j-1}, so objective i uses products[:, m - 1 - i]
+        products = np.ones((len(X), m))
+        products[:, 1:] = np.cumprod(X[:, :m - 1], axis=1)
+
+        F = ((1.0 + g) * 0.5)[:, None] * products[:, ::-1]
+        F[:, 1:] *= 1 - X[:, m - 2::-1]
+
+        return F, np.zeros(len(X))
+
     def get_name(self):
         return 'DTLZ1'
 
@@ -93,5 +112,21 @@ class DTLZ2(FloatProblem):
 
         return solution
 
+    def evaluate_batch(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        k = self.number_of_variables - self.number_of_objectives + 1
+        m = self.number_of_objectives
+
+        x_m = X[:, self.number_of_variables - k:] - 0.5
+        g = (x_m * x_m).sum(axis=1)
+
+        # products[:, j] is cos(x_0 pi/2) * ... * cos(x_{j-1} pi/2), so objective i uses products[:, m - 1 - i]
+        products = np.ones((len(X), m))
+        products[:, 1:] = np.cumprod(np.cos(X[:, :m - 1] * 0.5 * pi), axis=1)
+
+        F = (1.0 + g)[:, None] * products[:, ::-1]
+        F[:, 1:] *= np.sin(0.5 * pi * X[:, m - 2::-1])
+
+        return F, np.zeros(len(X))
+
     def get_name(self):
         return 'DTLZ2'
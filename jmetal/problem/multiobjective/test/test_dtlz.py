@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from jmetal.problem.multiobjective.dtlz import DTLZ1, DTLZ2
+
+
+class DTLZ1TestCases(unittest.TestCase):
+
+    def test_should_constructor_create_a_valid_problem_with_default_settings(self) -> None:
+        problem = DTLZ1()
+        self.assertEqual(7, problem.number_of_variables)
+        self.assertEqual(3, problem.number_of_objectives)
+        self.assertEqual(0, problem.number_of_constraints)
+        self.assertEqual(7 * [0.0], problem.lower_bound)
+        self.assertEqual(7 * [1.0], problem.upper_bound)
+
+    def test_should_evaluate_batch_return_the_same_values_as_evaluate(self):
+        for number_of_variables, number_of_objectives in [(7, 3), (7, 2), (9, 5), (14, 10)]:
+            problem = DTLZ1(number_of_variables, number_of_objectives)
+            solutions = [problem.create_solution() for _ in range(10)]
+
+            F, G = problem.evaluate_batch(np.array([solution.variables for solution in solutions]))
+
+            self.assertEqual((10, number_of_objectives), F.shape)
+            for solution, objectives in zip(solutions, F):
+                problem.evaluate(solution)
+                self.assertTrue(np.allclose(solution.objectives, objectives))
+
+    def test_should_get_name_return_the_right_name(self):
+        problem = DTLZ1()
+        self.assertEqual("DTLZ1", problem.get_name())
+
+
+class DTLZ2TestCases(unittest.TestCase):
+
+    def test_should_constructor_create_a_valid_problem_with_default_settings(self) -> None:
+        problem = DTLZ2()
+        self.assertEqual(12, problem.number_of_variables)
+        self.assertEqual(3, problem.number_of_objectives)
+        self.assertEqual(0, problem.number_of_constraints)
+        self.assertEqual(12 * [0.0], problem.lower_bound)
+        self.assertEqual(12 * [1.0], problem.upper_bound)
+
+    def test_should_evaluate_batch_return_the_same_values_as_evaluate(self):
+        for number_of_variables, number_of_objectives in [(12, 3), (12, 2), (14, 5), (19, 10)]:
+            problem = DTLZ2(number_of_variables, number_of_objectives)
+            solutions = [problem.create_solution() for _ in range(10)]
+
+            F, G = problem.evaluate_batch(np.array([solution.variables for solution in solutions]))
+
+            self.assertEqual((10, number_of_objectives), F.shape)
+            for solution, objectives in zip(solutions, F):
+                problem.evaluate(solution)
+                self.assertTrue(np.allclose(solution.objectives, objectives))
+
+    def test_should_get_name_return_the_right_name(self):
+        problem = DTLZ2()
+        self.assertEqual("DTLZ2", problem.get_name())
+
+
+if __name__ == '__main__':
+    unittest.main()
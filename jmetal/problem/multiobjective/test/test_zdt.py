@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from jmetal.problem.multiobjective.zdt import ZDT1, ZDT2, ZDT3, ZDT4, ZDT6
 
 
@@ -216,5 +218,23 @@ class ZDT6TestCases(unittest.TestCase):
         self.assertEqual("ZDT6", problem.get_name())
 
 
+class ZDTBatchEvaluationTestCases(unittest.TestCase):
+
+    def test_should_evaluate_batch_return_the_same_values_as_evaluate(self):
+        for problem_class in [ZDT1, ZDT2, ZDT3, ZDT4, ZDT6]:
+            with self.subTest(problem=problem_class.__name__):
+                problem = problem_class()
+                solutions = [problem.create_solution() for _ in range(10)]
+
+                F, G = problem.evaluate_batch(np.array([solution.variables for solution in solutions]))
+
+                self.assertTrue(problem.supports_batch_evaluation())
+                self.assertEqual((10, 2), F.shape)
+                self.assertTrue(np.all(G == 0.0))
+                for solution, objectives in zip(solutions, F):
+                    problem.evaluate(solution)
+                    self.assertTrue(np.allclose(solution.objectives, objectives))
+
+
 if __name__ == '__main__':
     unittest.main()
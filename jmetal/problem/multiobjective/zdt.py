@@ -1,4 +1,7 @@
 from math import sqrt, pow, sin, pi, cos
+from typing import Tuple
+
+import numpy as np
 
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
@@ -55,6 +58,12 @@ class ZDT1(FloatProblem):
     def __eval_h(self, f: float, g: float) -> float:
         return 1.0 - sqrt(f / g)
 
+    def evaluate_batch(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        g = 1.0 + 9.0 / (self.number_of_variables - 1) * X[:, 1:].sum(axis=1)
+        h = 1.0 - np.sqrt(X[:, 0] / g)
+
+        return np.column_stack((X[:, 0], h * g)), np.zeros(len(X))
+
     def get_name(self):
         return 'ZDT1'
 
@@ -102,6 +111,12 @@ class ZDT2(FloatProblem):
     def __eval_h(self, f: float, g: float) -> float:
         return 1.0 - pow(f / g, 2.0)
 
+    def evaluate_batch(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        g = 1.0 + 9.0 / (self.number_of_variables - 1) * X[:, 1:].sum(axis=1)
+        h = 1.0 - np.power(X[:, 0] / g, 2.0)
+
+        return np.column_stack((X[:, 0], h * g)), np.zeros(len(X))
+
     def get_name(self):
         return 'ZDT2'
 
@@ -148,6 +163,12 @@ class ZDT3(FloatProblem):
     def __eval_h(self, f: float, g: float) -> float:
         return 1.0 - sqrt(f / g) - (f / g) * sin(10.0 * f * pi)
 
+    def evaluate_batch(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        g = 1.0 + 9.0 / (self.number_of_variables - 1) * X[:, 1:].sum(axis=1)
+        h = 1.0 - np.sqrt(X[:, 0] / g) - (X[:, 0] / g) * np.sin(10.0 * X[:, 0] * pi)
+
+        return np.column_stack((X[:, 0], h * g)), np.zeros(len(X))
+
     def get_name(self):
         return 'ZDT3'
 
@@ -198,6 +219,13 @@ class ZDT4(FloatProblem):
     def __eval_h(self, f: float, g: float) -> float:
         return 1.0 - sqrt(f / g)
 
+    def evaluate_batch(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        g = 1.0 + 10.0 * (self.number_of_variables - 1) + \
+            (np.power(X[:, 1:], 2.0) - 10.0 * np.cos(4.0 * pi * X[:, 1:])).sum(axis=1)
+        h = 1.0 - np.sqrt(X[:, 0] / g)
+
+        return np.column_stack((X[:, 0], h * g)), np.zeros(len(X))
+
     def get_name(self):
         return 'ZDT4'
 
@@ -245,5 +273,11 @@ class ZDT6(FloatProblem):
     def __eval_h(self, f: float, g: float) -> float:
         return 1.0 - pow(f / g, 2.0)
 
+    def evaluate_batch(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        g = 1.0 + 9.0 * np.power(X[:, 1:].sum(axis=1) / (self.number_of_variables - 1), 0.25)
+        h = 1.0 - np.power(X[:, 0] / g, 2.0)
+
+        return np.column_stack((X[:, 0], h * g)), np.zeros(len(X))
+
     def get_name(self):
         return 'ZDT6'
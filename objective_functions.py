@@ -1,3 +1,5 @@
+import numpy as np
+
 from jmetal.core.solution import FloatSolution
 from jmetal.core.problem import FloatProblem
 from penalties import l2_equality_penalty as equality_penalty, l2_inequality_penalty as inequality_penalty, modified_inequality_penalty
@@ -8,6 +10,23 @@ def interior_score(radius, density, alpha, beta):
 def surface_score(escape_velocity, surface_temperature, gamma, delta):
     return (escape_velocity**gamma) * (surface_temperature**delta)
 
+def evaluate_cdh_batch(X, f1, f2, radius, escape_velocity, constant_factor_index=-1, slack_index=None):
+    """ Shared body of the evaluate_batch methods of the MultiObjectiveCDH problems. Derives gamma for every row of X,
+    writes it back into the third column as evaluate does, and scores f1 on (alpha, beta) and f2 on (gamma, delta),
+    both followed by the slack variable when `slack_index` is given.
+
+    :return: The (len(X), 2) objective matrix and a zero constraint violation per row.
+    """
+    alpha = X[:, 0]
+    beta = X[:, 1]
+    constant_factor = X[:, constant_factor_index]
+    gamma = (constant_factor * alpha * escape_velocity) / radius
+    X[:, 2] = gamma
+    delta = X[:, 3]
+    slack = [] if slack_index is None else [X[:, slack_index]]
+
+    return np.column_stack((f1([alpha, beta] + slack), f2([gamma, delta] + slack))), np.zeros(len(X))
+
 def get_drs_objective(radius, density, escape_velocity, surface_temperature):
     global interior_score, surface_score
 
@@ -55,6 +74,9 @@ def get_drs_objective(radius, density, escape_velocity, surface_temperature):
             solution.objectives[1] = f2([gamma, delta])
             return solution
 
+        def evaluate_batch(self, X: np.ndarray):
+            return evaluate_cdh_batch(X, f1, f2, radius, escape_velocity)
+
         # def evaluate_constraints(self,solution: FloatSolution) -> None:
         #     constraints = [0.0 for _ in range(self.number_of_constraints)]
 
@@ -132,6 +154,9 @@ def get_crs_objective(radius, density, escape_velocity, surface_temperature):
             solution.objectives[1] = f2([gamma, delta])
             return solution
 
+        def evaluate_batch(self, X: np.ndarray):
+            return evaluate_cdh_batch(X, f1, f2, radius, escape_velocity)
+
         def evaluate_constraints(self,solution: FloatSolution) -> None:
             constraints = [0.0 for _ in range(self.number_of_constraints)]
 
@@ -209,6 +234,9 @@ def get_modified_drs_objective(radius, density, escape_velocity, surface_tempera
             solution.objectives[0] = f1([alpha, beta])
             solution.objectives[1] = f2([gamma, delta])
             return solution
+
+        def evaluate_batch(self, X: np.ndarray):
+            return evaluate_cdh_batch(X, f1, f2, radius, escape_velocity)
     return MultiObjectiveCDH()
 
 def get_modified_crs_objective(radius, density, escape_velocity, surface_temperature):
@@ -262,6 +290,9 @@ def get_modified_crs_objective(radius, density, escape_velocity, surface_tempera
             solution.objectives[1] = f2([gamma, delta,e])
             return solution
 
+        def evaluate_batch(self, X: np.ndarray):
+            return evaluate_cdh_batch(X, f1, f2, radius, escape_velocity, constant_factor_index=-2, slack_index=-1)
+
         def evaluate_constraints(self,solution: FloatSolution) -> None:
             constraints = [0.0 for _ in range(self.number_of_constraints)]
 
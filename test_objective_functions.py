@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from objective_functions import get_crs_objective, get_drs_objective, get_modified_crs_objective, \
+    get_modified_drs_objective
+
+# TRAPPIST-1 h
+RADIUS, DENSITY, ESCAPE_VELOCITY, SURFACE_TEMPERATURE = 0.92, 0.82, 0.83, 260.4 / 288.0
+
+
+class MultiObjectiveCDHTestCases(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+        self.factories = [get_drs_objective, get_crs_objective, get_modified_drs_objective, get_modified_crs_objective]
+
+    def __create_rows(self, problem, alpha: np.ndarray) -> np.ndarray:
+        """ Rows on the alpha + beta = 1 and gamma + delta = 1 planes, with the slack variable (if any) at zero. """
+        X = np.zeros((len(alpha), problem.number_of_variables))
+        constant_factor = np.random.uniform(0, 1, len(alpha))
+        gamma = constant_factor * alpha * ESCAPE_VELOCITY / RADIUS
+        X[:, 0], X[:, 1], X[:, 2], X[:, 3] = alpha, 1 - alpha, gamma, 1 - gamma
+        X[:, 4] = constant_factor
+
+        return X
+
+    def __assert_batch_matches_evaluate(self, problem, X: np.ndarray) -> None:
+        solutions = [problem.create_solution() for _ in range(len(X))]
+        for solution, row in zip(solutions, X):
+            solution.variables = row.tolist()
+
+        F, G = problem.evaluate_batch(X)
+
+        self.assertEqual((len(X), 2), F.shape)
+        self.assertTrue(np.all(G == 0.0))
+        for solution, row, objectives in zip(solutions, X, F):
+            problem.evaluate(solution)
+            self.assertTrue(np.allclose(solution.variables, row))
+            self.assertTrue(np.allclose(solution.objectives, objectives))
+
+    def test_should_evaluate_batch_return_the_same_values_as_evaluate_on_feasible_inputs(self):
+        for factory in self.factories:
+            problem = factory(RADIUS, DENSITY, ESCAPE_VELOCITY, SURFACE_TEMPERATURE)
+            self.__assert_batch_matches_evaluate(problem, self.__create_rows(problem, np.random.uniform(0, 1, 10)))
+
+    def test_should_evaluate_batch_return_the_same_values_as_evaluate_on_infeasible_inputs(self):
+        for factory in self.factories:
+            problem = factory(RADIUS, DENSITY, ESCAPE_VELOCITY, SURFACE_TEMPERATURE)
+            X = np.random.uniform(np.asarray(problem.lower_bound) - 1, np.asarray(problem.upper_bound) + 1,
+                                  (10, problem.number_of_variables))
+            self.__assert_batch_matches_evaluate(problem, X)
+
+    def test_should_evaluate_batch_return_the_same_values_as_evaluate_on_boundary_inputs(self):
+        for factory in self.factories:
+            problem = factory(RADIUS, DENSITY, ESCAPE_VELOCITY, SURFACE_TEMPERATURE)
+            X = np.vstack([self.__create_rows(problem, np.array([0.0, 1.0])),
+                           np.asarray([problem.lower_bound, problem.upper_bound], dtype=float)])
+            self.__assert_batch_matches_evaluate(problem, X)
+
+
+if __name__ == '__main__':
+    unittest.main()